@@ -5,6 +5,7 @@ import pandas as pd
 from modules.excel_operations import read_excel
 from modules.jira_operations import create_jira_issue,get_issue_key,add_issue_links,create_issues_from_excel,get_issues_from_jira,update_issue_overview_sheet,update_jira_issues,has_cf,compute_dates,get_issues_from_jira_to_update,get_issues_from_jira_v2,update_dates_for_blocked_issues,get_jira_project_key,save_jira_project_key,save_credentials,save_jql,get_project_keys,save_jira_project_type,get_blue_print_filepath,get_jira_issue_type_account_key,save_jira_account_type_parent
 from modules.config import EXCEL_FILE_PATH,JIRA_URL
+from modules.jira_v3 import get_client
 
 st.set_page_config(page_title="Create Jira Project", page_icon="🏗️")
 st.title('Create Jira Project :construction_worker:')
@@ -95,7 +96,7 @@ if st.button("Create Jira Project"):
                     # Get the filepath of the respective BlueprintFile
                 filepath = get_blue_print_filepath(st.session_state['jira_project_type'])
                 excel_data_blue_print = read_excel(filepath)
-                create_issues_from_excel(jira, excel_data_blue_print,project_startdate)
+                create_issues_from_excel(get_client(JIRA_URL, st.session_state['api_username'], st.session_state['api_password']), excel_data_blue_print,project_startdate)
 
                 # After succesful creation of the issues in JIRA the file JiraIssues.xls is updated ( Currently this File is not used)
                 excel_data = read_excel(EXCEL_FILE_PATH)
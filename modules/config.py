@@ -33,6 +33,47 @@ JIRA_ATL_ADDONS_PROJECTS_ACCESS = '10003'
 TEMPLATE_WF_BOARD_ID='10029' ## TEMPLATE_BOARD_ID for the workflowscheme
 JIRA_API_URL = "https://hypatos.atlassian.net/rest/api/2"
 JIRA_API_URL_V3 = "https://hypatos.atlassian.net/rest/api/3"
+# max keep-alive connections per host held by one JiraV3 client
+JIRA_HTTP_POOL_SIZE = 20
+# retry/backoff for Jira + Confluence REST calls (seconds)
+HTTP_MAX_RETRIES = 5
+HTTP_BACKOFF_BASE = 0.5
+HTTP_BACKOFF_MAX = 30
+# per-host adaptive concurrency (AIMD) shared by all sessions of this server process
+HTTP_HOST_CONCURRENCY_MIN = 2
+HTTP_HOST_CONCURRENCY_INITIAL = 8
+HTTP_HOST_CONCURRENCY_MAX = 32
+HTTP_LATENCY_SPIKE_FACTOR = 3.0
+# threads in the shared I/O executor used for parallel fetches
+IO_EXECUTOR_WORKERS = 32
+# offset pages requested at once when a listing reports no total (Confluence v1 `_links.next`)
+HTTP_PAGE_WINDOW = 4
+
+# Read-through cache for slow-changing Jira metadata (JiraV3 GETs), partitioned by accountId.
+# backend: "memory" (per process) or "sqlite" (survives restarts, shared by worker processes)
+JIRA_CACHE_BACKEND = "memory"
+JIRA_CACHE_SQLITE_PATH = ".cache/jira_responses.sqlite3"
+JIRA_CACHE_MAX_ENTRIES = 2000
+# (endpoint label, path regex, TTL seconds); GETs matching no pattern are never cached
+JIRA_CACHE_TTLS = [
+    ("project/search", r"^/rest/api/[23]/project/search$", 300),
+    ("project/statuses", r"^/rest/api/[23]/project/[^/]+/statuses$", 3600),
+    ("issuetype", r"^/rest/api/[23]/issuetype(/project)?$", 3600),
+    ("issueLinkType", r"^/rest/api/[23]/issueLinkType$", 3600),
+    ("transitions", r"^/rest/api/[23]/issue/[^/]+/transitions$", 300),
+    ("groups/picker", r"^/rest/api/[23]/groups/picker$", 900),
+    ("user/assignable/search", r"^/rest/api/[23]/user/assignable/search$", 900),
+    ("user/assignable/multiProjectSearch", r"^/rest/api/[23]/user/assignable/multiProjectSearch$", 900),
+]
+# IssueTree snapshots (modules/jira_snapshots.py), shared by all sessions of the process
+ISSUE_TREE_FRESH_SECONDS = 60          # served without any Jira call
+ISSUE_TREE_MAX_STALE_SECONDS = 1800    # served stale while a delta refresh runs in the background
+ISSUE_TREE_REBUILD_SECONDS = 86400     # full traversal again after this long
+ISSUE_TREE_MAX_SNAPSHOTS = 64
+# Local board mirror (modules/jira_mirror.py); boards are opt-in, synced by `python -m modules.jira_mirror sync`
+JIRA_MIRROR_PATH = ".cache/jira_mirror.sqlite3"
+JIRA_MIRROR_BOARDS = []                # project keys served from the mirror, e.g. ['ABC', 'DEF']
+JIRA_MIRROR_MAX_LAG = 900              # seconds since the last sync before pages fall back to Jira
 
 EXCLUDED_BOARD_KEYS = {'CSLP','CSNEW','EM','ZZZ','SIM','BXIMH','DFM','SE','ROP','OKR', 'FIPR', 'REQMAN', 'MBZ', 'T3S', 'SKK', 'PMO', 'TESTC', 'DUR', 'PS', 'PE', 'TESTB', 'KATE', 'MDG', 'TESTA', 'UGI', 'TESTD', 'TOH', 'MON','DBFM','ND2NDSLTNM','CSNEW','FINCS'}
 # Assignable users in HY jira 
@@ -7,6 +7,9 @@ import streamlit as st
 from bs4 import BeautifulSoup
 
 from modules.config import HP_ID_TCUS_SPACE  
+from modules.http_retry import RetryPolicy
+from modules.http_governor import GOVERNOR, fetch_offset_pages
+from modules.http_singleflight import SINGLE_FLIGHT, credential_scope, flight_key
 
 # ---------- Low-level native Confluence client (v1 + v2 mix for ADF) ----------
 
@@ -33,24 +36,43 @@ class ConfluenceAPI:
         self.timeout = timeout
         self.session = requests.Session()
         self.session.auth = self.auth
+        # identical concurrent GETs under this credential share one response (see _send)
+        self._scope = credential_scope(self.base_url, email, api_token)
         self.session.headers.update({"Accept": "application/json"})
+        # 429/5xx handling shared with JiraV3; counters in self.retry.stats
+        self.retry = RetryPolicy()
 
     # ---------- Core helpers ----------
 
-    def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
-        r = self.session.get(url, params=params, timeout=self.timeout)
-        r.raise_for_status()
-        return r.json()
+    def _send(self, method: str, url: str, idempotent: Optional[bool] = None, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+
+        def _once() -> requests.Response:
+            return self.retry.send(
+                lambda: GOVERNOR.call(url, lambda: self.session.request(method, url, **kwargs)),
+                method,
+                idempotent=idempotent,
+            )
 
-    def _post(self, url: str, json_body: Dict[str, Any]):
-        r = self.session.post(url, json=json_body, timeout=self.timeout)
+        if method.upper() == "GET":
+            r = SINGLE_FLIGHT.do(flight_key(self._scope, method, url, kwargs.get("params")), _once)
+        else:
+            r = _once()
         r.raise_for_status()
         return r.json()
 
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None):
+        return self._send("GET", url, params=params)
+
+    def _post(self, url: str, json_body: Dict[str, Any], idempotent: Optional[bool] = None):
+        return self._send("POST", url, idempotent=idempotent, json=json_body)
+
     def _put(self, url: str, json_body: Dict[str, Any]):
-        r = self.session.put(url, json=json_body, timeout=self.timeout)
-        r.raise_for_status()
-        return r.json()
+        return self._send("PUT", url, json=json_body)
+
+    def retry_stats(self) -> Dict[str, float]:
+        """Counters of the retry layer: requests, retries, throttled, wait_seconds."""
+        return self.retry.stats.snapshot()
 
     # ---------- Read page with both body types ----------
 
@@ -142,11 +164,11 @@ class ConfluenceAPI:
         Cloud: convert storage HTML to ADF.
         """
         url = f"{self.v1}/contentbody/convert/atlas_doc_format"
-        return self._post(url, {"value": storage_html, "representation": "storage"})
+        return self._post(url, {"value": storage_html, "representation": "storage"}, idempotent=True)
 
     def convert_adf_to_storage(self, adf_doc: Dict[str, Any]) -> Dict[str, Any]:
         url = f"{self.v1}/contentbody/convert/storage"
-        return self._post(url, {"value": adf_doc, "representation": "atlas_doc_format"})
+        return self._post(url, {"value": adf_doc, "representation": "atlas_doc_format"}, idempotent=True)
 
     # ---------- Spaces & pages listing ----------
 
@@ -156,15 +178,7 @@ class ConfluenceAPI:
 
     def get_all_spaces(self, limit: int = 50) -> Dict[str, Any]:
         url = f"{self.v1}/space"
-        start = 0
-        results: List[Any] = []
-        while True:
-            data = self._get(url, params={"limit": limit, "start": start})
-            results.extend(data.get("results", []))
-            if data.get("_links", {}).get("next"):
-                start += limit
-            else:
-                break
+        results = fetch_offset_pages(lambda start: self._get(url, params={"limit": limit, "start": start}), "results")
         return {"results": results}
 
     def create_space(self, space_key: str, space_name: str):
@@ -173,30 +187,14 @@ class ConfluenceAPI:
 
     def get_all_pages_from_space(self, space_key: str, limit: int = 50) -> List[Dict[str, Any]]:
         url = f"{self.v1}/content"
-        start = 0
-        pages: List[Dict[str, Any]] = []
-        while True:
-            data = self._get(url, params={"spaceKey": space_key, "limit": limit, "start": start, "type": "page"})
-            pages.extend(data.get("results", []))
-            if data.get("_links", {}).get("next"):
-                start += limit
-            else:
-                break
-        return pages
+        return fetch_offset_pages(
+            lambda start: self._get(url, params={"spaceKey": space_key, "limit": limit, "start": start, "type": "page"}),
+            "results",
+        )
 
     def get_child_pages(self, parent_page_id: str) -> List[Dict[str, Any]]:
         url = f"{self.v1}/content/{parent_page_id}/child/page"
-        pages: List[Dict[str, Any]] = []
-        start = 0
-        limit = 50
-        while True:
-            data = self._get(url, params={"limit": limit, "start": start})
-            pages.extend(data.get("results", []))
-            if data.get("_links", {}).get("next"):
-                start += limit
-            else:
-                break
-        return pages
+        return fetch_offset_pages(lambda start: self._get(url, params={"limit": 50, "start": start}), "results")
 
     # ---------- Utilities ----------
 
@@ -0,0 +1,194 @@
+# modules/http_cache.py
+# Read-through response cache for slow-changing Jira metadata (project search, issue types,
+# link types, transitions, groups, assignable users). Entries are partitioned by the caller's
+# accountId, so one user never sees another user's permission-filtered results.
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from modules.config import (
+    JIRA_CACHE_BACKEND,
+    JIRA_CACHE_MAX_ENTRIES,
+    JIRA_CACHE_SQLITE_PATH,
+    JIRA_CACHE_TTLS,
+)
+
+# (status, content-type, body, url)
+Entry = Tuple[int, str, bytes, str]
+
+
+class MemoryCacheBackend:
+    """Per-process LRU dict; entries expire lazily on read."""
+
+    def __init__(self, max_entries: int = JIRA_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, Tuple[float, Entry]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, entry = item
+            if expires < time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.time() + ttl, entry)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete_matching(self, fragment: str) -> int:
+        with self._lock:
+            doomed = [k for k in self._data if fragment in k]
+            for k in doomed:
+                del self._data[k]
+            return len(doomed)
+
+
+class SqliteCacheBackend:
+    """
+    SQLite file backend: survives restarts and is shared by several server processes.
+    One short-lived connection per operation keeps it safe across threads.
+    """
+
+    def __init__(self, path: str = JIRA_CACHE_SQLITE_PATH):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._connect() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, expires REAL NOT NULL,"
+                " status INTEGER NOT NULL, content_type TEXT, body BLOB, url TEXT)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:  # commit / rollback
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT expires, status, content_type, body, url FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] < time.time():
+                db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            return row[1], row[2] or "", bytes(row[3] or b""), row[4] or ""
+
+    def set(self, key: str, entry: Entry, ttl: float) -> None:
+        status, content_type, body, url = entry
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses (key, expires, status, content_type, body, url) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, time.time() + ttl, status, content_type, sqlite3.Binary(body), url),
+            )
+
+    def delete_matching(self, fragment: str) -> int:
+        with self._connect() as db:
+            return db.execute("DELETE FROM responses WHERE instr(key, ?) > 0", (fragment,)).rowcount
+
+
+class ResponseCache:
+    """
+    Read-through cache of successful GET responses.
+    - per-endpoint TTLs from `ttls` = [(label, path regex, seconds)]; unmatched paths are not cached
+    - keys: partition (accountId) | path | sorted params, so permissions are respected
+    - hit/miss counters per endpoint label (snapshot())
+    """
+
+    def __init__(self, backend=None, ttls: List[Tuple[str, str, float]] = JIRA_CACHE_TTLS):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self._rules = [(label, re.compile(pattern), ttl) for label, pattern, ttl in ttls]
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def rule_for(self, url: str) -> Optional[Tuple[str, float]]:
+        """(label, ttl) of the endpoint `url` belongs to, or None when it is not cacheable."""
+        path = urlsplit(url).path
+        for label, rx, ttl in self._rules:
+            if rx.search(path):
+                return label, ttl
+        return None
+
+    @staticmethod
+    def key(partition: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        parts = urlsplit(url)
+        query = json.dumps(params or {}, sort_keys=True, default=str)
+        return f"{partition}|{parts.netloc.lower()}{parts.path}|{query}"
+
+    def _count(self, label: str, outcome: str) -> None:
+        with self._lock:
+            counters = self._stats.setdefault(label, {"hits": 0, "misses": 0})
+            counters[outcome] += 1
+
+    def get(self, partition: str, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[requests.Response]:
+        rule = self.rule_for(url)
+        if rule is None:
+            return None
+        entry = self.backend.get(self.key(partition, url, params))
+        self._count(rule[0], "misses" if entry is None else "hits")
+        return None if entry is None else _to_response(entry)
+
+    def put(self, partition: str, url: str, params: Optional[Dict[str, Any]], resp: requests.Response) -> None:
+        rule = self.rule_for(url)
+        if rule is None or resp.status_code != 200:
+            return
+        entry: Entry = (resp.status_code, resp.headers.get("Content-Type", ""), resp.content, url)
+        self.backend.set(self.key(partition, url, params), entry, rule[1])
+
+    def invalidate(self, path: str) -> int:
+        """Drop every partition's entries whose URL path contains `path` (e.g. after a write)."""
+        return self.backend.delete_matching(path)
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {label: dict(counters) for label, counters in self._stats.items()}
+
+
+def _to_response(entry: Entry) -> requests.Response:
+    status, content_type, body, url = entry
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = body
+    resp.headers = CaseInsensitiveDict({"Content-Type": content_type, "X-Cache": "HIT"})
+    resp.url = url
+    resp.encoding = "utf-8"
+    return resp
+
+
+def _default_backend():
+    if JIRA_CACHE_BACKEND == "sqlite":
+        return SqliteCacheBackend()
+    return MemoryCacheBackend()
+
+
+RESPONSE_CACHE = ResponseCache(_default_backend())
@@ -0,0 +1,267 @@
+# modules/http_governor.py
+# Process-wide I/O executor + adaptive (AIMD) concurrency limit per Atlassian host.
+# All Streamlit sessions share one server process, so every JiraV3 / ConfluenceAPI request
+# takes a slot from the same per-host limiter before it goes on the wire.
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+from modules.config import (
+    HTTP_HOST_CONCURRENCY_MIN,
+    HTTP_HOST_CONCURRENCY_INITIAL,
+    HTTP_HOST_CONCURRENCY_MAX,
+    HTTP_LATENCY_SPIKE_FACTOR,
+    HTTP_PAGE_WINDOW,
+    IO_EXECUTOR_WORKERS,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class HostLimiter:
+    """
+    AIMD concurrency limit for one host.
+    - additive increase: +1 slot after `limit` healthy responses in a row (≈ +1 per round trip window)
+    - multiplicative decrease: halve on 429, shrink by 1/4 when latency exceeds
+      HTTP_LATENCY_SPIKE_FACTOR × the moving average
+    """
+
+    def __init__(
+        self,
+        initial: int = HTTP_HOST_CONCURRENCY_INITIAL,
+        minimum: int = HTTP_HOST_CONCURRENCY_MIN,
+        maximum: int = HTTP_HOST_CONCURRENCY_MAX,
+        spike_factor: float = HTTP_LATENCY_SPIKE_FACTOR,
+    ):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.spike_factor = spike_factor
+        self.limit = float(initial)
+        self.in_flight = 0
+        self.latency_avg: Optional[float] = None
+        self._healthy_streak = 0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """Non-blocking acquire, used by the asyncio client so it never parks a thread."""
+        with self._cond:
+            if self.in_flight >= int(self.limit):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, status: Optional[int], latency: float) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            self._adapt(status, latency)
+            self._cond.notify_all()
+
+    def _adapt(self, status: Optional[int], latency: float) -> None:
+        if status == 429:
+            self.limit = max(self.minimum, self.limit / 2)
+            self._healthy_streak = 0
+            return
+        spiking = self.latency_avg is not None and latency > self.spike_factor * self.latency_avg
+        # EWMA of latency only from non-throttled responses
+        self.latency_avg = latency if self.latency_avg is None else 0.8 * self.latency_avg + 0.2 * latency
+        if spiking or status is None or status >= 500:
+            self.limit = max(self.minimum, self.limit * 0.75)
+            self._healthy_streak = 0
+            return
+        self._healthy_streak += 1
+        if self._healthy_streak >= int(self.limit):
+            self.limit = min(self.maximum, self.limit + 1)
+            self._healthy_streak = 0
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._cond:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "latency_avg": round(self.latency_avg or 0.0, 3),
+            }
+
+
+class ConcurrencyGovernor:
+    """Registry of HostLimiter objects keyed by URL host."""
+
+    def __init__(self):
+        self._hosts: Dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            lim = self._hosts.get(host)
+            if lim is None:
+                lim = HostLimiter()
+                self._hosts[host] = lim
+            return lim
+
+    def call(self, url: str, send: Callable[[], R]) -> R:
+        """Run one HTTP attempt under the host's limit and feed back status + latency."""
+        lim = self.limiter(url)
+        lim.acquire()
+        started = time.monotonic()
+        status: Optional[int] = None
+        try:
+            resp = send()
+            status = getattr(resp, "status_code", None)
+            return resp
+        finally:
+            lim.release(status, time.monotonic() - started)
+
+    async def call_async(self, url: str, send: Callable[[], Awaitable[R]]) -> R:
+        """asyncio twin of call(): waits for a slot with asyncio.sleep instead of blocking the loop."""
+        lim = self.limiter(url)
+        pause = 0.005
+        while not lim.try_acquire():
+            await asyncio.sleep(pause)
+            pause = min(0.1, pause * 2)
+        started = time.monotonic()
+        status: Optional[int] = None
+        try:
+            resp = await send()
+            status = getattr(resp, "status_code", None)
+            return resp
+        finally:
+            lim.release(status, time.monotonic() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            hosts = dict(self._hosts)
+        return {h: lim.snapshot() for h, lim in hosts.items()}
+
+
+GOVERNOR = ConcurrencyGovernor()
+
+
+# -------------------- Shared I/O executor --------------------
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+_worker = threading.local()
+
+
+def io_executor() -> ThreadPoolExecutor:
+    """The process-wide thread pool used for parallel Jira/Confluence fetches."""
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=IO_EXECUTOR_WORKERS,
+                thread_name_prefix="atlassian-io",
+                initializer=_mark_worker,
+            )
+        return _EXECUTOR
+
+
+def _mark_worker() -> None:
+    _worker.active = True
+
+
+def map_in_order(fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """
+    Apply `fn` to every item on the shared executor and return results in input order.
+    Called from inside an executor worker it runs inline, so nested fan-out cannot
+    exhaust the pool and deadlock. Exceptions propagate like a plain loop.
+    """
+    items = list(items)
+    if len(items) <= 1 or getattr(_worker, "active", False):
+        return [fn(it) for it in items]
+    return list(io_executor().map(fn, items))
+
+
+def map_as_arrived(fn: Callable[[T], R], items: Iterable[T]) -> List[R]:
+    """
+    Like map_in_order, but each item is submitted as soon as the (possibly lazy) iterable
+    yields it, so the work overlaps with producing the items (e.g. a paged JQL stream).
+    """
+    if getattr(_worker, "active", False):
+        return [fn(it) for it in items]
+    futures = [io_executor().submit(fn, it) for it in items]
+    return [fut.result() for fut in futures]
+
+
+def batched(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Group a (possibly lazy) iterable into lists of at most `size` items."""
+    batch: List[T] = []
+    for it in items:
+        batch.append(it)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_in_order(fn: Callable[[T], R], items: Iterable[T]) -> Iterator[R]:
+    """Like map_in_order, but yields each result as soon as it (and all before it) are ready."""
+    items = list(items)
+    if len(items) <= 1 or getattr(_worker, "active", False):
+        for it in items:
+            yield fn(it)
+        return
+    futures = [io_executor().submit(fn, it) for it in items]
+    for fut in futures:
+        yield fut.result()
+
+
+
+# -------------------- Offset (startAt) pagination --------------------
+
+def _has_next(page: Dict[str, Any]) -> bool:
+    return bool((page.get("_links") or {}).get("next"))
+
+
+def fetch_offset_pages(
+    fetch: Callable[[int], Dict[str, Any]],
+    items_key: str,
+    limit: Optional[int] = None,
+    window: int = HTTP_PAGE_WINDOW,
+) -> List[Any]:
+    """
+    Collect a startAt/start-paged listing; `fetch(offset)` returns one page.
+    The first page is fetched alone: its length is the page size the server actually serves.
+    - With a `total` (Jira), all remaining offsets are fetched concurrently.
+    - Without one (Confluence v1, `_links.next` only), `window` pages are fetched at a time
+      until a page is empty or has no next link.
+    Items keep server order; `limit` caps the result.
+    """
+    first = fetch(0)
+    out: List[Any] = list(first.get(items_key) or [])
+    step = len(out)
+    total = first.get("total")
+    if limit is not None and total is not None:
+        total = min(total, limit)
+
+    if not step or (total is not None and step >= total) or (total is None and not _has_next(first)):
+        return out[:limit] if limit is not None else out
+
+    if total is not None:
+        for page in map_in_order(fetch, range(step, total, step)):
+            out.extend(page.get(items_key) or [])
+        return out[:limit] if limit is not None else out
+
+    start = step
+    while limit is None or len(out) < limit:
+        for page in map_in_order(fetch, [start + i * step for i in range(window)]):
+            items = page.get(items_key) or []
+            out.extend(items)
+            if not items or not _has_next(page):
+                return out[:limit] if limit is not None else out
+        start += window * step
+    return out[:limit]
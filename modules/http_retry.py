@@ -0,0 +1,194 @@
+# modules/http_retry.py
+# Shared retry/backoff layer for the Atlassian REST clients (JiraV3, ConfluenceAPI)
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import requests
+
+from modules.config import HTTP_MAX_RETRIES, HTTP_BACKOFF_BASE, HTTP_BACKOFF_MAX
+
+# Methods that can be replayed without side effects
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+# 429 = throttled; 5xx = transient server / gateway errors
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class RetryStats:
+    """
+    Thread-safe counters for one client.
+    - requests: requests sent (including retries)
+    - retries:  requests that were re-sent
+    - throttled: 429 responses received
+    - wait_seconds: total time slept before retries
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.retries = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def record(self, requests_: int = 0, retries: int = 0, throttled: int = 0, wait_seconds: float = 0.0) -> None:
+        with self._lock:
+            self.requests += requests_
+            self.retries += retries
+            self.throttled += throttled
+            self.wait_seconds += wait_seconds
+
+    def snapshot(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "wait_seconds": round(self.wait_seconds, 3),
+            }
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """X-RateLimit-Reset is an ISO-8601 timestamp on Atlassian Cloud."""
+    if not value:
+        return None
+    try:
+        when = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except ValueError:
+        return None
+
+
+def server_delay(resp: requests.Response) -> Optional[float]:
+    """
+    Delay requested by the server, if any:
+      Retry-After / Beta-Retry-After, else X-RateLimit-Reset when X-RateLimit-Remaining is 0.
+    """
+    headers = resp.headers
+    delay = _parse_retry_after(headers.get("Retry-After") or headers.get("Beta-Retry-After"))
+    if delay is not None:
+        return delay
+    if headers.get("X-RateLimit-Remaining") == "0" or resp.status_code == 429:
+        return _parse_reset(headers.get("X-RateLimit-Reset"))
+    return None
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff that honours Atlassian rate-limit headers.
+    Non-idempotent calls (POST) are only retried on 429, where Jira has rejected the
+    request before processing it, or when the caller marks them idempotent (e.g. POST search).
+    """
+
+    def __init__(
+        self,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_base: float = HTTP_BACKOFF_BASE,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sleep = sleep
+        self.stats = RetryStats()
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: uniform(0, min(max, base * 2**attempt))."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def should_retry(self, method: str, status: Optional[int], idempotent: Optional[bool]) -> bool:
+        replayable = idempotent if idempotent is not None else method.upper() in IDEMPOTENT_METHODS
+        if status is None:  # connection error / timeout
+            return replayable
+        if status == 429:
+            return True
+        return replayable and status in RETRYABLE_STATUS
+
+    def _delay_before_retry(self, attempt: int, method: str, idempotent: Optional[bool], resp=None) -> Optional[float]:
+        """
+        Seconds to wait before the next attempt, or None when the result should be returned as-is.
+        `resp` is None for a connection error / timeout; otherwise anything with
+        .status_code and .headers (requests.Response or the async client's reply).
+        """
+        status = None if resp is None else resp.status_code
+        if status == 429:
+            self.stats.record(throttled=1)
+        if attempt >= self.max_retries or not self.should_retry(method, status, idempotent):
+            return None
+        if resp is None:
+            delay = self.backoff(attempt)
+        else:
+            hinted = server_delay(resp)
+            delay = min(self.backoff_max, hinted) if hinted is not None else self.backoff(attempt)
+            # small jitter on top of server hints so parallel callers don't wake in lockstep
+            delay += random.uniform(0, self.backoff_base)
+        self.stats.record(retries=1, wait_seconds=delay)
+        return delay
+
+    def send(self, send: Callable[[], requests.Response], method: str, idempotent: Optional[bool] = None) -> requests.Response:
+        """
+        Call `send()` until it returns a non-retryable response or retries are exhausted.
+        The last response is returned (callers still raise_for_status); the last
+        connection error is re-raised.
+        """
+        attempt = 0
+        while True:
+            self.stats.record(requests_=1)
+            try:
+                resp = send()
+            except (requests.ConnectionError, requests.Timeout):
+                delay = self._delay_before_retry(attempt, method, idempotent)
+                if delay is None:
+                    raise
+            else:
+                delay = self._delay_before_retry(attempt, method, idempotent, resp)
+                if delay is None:
+                    return resp
+            self.sleep(delay)
+            attempt += 1
+
+    async def send_async(self, send: Callable[[], Awaitable[Any]], method: str, idempotent: Optional[bool] = None,
+                         transient: Tuple[type, ...] = (OSError, asyncio.TimeoutError)) -> Any:
+        """
+        asyncio twin of send(): `send` is a coroutine factory, waits use asyncio.sleep.
+        `transient` lists the exception types treated like a dropped connection.
+        """
+        attempt = 0
+        while True:
+            self.stats.record(requests_=1)
+            try:
+                resp = await send()
+            except transient:
+                delay = self._delay_before_retry(attempt, method, idempotent)
+                if delay is None:
+                    raise
+            else:
+                delay = self._delay_before_retry(attempt, method, idempotent, resp)
+                if delay is None:
+                    return resp
+            await asyncio.sleep(delay)
+            attempt += 1
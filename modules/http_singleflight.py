@@ -0,0 +1,114 @@
+# modules/http_singleflight.py
+# Single-flight coalescing of identical in-flight GETs (JiraV3, AsyncJiraV3, ConfluenceAPI).
+# When several Streamlit sessions ask for the same resource at the same moment, only the
+# first caller goes on the wire; the others wait for and share its response.
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+R = TypeVar("R")
+
+
+def credential_scope(*parts: str) -> str:
+    """Hashed identity of a credential (e.g. the Authorization header), safe to use in keys."""
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def flight_key(scope: str, method: str, url: str, params: Optional[Dict[str, Any]] = None) -> Tuple[str, str, str, str]:
+    """Key of one request: credential scope, method, URL and order-independent params."""
+    return scope, method.upper(), url, json.dumps(params or {}, sort_keys=True, default=str)
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Run `fn` once per key among concurrent callers.
+    Only in-flight calls are shared: once the leader finishes, the next caller starts a new call.
+    Followers get the leader's result object (or its exception), so share immutable-ish values
+    such as a response whose .json() is parsed per caller.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, "asyncio.Future"] = {}
+        self.calls = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[[], R]) -> R:
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fn()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable[R]]) -> R:
+        """asyncio twin of do(); callers of one key must share an event loop."""
+        with self._lock:
+            fut = self._async_flights.get(key)
+            leader = fut is None
+            if leader:
+                fut = asyncio.get_running_loop().create_future()
+                self._async_flights[key] = fut
+                self.calls += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return await asyncio.shield(fut)
+
+        try:
+            result = await fn()
+            fut.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            fut.cancel()
+            raise
+        except BaseException as e:
+            fut.set_exception(e)
+            fut.exception()  # mark retrieved when nobody was waiting
+            raise
+        finally:
+            with self._lock:
+                self._async_flights.pop(key, None)
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return {"calls": self.calls, "shared": self.shared, "in_flight": len(self._flights) + len(self._async_flights)}
+
+
+SINGLE_FLIGHT = SingleFlight()
@@ -4,31 +4,17 @@ import json
 from typing import Any, Dict, List, Optional, Tuple
 
 import requests
-from requests.auth import HTTPBasicAuth
 import streamlit as st
-from jira import JIRA
 
+from modules.http_cache import RESPONSE_CACHE
+from modules.jira_v3 import JiraV3, get_client
 from modules.config import (
     JIRA_URL,
-    JIRA_API_URL,
-    JIRA_API_URL_V3,
     TEMPLATE_WF_BOARD_ID,
     DEFAULT_BOARD_GROUPS,
     JIRA_ADMIN_ROLE_ID,
 )
 
-# -----------------------------
-# Constants
-# -----------------------------
-
-HEADERS: Dict[str, str] = {
-    "Accept": "application/json",
-    "Content-Type": "application/json",
-}
-
-DEFAULT_TIMEOUT = 30
-
-
 # -----------------------------
 # Custom Exceptions
 # -----------------------------
@@ -71,16 +57,10 @@ def _get_creds() -> Tuple[str, str]:
     return email, token
 
 
-def _get_auth() -> HTTPBasicAuth:
-    """Get HTTPBasicAuth object with current credentials"""
+def _get_v3_client() -> JiraV3:
+    """Process-wide pooled REST v3 client (retries, metadata cache) for the current user"""
     email, token = _get_creds()
-    return HTTPBasicAuth(email, token)
-
-
-def _get_jira_client() -> JIRA:
-    """Get authenticated JIRA client"""
-    email, token = _get_creds()
-    return JIRA(server=JIRA_URL, basic_auth=(email, token))
+    return get_client(JIRA_URL, email, token)
 
 
 def _safe_json(resp: requests.Response) -> Optional[dict]:
@@ -143,14 +123,8 @@ def jira_preflight() -> Dict[str, Any]:
     Raises:
         JiraAuthenticationError: If authentication fails
     """
-    url = f"{JIRA_API_URL_V3}/myself"
     try:
-        resp = requests.get(
-            url,
-            headers={"Accept": "application/json"},
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        resp = _get_v3_client()._request("GET", "/rest/api/3/myself")
         
         if resp.status_code == 401:
             raise JiraAuthenticationError(
@@ -186,18 +160,9 @@ def check_project_name_exists(project_name: str) -> None:
         ValueError: If project name already exists
         JiraAPIError: If API request fails
     """
-    url = f"{JIRA_API_URL_V3}/project/search"
-
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
-        data = _handle_response(response, error_message="Failed to search projects")
-        
-        projects = data.get("values", [])
+        # all pages (the old single request only saw the first 50 projects); cached per user
+        projects = _get_v3_client().project_search_all()
         for project in projects:
             if (project.get("name") or "").lower() == project_name.lower():
                 raise ValueError(
@@ -226,15 +191,8 @@ def get_id_for_jira_board(jira_board_key: str) -> str:
     Raises:
         JiraAPIError: If request fails or ID not found
     """
-    url = f"{JIRA_API_URL}/project/{jira_board_key}"
-
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().get_project(jira_board_key)
         data = _handle_response(response, error_message=f"Failed to get project ID for {jira_board_key}")
         
         project_id = data.get("id")
@@ -253,17 +211,8 @@ def get_id_for_jira_board(jira_board_key: str) -> str:
 
 def get_project_workflow_scheme() -> None:
     """Debug helper to view workflow scheme of template project"""
-    url = f"{JIRA_API_URL}/workflowscheme/project"
-    params = {"projectId": TEMPLATE_WF_BOARD_ID}
-
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            params=params,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().get_project_workflow_scheme(TEMPLATE_WF_BOARD_ID)
         data = _safe_json(response)
         st.write(json.dumps(data if data is not None else {"raw": response.text[:2000]}, sort_keys=True, indent=4))
     except Exception as e:
@@ -280,17 +229,8 @@ def assign_project_workflow_scheme(jira_board_id: str) -> None:
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL_V3}/workflowscheme/project"
-    payload = {"projectId": jira_board_id, "workflowSchemeId": "10145"}
-
     try:
-        response = requests.put(
-            url,
-            json=payload,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().assign_project_scheme("workflowscheme", jira_board_id, "10145")
         _handle_response(
             response, 
             success_codes=[200, 204],
@@ -312,20 +252,8 @@ def assign_issue_type_scheme(jira_board_id: str) -> None:
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL_V3}/issuetypescheme/project"
-    payload = {
-        "issueTypeSchemeId": "10466",
-        "projectId": jira_board_id,
-    }
-
     try:
-        response = requests.put(
-            url,
-            json=payload,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().assign_project_scheme("issuetypescheme", jira_board_id, "10466")
         _handle_response(
             response,
             success_codes=[200, 204],
@@ -347,20 +275,8 @@ def assign_issue_type_screen_scheme(jira_board_id: str) -> None:
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL_V3}/issuetypescreenscheme/project"
-    payload = {
-        "issueTypeScreenSchemeId": "10137",
-        "projectId": jira_board_id,
-    }
-
     try:
-        response = requests.put(
-            url,
-            json=payload,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().assign_project_scheme("issuetypescreenscheme", jira_board_id, "10137")
         _handle_response(
             response,
             success_codes=[200, 204],
@@ -382,17 +298,8 @@ def assign_permission_scheme(jira_board_id: str) -> None:
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL_V3}/project/{jira_board_id}/permissionscheme"
-    payload = {"id": "10087"}
-
     try:
-        response = requests.put(
-            url,
-            json=payload,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().assign_permission_scheme(jira_board_id, "10087")
         _handle_response(
             response,
             success_codes=[200, 204],
@@ -420,18 +327,9 @@ def assign_group_to_role(project_id_or_key: str, group_name: str, role: str) ->
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL}/project/{project_id_or_key}/role/{role}"
-    data = {"group": [group_name]}
-
     try:
         st.write(f"Assigning group '{group_name}' to role {role}")
-        response = requests.post(
-            url,
-            headers=HEADERS,
-            auth=_get_auth(),
-            data=json.dumps(data),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().add_project_role_actors(project_id_or_key, role, groups=[group_name])
         _handle_response(
             response,
             success_codes=[200, 201],
@@ -456,18 +354,9 @@ def assign_groups_to_role(project_id_or_key: str, group_names: List[str], role:
     Raises:
         JiraAPIError: If assignment fails
     """
-    url = f"{JIRA_API_URL}/project/{project_id_or_key}/role/{role}"
-    data = {"group": group_names}
-
     try:
         st.write(f"Assigning groups {group_names} to role {role}")
-        response = requests.post(
-            url,
-            headers=HEADERS,
-            auth=_get_auth(),
-            data=json.dumps(data),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().add_project_role_actors(project_id_or_key, role, groups=group_names)
         _handle_response(
             response,
             success_codes=[200, 201],
@@ -512,17 +401,8 @@ def assign_users_to_role_of_jira_board(
 
     # Assign internal users to default roles
     for role in default_jira_roles:
-        url = f"{JIRA_API_URL}/project/{project_id_or_key}/role/{role}"
-        data = {"user": user_list}
-
         try:
-            response = requests.post(
-                url,
-                headers=HEADERS,
-                auth=_get_auth(),
-                data=json.dumps(data),
-                timeout=DEFAULT_TIMEOUT,
-            )
+            response = _get_v3_client().add_project_role_actors(project_id_or_key, str(role), users=user_list)
             _handle_response(
                 response,
                 success_codes=[200, 201],
@@ -548,20 +428,8 @@ def get_all_groups(group_alias: Optional[str] = None) -> List[str]:
     Raises:
         JiraAPIError: If request fails
     """
-    url = f"{JIRA_API_URL}/groups/picker"
-    
     try:
-        params = {"maxResults": 250}
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            params=params,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
-        data = _handle_response(response, error_message="Failed to fetch groups")
-
-        groups = data.get("groups", [])
+        groups = _get_v3_client().find_groups(max_results=250)
         group_names = [g.get("name") for g in groups if g.get("name")]
 
         if group_alias == "partner":
@@ -587,20 +455,9 @@ def get_assignable_users(project_keys: str) -> List[dict]:
     Raises:
         JiraAPIError: If request fails
     """
-    url = f"{JIRA_API_URL}/user/assignable/multiProjectSearch"
-    params = {"projectKeys": project_keys, "maxResults": 150}
-
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            params=params,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
-        data = _handle_response(response, error_message="Failed to retrieve assignable users")
-        return data if isinstance(data, list) else []
-        
+        return _get_v3_client().find_assignable_users_multi(project_keys, max_results=150)
+
     except Exception as e:
         st.error(f"Failed to retrieve users: {e}")
         raise JiraAPIError(f"Failed to fetch assignable users: {str(e)}")
@@ -617,15 +474,9 @@ def get_all_role_ids() -> List[dict]:
         JiraAPIError: If request fails
     """
     project_id_or_key = "FNK"
-    url = f"{JIRA_API_URL}/project/{project_id_or_key}/role"
 
     try:
-        response = requests.get(
-            url,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().get_project_roles(project_id_or_key)
         roles = _handle_response(response, error_message="Failed to fetch roles")
         st.write(roles)
         return roles if isinstance(roles, list) else []
@@ -671,7 +522,6 @@ def create_jira_board(
         st.error(f"❌ Authentication failed: {str(e)}")
         raise
 
-    url = f"{JIRA_API_URL}/project"
     payload = {
         "key": key,
         "name": name,
@@ -683,13 +533,7 @@ def create_jira_board(
     try:
         st.write(f"Creating project with key: {key}, name: {name}")
         
-        response = requests.post(
-            url,
-            json=payload,
-            headers=HEADERS,
-            auth=_get_auth(),
-            timeout=DEFAULT_TIMEOUT,
-        )
+        response = _get_v3_client().create_project(payload)
         
         # Check for success
         if response.status_code != 201:
@@ -720,6 +564,9 @@ def create_jira_board(
                 f"Project creation response missing 'key' or 'id'. Response: {data}"
             )
         
+        # the new board must show up in (cached) project listings right away
+        RESPONSE_CACHE.invalidate("/project/search|")
+
         project_url = f"https://hypatos.atlassian.net/jira/core/projects/{project_key}/board"
         st.success(f"✅ Project created successfully: {project_key} (ID: {project_id})")
         st.write(f"Project URL: {project_url}")
@@ -9,6 +9,8 @@ from typing import Dict, List, Optional, Tuple, Union
 
 import streamlit as st
 from .jira_v3 import JiraV3  # expects (base_url, email, api_token)
+from .jira_hierarchy import IssueTree
+from .http_governor import map_in_order
 
 
 # ------------------------------ Utilities ------------------------------
@@ -81,6 +83,61 @@ def compute_new_due_date(
     return current_date + timedelta(days=day_delta)
 
 
+def _clone_fields(
+    client: JiraV3,
+    src_issue: Dict,
+    target_project: str,
+    parent_key: Optional[str],
+    day_delta: int,
+    project_assignee: Optional[str],
+) -> Dict:
+    """
+    Build the create payload for one cloned issue (dates shifted by day_delta).
+    """
+    due_date_date = compute_new_due_date(client, day_delta, src_issue, "duedate")
+    start_date_date = compute_new_due_date(client, day_delta, src_issue, "customfield_10015")
+    due_date_str = due_date_date.strftime("%Y-%m-%d") if due_date_date else None
+    start_date_str = start_date_date.strftime("%Y-%m-%d") if start_date_date else None
+
+    issuetype_obj = _read_field(src_issue, "issuetype") or {}
+    fields = {
+        "project": {"key": target_project},
+        "summary": _read_field(src_issue, "summary"),
+        "description": _read_field(src_issue, "description"),
+        "issuetype": {"name": issuetype_obj.get("name", "Task")},
+    }
+    if due_date_str:
+        fields["duedate"] = due_date_str
+    if start_date_str:
+        fields["customfield_10015"] = start_date_str
+    if parent_key:
+        fields["parent"] = {"key": parent_key}
+    if project_assignee:
+        fields["assignee"] = {"accountId": project_assignee}  # accountId only
+    return fields
+
+
+def _create_issues_with_assignee_fallback(client: JiraV3, fields_list: List[Dict]) -> List[Dict]:
+    """
+    Bulk-create; items rejected only because of the assignee are re-created without it
+    (the old flow created first and assigned afterwards, tolerating assignment failures).
+    """
+    results = client.create_issues_bulk(fields_list)
+    retry_idx = [
+        i for i, res in enumerate(results)
+        if "error" in res
+        and "assignee" in fields_list[i]
+        and "assignee" in ((res["error"].get("elementErrors") or {}).get("errors") or {})
+    ]
+    if retry_idx:
+        stripped = [{k: v for k, v in fields_list[i].items() if k != "assignee"} for i in retry_idx]
+        for i, res in zip(retry_idx, client.create_issues_bulk(stripped)):
+            results[i] = res
+            if "key" in res:
+                st.warning(f"Assignee update failed for {res['key']}: assignee not accepted by target project.")
+    return results
+
+
 def clone_issue_recursive_first_pass(
     client: JiraV3,
     issue: Union[str, Dict, object],
@@ -89,9 +146,14 @@ def clone_issue_recursive_first_pass(
     cloned_issues: Optional[OrderedDict] = None,
     day_delta: int = 0,
     project_assignee: Optional[str] = None,  # accountId in GDPR strict mode
+    tree: Optional[IssueTree] = None,
 ) -> Dict[str, str]:
     """
     Clone `issue` (and its subtasks) into `target_project` without links; store map {old_key: {"key": new_key}}.
+    The tree is cloned level by level: each level is one POST /issue/bulk (50 per call) with the
+    assignee set inline, and the returned keys become the parents of the next level.
+    With an IssueTree of the source (see jira_operations.get_issue_tree), source fields and
+    children are read from it instead of Jira.
     """
     if cloned_issues is None:
         cloned_issues = OrderedDict()
@@ -106,116 +168,89 @@ def clone_issue_recursive_first_pass(
         return cloned_issues[src_key]
 
     # Fetch source if needed
-    if isinstance(issue, dict):
+    needed = ["summary", "description", "issuetype", "duedate", "customfield_10015", "created"]
+    if tree is not None and src_key in tree:
+        src_issue = tree.nodes[src_key].as_issue()
+    elif isinstance(issue, dict) and set(needed).issubset(set(issue.get("fields", {}).keys())):
         src_issue = issue
-        needed = {"summary", "description", "issuetype", "duedate", "customfield_10015", "created"}
-        if not needed.issubset(set(src_issue.get("fields", {}).keys())):
-            src_issue = client.get_issue(src_key, fields=list(needed))
     else:
-        src_issue = client.get_issue(
-            src_key,
-            fields=["summary", "description", "issuetype", "duedate", "customfield_10015", "created"],
-        )
-
-    # Dates
-    due_date_date = compute_new_due_date(client, day_delta, src_issue, "duedate")
-    start_date_date = compute_new_due_date(client, day_delta, src_issue, "customfield_10015")
-    due_date_str = due_date_date.strftime("%Y-%m-%d") if due_date_date else None
-    start_date_str = start_date_date.strftime("%Y-%m-%d") if start_date_date else None
-
-    # Build new fields
-    issuetype_obj = _read_field(src_issue, "issuetype") or {}
-    fields = {
-        "project": {"key": target_project},
-        "summary": _read_field(src_issue, "summary"),
-        "description": _read_field(src_issue, "description"),
-        "issuetype": {"name": issuetype_obj.get("name", "Task")},
-    }
-    if due_date_str:
-        fields["duedate"] = due_date_str
-    if start_date_str:
-        fields["customfield_10015"] = start_date_str
-
-    if parent:
-        parent_key = _extract_issue_key(parent)
-        if parent_key:
-            fields["parent"] = {"key": parent_key}
-
-    # Create the issue
-    try:
-        created = client.create_issue(fields)
-        new_key = created["key"]
-        if project_assignee:
-            try:
-                client.assign_issue(new_key, project_assignee)  # accountId only
-            except Exception as e:
-                st.warning(f"Assignee update failed for {new_key}: {e}")
-
-        st.write(f"Created new issue: {new_key}")
-    except Exception as e:
-        st.error(f"Error creating issue: {str(e)}")
-        return {}
-
-    # record mapping
-    cloned_issues[src_key] = {"key": new_key}
-
-    # Clone children (ordered)
-    for child in get_all_subtasks(client, src_key):
-        clone_issue_recursive_first_pass(
-            client,
-            child,
-            target_project,
-            parent={"key": new_key},
-            cloned_issues=cloned_issues,
-            day_delta=day_delta,
-            project_assignee=project_assignee,
-        )
-
-    return {"key": new_key}
-
-
-def add_issue_links(client: JiraV3, cloned_issues: Dict[str, Dict[str, str]]) -> None:
+        src_issue = client.get_issue(src_key, fields=needed)
+        src_issue.setdefault("key", src_key)
+
+    # (source issue json, new parent key) for the level being created
+    level: List[Tuple[Dict, Optional[str]]] = [(src_issue, _extract_issue_key(parent) if parent else None)]
+
+    while level:
+        fields_list = [
+            _clone_fields(client, src, target_project, parent_key, day_delta, project_assignee)
+            for src, parent_key in level
+        ]
+        try:
+            results = _create_issues_with_assignee_fallback(client, fields_list)
+        except Exception as e:
+            st.error(f"Error creating issue: {str(e)}")
+            break
+
+        created_src_keys: List[str] = []
+        for (src, _), res in zip(level, results):
+            old_key = src.get("key")
+            if "error" in res:
+                st.error(f"Error creating issue (clone of {old_key}): {res['error'].get('elementErrors')}")
+                continue
+            cloned_issues[old_key] = {"key": res["key"]}
+            created_src_keys.append(old_key)
+            st.write(f"Created new issue: {res['key']}")
+
+        # Children of everything created on this level (ordered by created ASC per parent)
+        if tree is not None:
+            children_per_parent = [[tree.nodes[c].as_issue() for c in tree.children_of(k)] for k in created_src_keys]
+        else:
+            children_per_parent = map_in_order(lambda k: get_all_subtasks(client, k), created_src_keys)
+        level = [
+            (child, cloned_issues[parent_src]["key"])
+            for parent_src, children in zip(created_src_keys, children_per_parent)
+            for child in children
+            if child.get("key") not in cloned_issues
+        ]
+
+    return cloned_issues.get(src_key, {})
+
+
+def add_issue_links(client: JiraV3, cloned_issues: Dict[str, Dict[str, str]],
+                    tree: Optional[IssueTree] = None) -> None:
     """
     Recreate issuelinks between cloned issues based on source links.
+    With the source `tree`, links come from its link index (no reads); source issues missing
+    from the tree have their links read with GET /issue/{key}?fields=issuelinks.
     """
-    created_links: set[Tuple[str, str, str]] = set()  # (from_key, type_name, to_key)
-
-    for original_key, cloned in cloned_issues.items():
-        cloned_key = cloned.get("key")
-        if not cloned_key:
+    edges: Dict[Tuple[str, str, str], None] = {}  # (outward key, type name, inward key), ordered
+    if tree is not None:
+        for edge in tree.link_edges():
+            edges.setdefault(edge, None)
+    for original_key in cloned_issues:
+        if tree is not None and original_key in tree:
             continue
-
         for link in client.get_issue_links(original_key):
             link_type = (link.get("type") or {}).get("name")
             if not link_type:
                 continue
+            if link.get("outwardIssue"):
+                edges.setdefault((original_key, link_type, link["outwardIssue"].get("key")), None)
+            if link.get("inwardIssue"):
+                edges.setdefault((link["inwardIssue"].get("key"), link_type, original_key), None)
 
-            outward = link.get("outwardIssue")
-            inward = link.get("inwardIssue")
-
-            # original -> outward
-            if outward and outward.get("key") in cloned_issues:
-                cloned_out = cloned_issues[outward["key"]]["key"]
-                ident = (cloned_key, link_type, cloned_out)
-                if ident not in created_links:
-                    try:
-                        client.create_issue_link(link_type, inward_key=cloned_key, outward_key=cloned_out)
-                        st.write(f"Created link '{link_type}' between {cloned_key} → {cloned_out}")
-                        created_links.add(ident)
-                    except Exception as e:
-                        st.error(f"Error linking {cloned_key} → {cloned_out}: {e}")
-
-            # inward -> original
-            if inward and inward.get("key") in cloned_issues:
-                cloned_in = cloned_issues[inward["key"]]["key"]
-                ident = (cloned_in, link_type, cloned_key)
-                if ident not in created_links:
-                    try:
-                        client.create_issue_link(link_type, inward_key=cloned_in, outward_key=cloned_key)
-                        st.write(f"Created link '{link_type}' between {cloned_in} → {cloned_key}")
-                        created_links.add(ident)
-                    except Exception as e:
-                        st.error(f"Error linking {cloned_in} → {cloned_key}: {e}")
+    for source, link_type, target in edges:
+        if not link_type or source not in cloned_issues or target not in cloned_issues:
+            continue
+        cloned_from = cloned_issues[source].get("key")
+        cloned_to = cloned_issues[target].get("key")
+        if not (cloned_from and cloned_to):
+            continue
+        try:
+            client.create_issue_link(link_type, inward_key=cloned_from, outward_key=cloned_to)
+            st.write(f"Created link '{link_type}' between {cloned_from} → {cloned_to}")
+        except Exception as e:
+            st.error(f"Error linking {cloned_from} → {cloned_to}: {e}")
 
 
 def get_linked_issues(client: JiraV3, issue: Union[str, Dict, object]) -> List[Tuple[str, Dict]]:
@@ -0,0 +1,506 @@
+# modules/jira_hierarchy.py
+# Fetching the descendants of one issue (Project → Epic → Task → Sub-task) with the cheapest plan:
+#   walk: breadth-first, one chunked `parent in (...)` search per level
+#   scan: one project-wide search that downloads the `parent` field; the tree is rebuilt locally
+# plan_tree_fetch() picks between them from /search/approximate-count.
+# build_issue_tree() fetches one Project issue's hierarchy once, with the page fields inline,
+# into an IssueTree that the report, time report, delete and clone pages all read from.
+# fetch_pruned_tree() / select_keys() serve narrower questions (timeline dates, tasks under
+# epics) from per-level LevelRule predicates, without downloading the branches they prune.
+# iter_filtered_descendants() pushes a report filter (JQL) into the per-level searches and
+# returns the matches in the depth-first order of the full report.
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from modules.http_governor import map_in_order
+from modules.jira_v3 import JiraV3, _created_order
+
+# issues per search page (search/jql maxResults)
+SEARCH_PAGE_SIZE = 100
+
+# Fields stored inline on every IssueTree node (union of what the pages read)
+TREE_FIELDS = [
+    "summary",
+    "issuetype",
+    "status",
+    "parent",
+    "subtasks",
+    "issuelinks",
+    "duedate",
+    "customfield_10015",   # Start Date
+    "assignee",
+    "customfield_10127",   # Ext.Owner
+    "created",
+    "description",         # cloned as-is
+]
+
+
+def project_of(issue_key: str) -> str:
+    return issue_key.rsplit("-", 1)[0]
+
+
+def _may_have_children(issue: Dict[str, Any]) -> bool:
+    """
+    Whether a search for children of `issue` can return anything. Sub-tasks are leaves and
+    standard issues only hold sub-tasks (already listed in their `subtasks` field), so only
+    Epics and higher hierarchy levels need a `parent in (...)` search.
+    """
+    itype = (issue.get("fields") or {}).get("issuetype") or {}
+    level = itype.get("hierarchyLevel")
+    if level is not None:
+        return level >= 1
+    return not itype.get("subtask") and (itype.get("name") or "").lower() == "epic"
+
+
+def plan_tree_fetch(client: JiraV3, root_key: str, max_depth: int = 3) -> Dict[str, Any]:
+    """
+    Choose walk or scan for the descendants of `root_key` (2 approximate-count requests).
+    The tree size is estimated as project issues / top-level issues of the project:
+      walk ≈ (max_depth - 1) searched levels + tree pages
+      scan ≈ project pages
+    Returns {"strategy", "expected_requests", "project", "project_issues", "estimated_tree", "reason"}.
+    Falls back to the walk when approximate-count is unavailable.
+    """
+    project = project_of(root_key)
+    plan: Dict[str, Any] = {"strategy": "walk", "expected_requests": None, "project": project,
+                            "project_issues": None, "estimated_tree": None, "reason": ""}
+    try:
+        n_project, n_roots = map_in_order(client.approximate_count, [
+            f'project = "{project}"',
+            f'project = "{project}" AND parent is EMPTY',
+        ])
+    except Exception as e:
+        plan["reason"] = f"approximate-count unavailable ({e}); walking"
+        return plan
+
+    estimated_tree = math.ceil(n_project / max(1, n_roots))
+    walk = (max_depth - 1) + math.ceil(estimated_tree / SEARCH_PAGE_SIZE)
+    scan = max(1, math.ceil(n_project / SEARCH_PAGE_SIZE))
+    strategy = "scan" if scan < walk else "walk"
+    plan.update(
+        strategy=strategy,
+        expected_requests=scan if strategy == "scan" else walk,
+        project_issues=n_project,
+        estimated_tree=estimated_tree,
+        reason=f"walk ≈ {walk} requests, scan ≈ {scan} requests ({n_project} issues, {n_roots} top-level)",
+    )
+    return plan
+
+
+def iter_walk_issues(client: JiraV3, root_key: str, max_depth: int = 3,
+                     fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Breadth-first, level by level:
+    - one chunked `parent in (k1,...,kN)` search per level instead of one search per parent
+    - sub-tasks are taken from each issue's `subtasks` field, so leaves cost no search
+    A Project → Epic → Task → Sub-task tree costs two searches plus paging.
+    Yields issues (unique, level order, created ASC within a chunk) as each page arrives.
+    With `fields`, every issue carries them inline (sub-tasks are bulk-fetched, 100 per
+    request); without, issues carry only issuetype/subtasks and sub-tasks are key stubs.
+    """
+    search_fields = list(dict.fromkeys(["issuetype", "subtasks"] + list(fields or [])))
+    seen: set = {root_key}
+    parents: List[str] = [root_key]
+    depth = 0
+    while parents and depth < max_depth:
+        depth += 1
+        next_parents: List[str] = []
+        subtasks_next: List[str] = []
+        for issue in client.iter_children(parents, fields=search_fields):
+            key = issue.get("key")
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            yield issue
+            if _may_have_children(issue):
+                next_parents.append(key)
+            subtasks_next.extend(s.get("key") for s in ((issue.get("fields") or {}).get("subtasks") or []))
+
+        # sub-tasks sit one level below their parent; they are leaves
+        if depth < max_depth:
+            subtasks_next = [k for k in subtasks_next if k and k not in seen]
+            seen.update(subtasks_next)
+            if fields:
+                yield from client.get_issues_bulk(subtasks_next, fields=fields)
+            else:
+                yield from ({"key": k, "fields": {}} for k in subtasks_next)
+        parents = next_parents
+
+
+def iter_walk(client: JiraV3, root_key: str, max_depth: int = 3) -> Iterator[str]:
+    """Keys of iter_walk_issues (no field payload, no sub-task fetch)."""
+    for issue in iter_walk_issues(client, root_key, max_depth):
+        yield issue["key"]
+
+
+def iter_scan_issues(client: JiraV3, root_key: str, max_depth: int = 3,
+                     fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    One `project = <root project>` search (the `parent` field plus `fields`), then a local
+    breadth-first walk of the rebuilt parent → children map (level order, created ASC).
+    Descendants living in other projects are not seen; the walk covers those.
+    """
+    children: Dict[str, List[Dict[str, Any]]] = {}
+    jql = f'project = "{project_of(root_key)}" ORDER BY created ASC'
+    search_fields = list(dict.fromkeys(["parent"] + list(fields or [])))
+    for issue in client.iter_jql(jql, fields=search_fields, page_size=SEARCH_PAGE_SIZE):
+        parent = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+        if parent and issue.get("key"):
+            children.setdefault(parent, []).append(issue)
+
+    seen: set = {root_key}
+    level = [root_key]
+    for _ in range(max_depth):
+        next_level: List[str] = []
+        for parent in level:
+            for issue in children.get(parent, []):
+                if issue["key"] not in seen:
+                    seen.add(issue["key"])
+                    next_level.append(issue["key"])
+                    yield issue
+        level = next_level
+
+
+def iter_scan(client: JiraV3, root_key: str, max_depth: int = 3) -> Iterator[str]:
+    """Keys of iter_scan_issues."""
+    for issue in iter_scan_issues(client, root_key, max_depth):
+        yield issue["key"]
+
+
+def iter_descendant_issues(client: JiraV3, root_key: str, max_depth: int = 3,
+                           plan: Optional[Dict[str, Any]] = None,
+                           fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Descendants of `root_key` with `fields` inline, using `plan` (plan_tree_fetch when omitted)."""
+    if not root_key:
+        return
+    if plan is None:
+        plan = plan_tree_fetch(client, root_key, max_depth)
+    if plan.get("strategy") == "scan":
+        yield from iter_scan_issues(client, root_key, max_depth, fields)
+    else:
+        yield from iter_walk_issues(client, root_key, max_depth, fields)
+
+
+def iter_descendant_keys(client: JiraV3, root_key: str, max_depth: int = 3,
+                         plan: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+    """Descendant keys of `root_key` using `plan` (computed with plan_tree_fetch when omitted)."""
+    for issue in iter_descendant_issues(client, root_key, max_depth, plan):
+        yield issue["key"]
+
+
+# -------------------- IssueTree --------------------
+
+class IssueNode:
+    """One issue of an IssueTree; `fields` holds the raw REST fields (TREE_FIELDS)."""
+
+    __slots__ = ("key", "id", "parent", "children", "links", "issuetype", "status", "summary", "fields")
+
+    def __init__(self, issue: Dict[str, Any]):
+        f = issue.get("fields") or {}
+        self.key: str = issue.get("key")
+        self.id: Optional[str] = issue.get("id")
+        self.parent: Optional[str] = (f.get("parent") or {}).get("key")
+        self.children: List[str] = []
+        # (link type name, "outward" | "inward", other issue key)
+        self.links: List[Tuple[str, str, str]] = []
+        for link in f.get("issuelinks") or []:
+            type_name = (link.get("type") or {}).get("name")
+            if link.get("outwardIssue"):
+                self.links.append((type_name, "outward", link["outwardIssue"].get("key")))
+            if link.get("inwardIssue"):
+                self.links.append((type_name, "inward", link["inwardIssue"].get("key")))
+        self.issuetype: str = (f.get("issuetype") or {}).get("name") or ""
+        self.status: str = (f.get("status") or {}).get("name") or ""
+        self.summary: str = f.get("summary") or ""
+        self.fields: Dict[str, Any] = f
+
+    def as_issue(self) -> Dict[str, Any]:
+        """REST-shaped issue dict ({"key", "id", "fields"}) for helpers that expect search results."""
+        return {"key": self.key, "id": self.id, "fields": self.fields}
+
+
+class IssueTree:
+    """
+    One Project issue and its descendants with parent/children/link adjacency and
+    indexes by issue type, status and summary (case-insensitive). Children keep fetch
+    order (created ASC per parent); keys() is level order.
+
+    Issue links (from the inline `issuelinks` field) are indexed as directed edges
+    (outward issue, link type, inward issue) - for "Blocks": (blocker, "Blocks", blocked) -
+    once per link even when both ends are in the tree, and including links to issues
+    outside the tree.
+    """
+
+    def __init__(self, root_key: str):
+        self.root_key = root_key
+        self.nodes: Dict[str, IssueNode] = {}
+        self.plan: Optional[Dict[str, Any]] = None
+        self.built_at = time.time()
+        self._by_type: Dict[str, List[str]] = {}
+        self._by_status: Dict[str, List[str]] = {}
+        self._by_summary: Dict[str, List[str]] = {}
+        # link type (lowercase) -> issue key -> linked keys, per direction
+        self._outward: Dict[str, Dict[str, List[str]]] = {}
+        self._inward: Dict[str, Dict[str, List[str]]] = {}
+        self._edges: Dict[Tuple[str, str, str], None] = {}  # insertion-ordered set
+
+    def add(self, issue: Dict[str, Any]) -> IssueNode:
+        node = IssueNode(issue)
+        self.nodes[node.key] = node
+        self._by_type.setdefault(node.issuetype.lower(), []).append(node.key)
+        self._by_status.setdefault(node.status.lower(), []).append(node.key)
+        self._by_summary.setdefault(node.summary.strip().lower(), []).append(node.key)
+        parent = self.nodes.get(node.parent) if node.parent else None
+        if parent is not None:
+            parent.children.append(node.key)
+        for type_name, direction, other in node.links:
+            edge = (node.key, type_name, other) if direction == "outward" else (other, type_name, node.key)
+            if other and edge not in self._edges:
+                self._edges[edge] = None
+                kind = (type_name or "").lower()
+                self._outward.setdefault(kind, {}).setdefault(edge[0], []).append(edge[2])
+                self._inward.setdefault(kind, {}).setdefault(edge[2], []).append(edge[0])
+        return node
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.nodes
+
+    def get(self, key: str) -> Optional[IssueNode]:
+        return self.nodes.get(key)
+
+    def children_of(self, key: str) -> List[str]:
+        node = self.nodes.get(key)
+        return list(node.children) if node else []
+
+    def descendants(self, key: Optional[str] = None) -> List[str]:
+        """Keys below `key` (default: the root), level order."""
+        out: List[str] = []
+        level = self.children_of(key or self.root_key)
+        while level:
+            out.extend(level)
+            level = [c for k in level for c in self.nodes[k].children]
+        return out
+
+    def preorder(self, key: Optional[str] = None) -> List[str]:
+        """Keys below `key` (default: the root), depth first: each issue followed by its own subtree."""
+        out: List[str] = []
+        stack = list(reversed(self.children_of(key or self.root_key)))
+        while stack:
+            k = stack.pop()
+            out.append(k)
+            stack.extend(reversed(self.nodes[k].children))
+        return out
+
+    def keys(self) -> List[str]:
+        """All descendants of the root (the root itself excluded)."""
+        return self.descendants()
+
+    def of_type(self, issuetype: str) -> List[str]:
+        return list(self._by_type.get(issuetype.lower(), []))
+
+    def with_status(self, status: str) -> List[str]:
+        return list(self._by_status.get(status.lower(), []))
+
+    def find_summary(self, summary: str) -> List[str]:
+        return list(self._by_summary.get(summary.strip().lower(), []))
+
+    def links_of(self, key: str) -> List[Tuple[str, str, str]]:
+        node = self.nodes.get(key)
+        return list(node.links) if node else []
+
+    def link_edges(self, link_type: Optional[str] = None) -> List[Tuple[str, str, str]]:
+        """Unique (outward issue, link type, inward issue) edges, optionally of one link type."""
+        kind = link_type.lower() if link_type else None
+        return [e for e in self._edges if kind is None or (e[1] or "").lower() == kind]
+
+    def outward_of(self, key: str, link_type: str) -> List[str]:
+        """Issues `key` points at through `link_type` (for "Blocks": the issues it blocks)."""
+        return list(self._outward.get(link_type.lower(), {}).get(key, []))
+
+    def inward_of(self, key: str, link_type: str) -> List[str]:
+        """Issues pointing at `key` through `link_type` (for "Blocks": its blockers)."""
+        return list(self._inward.get(link_type.lower(), {}).get(key, []))
+
+    def external_links(self) -> List[Tuple[str, str, str]]:
+        """Edges with one end outside the tree."""
+        return [e for e in self._edges if e[0] not in self.nodes or e[2] not in self.nodes]
+
+
+def build_issue_tree(client: JiraV3, root_key: str, max_depth: int = 3,
+                     plan: Optional[Dict[str, Any]] = None, fields: List[str] = TREE_FIELDS) -> IssueTree:
+    """
+    Fetch `root_key` and its descendants into an IssueTree in a single pass: the planned
+    walk/scan searches request all `fields` inline and each issue is added as its page
+    arrives (no key-collection phase followed by per-issue or bulk reads).
+    """
+    tree = IssueTree(root_key)
+    tree.plan = plan if plan is not None else plan_tree_fetch(client, root_key, max_depth)
+    try:
+        tree.add(client.get_issue(root_key, fields=fields))
+    except requests.HTTPError as e:
+        if e.response is None or e.response.status_code != 404:
+            raise
+        return tree
+    for issue in iter_descendant_issues(client, root_key, max_depth, plan=tree.plan, fields=fields):
+        tree.add(issue)
+    return tree
+
+
+# -------------------- Rule-driven (pruned) traversal --------------------
+
+# fields every pruned node carries (rules are evaluated on them)
+RULE_FIELDS = ["summary", "issuetype", "status", "parent"]
+
+
+class LevelRule:
+    """
+    Which issues one depth below the root (rules[0] = children of the root) are kept,
+    returned and expanded. Names compare case-insensitively; None means "any".
+    - types / statuses: only these are fetched (pushed into JQL); others are pruned with their subtree
+    - summaries: only issues with one of these exact summaries are returned (pushed into JQL as
+      phrase searches on the last level, where nothing below has to be reached through them)
+    - expand: issue types whose children are searched (None: every type that can have children)
+    - emit: whether issues of this level are returned at all
+    """
+
+    __slots__ = ("types", "statuses", "summaries", "expand", "emit")
+
+    def __init__(self, types: Optional[Iterable[str]] = None, statuses: Optional[Iterable[str]] = None,
+                 summaries: Optional[Iterable[str]] = None, expand: Optional[Iterable[str]] = None,
+                 emit: bool = True):
+        self.types = _lowered(types)
+        self.statuses = _lowered(statuses)
+        self.summaries = _lowered(summaries)
+        self.expand = _lowered(expand)
+        self.emit = emit
+
+    def keeps(self, node: IssueNode) -> bool:
+        return ((self.types is None or node.issuetype.lower() in self.types)
+                and (self.statuses is None or node.status.lower() in self.statuses))
+
+    def returns(self, node: IssueNode) -> bool:
+        return self.emit and (self.summaries is None or node.summary.strip().lower() in self.summaries)
+
+    def expands(self, node: IssueNode) -> bool:
+        if self.expand is not None:
+            return node.issuetype.lower() in self.expand
+        return not ((node.fields.get("issuetype") or {}).get("subtask"))
+
+    def where(self, last: bool) -> Optional[str]:
+        """JQL restriction for the search of this level's issues."""
+        clauses = []
+        if self.types is not None:
+            clauses.append("issuetype in (" + ",".join(f'"{t}"' for t in sorted(self.types)) + ")")
+        if self.statuses is not None:
+            clauses.append("status in (" + ",".join(f'"{s}"' for s in sorted(self.statuses)) + ")")
+        if last and self.emit and self.summaries and all(_PLAIN_TEXT.match(s) for s in self.summaries):
+            clauses.append("(" + " OR ".join(f'summary ~ "\\"{s}\\""' for s in sorted(self.summaries)) + ")")
+        return " AND ".join(clauses) or None
+
+
+_PLAIN_TEXT = re.compile(r"^[\w .,:/&()-]+$")
+
+
+def _lowered(names: Optional[Iterable[str]]) -> Optional[Set[str]]:
+    return None if names is None else {n.strip().lower() for n in names}
+
+
+def fetch_pruned_tree(client: JiraV3, root_key: str, rules: List[LevelRule],
+                      fields: Iterable[str] = ()) -> IssueTree:
+    """
+    Breadth-first fetch of only what `rules` can reach: one `parent in (...) AND <rule>` search
+    per level, children searched only below kept, expandable issues, and only RULE_FIELDS +
+    `fields` downloaded. The root node holds just its key.
+    """
+    profile = list(dict.fromkeys(RULE_FIELDS + list(fields)))
+    tree = IssueTree(root_key)
+    tree.add({"key": root_key, "fields": {}})
+    parents = [root_key]
+    requests_made = 0
+    for depth, rule in enumerate(rules):
+        if not parents:
+            break
+        last = depth == len(rules) - 1
+        next_parents: List[str] = []
+        requests_made += math.ceil(len(parents) / 100)  # first pages of the parent chunks
+        for issue in client.iter_children(parents, fields=profile, where=rule.where(last)):
+            if issue.get("key") in tree:
+                continue
+            node = tree.add(issue)
+            if rule.keeps(node) and not last and rule.expands(node):
+                next_parents.append(node.key)
+        parents = next_parents
+    tree.plan = {"strategy": "pruned", "expected_requests": requests_made,
+                 "reason": f"{len(tree) - 1} issues fetched over {len(rules)} rule levels"}
+    return tree
+
+
+def select_keys(tree: IssueTree, rules: List[LevelRule]) -> List[str]:
+    """
+    Keys `rules` return from `tree` (a full tree or a fetch_pruned_tree result), depth first
+    with each issue after its own descendants (children in created order).
+    """
+    out: List[str] = []
+
+    def _visit(key: str, depth: int) -> None:
+        rule = rules[depth]
+        for child in tree.children_of(key):
+            node = tree.nodes[child]
+            if not rule.keeps(node):
+                continue
+            if depth + 1 < len(rules) and rule.expands(node):
+                _visit(child, depth + 1)
+            if rule.returns(node):
+                out.append(child)
+
+    if rules and tree.root_key in tree:
+        _visit(tree.root_key, 0)
+    return out
+
+
+def iter_filtered_descendants(client: JiraV3, root_key: str, where: str, containers: Optional[str],
+                              fields: Iterable[str] = (), max_depth: int = 3) -> Iterator[Dict[str, Any]]:
+    """
+    Descendants of `root_key` matching the JQL restriction `where`, without downloading the rest
+    of the tree. Per level, two `parent in (...)` searches over the current parents:
+      - `AND (<where>)` with `fields`: the matching issues
+      - `AND <containers>` with just the issue type and parent: the parents of the next level
+    containers=None stops after the root's children (nothing below can match).
+    The matches and their containers form a small IssueTree; the matches are yielded from its
+    preorder() (each issue before its own subtree, children created ASC), like the full report.
+    """
+    profile = list(dict.fromkeys(["issuetype", "parent", "created"] + list(fields)))
+    tree = IssueTree(root_key)
+    tree.add({"key": root_key, "fields": {}})
+    matches: Dict[str, Dict[str, Any]] = {}
+    parents = [root_key]
+    depth = 0
+    while parents and depth < max_depth:
+        level: Dict[str, Dict[str, Any]] = {}
+        for issue in client.iter_children(parents, fields=profile, where=f"({where})"):
+            matches[issue["key"]] = level[issue["key"]] = issue
+        depth += 1
+        next_parents: List[str] = []
+        if containers is not None and depth < max_depth:
+            for issue in client.iter_children(parents, fields=["issuetype", "parent", "created"], where=containers):
+                if issue["key"] not in tree:
+                    level.setdefault(issue["key"], issue)
+                    next_parents.append(issue["key"])
+        # one add per issue in created order, so siblings from both searches keep created ASC
+        for issue in sorted(level.values(), key=_created_order):
+            if issue["key"] not in tree:
+                tree.add(issue)
+        parents = next_parents
+    for key in tree.preorder():
+        if key in matches:
+            yield matches[key]
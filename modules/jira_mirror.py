@@ -0,0 +1,405 @@
+# modules/jira_mirror.py
+# Local SQLite mirror of Jira boards (`project = KEY`): issues with the fields the pages use,
+# parent edges, issue links and worklogs. A scheduled sync keeps it current incrementally
+# (`updated >= <watermark> ORDER BY updated ASC`); pages answer from its indexes instead of JQL.
+#
+# Sync CLI (cron / systemd timer), credentials from the environment:
+#   JIRA_EMAIL=... JIRA_API_TOKEN=... python -m modules.jira_mirror sync --board ABC --board DEF
+#   ... sync --all              every board in JIRA_MIRROR_BOARDS
+#   ... sync --all --every 300  keep running, one pass every 5 minutes
+#   ... sync --board ABC --full re-download the board (also repairs missed deletions)
+#   ... status                  watermark, last sync and issue count per board
+#
+# The mirror holds what the sync account can see; only list boards in JIRA_MIRROR_BOARDS
+# whose content every app user may read.
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+from modules.config import JIRA_URL, JIRA_MIRROR_BOARDS, JIRA_MIRROR_MAX_LAG, JIRA_MIRROR_PATH
+from modules.http_governor import batched, map_in_order
+from modules.jira_hierarchy import TREE_FIELDS, IssueTree, project_of
+from modules.jira_v3 import JiraV3, get_client
+
+# fields downloaded per issue: everything an IssueTree node stores + what the sync itself needs
+MIRROR_FIELDS = list(dict.fromkeys(TREE_FIELDS + ["project", "updated"]))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    key TEXT PRIMARY KEY,
+    id TEXT,
+    project TEXT NOT NULL,
+    parent_key TEXT,
+    issuetype TEXT,
+    status TEXT,
+    summary TEXT,
+    duedate TEXT,
+    start_date TEXT,
+    assignee_id TEXT,
+    assignee_name TEXT,
+    created TEXT,
+    updated TEXT,
+    fields_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_issues_parent ON issues(parent_key);
+CREATE INDEX IF NOT EXISTS ix_issues_project_type ON issues(project, issuetype);
+CREATE INDEX IF NOT EXISTS ix_issues_project_status ON issues(project, status);
+CREATE INDEX IF NOT EXISTS ix_issues_summary ON issues(project, summary COLLATE NOCASE);
+
+CREATE TABLE IF NOT EXISTS links (
+    src TEXT NOT NULL,
+    type TEXT NOT NULL,
+    direction TEXT NOT NULL,
+    dst TEXT NOT NULL,
+    PRIMARY KEY (src, type, direction, dst)
+);
+CREATE INDEX IF NOT EXISTS ix_links_dst ON links(dst);
+
+CREATE TABLE IF NOT EXISTS worklogs (
+    id TEXT PRIMARY KEY,
+    issue_key TEXT NOT NULL,
+    author_id TEXT,
+    author_name TEXT,
+    author_email TEXT,
+    started TEXT,
+    seconds INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_worklogs_issue ON worklogs(issue_key);
+
+CREATE TABLE IF NOT EXISTS boards (
+    project TEXT PRIMARY KEY,
+    watermark TEXT,
+    synced_at REAL
+);
+"""
+
+
+def _parse_jira_ts(value: Optional[str]) -> Optional[datetime]:
+    """Jira timestamps look like 2024-05-01T10:22:33.123+0200."""
+    if not value:
+        return None
+    for fmt in ("%Y-%m-%dT%H:%M:%S.%f%z", "%Y-%m-%dT%H:%M:%S%z"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+class BoardMirror:
+    """SQLite mirror; one short-lived connection per operation, safe across threads and processes."""
+
+    def __init__(self, path: str = JIRA_MIRROR_PATH):
+        self.path = path
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with self._db() as db:
+            db.executescript(_SCHEMA)
+
+    @contextmanager
+    def _db(self) -> Iterator[sqlite3.Connection]:
+        db = sqlite3.connect(self.path, timeout=30)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:  # commit / rollback
+                yield db
+        finally:
+            db.close()
+
+    # -------------------- Sync --------------------
+
+    def sync_board(self, client: JiraV3, project: str, full: bool = False) -> Dict[str, Any]:
+        """
+        Bring one board up to date. Incremental unless `full` or never synced:
+          project = KEY AND updated >= "<watermark - 1 min>" ORDER BY updated ASC
+        The watermark (latest `updated` seen) is formatted in the sync user's Jira time zone,
+        which is how JQL reads absolute dates. Worklogs are re-read for every changed issue
+        (logging work bumps `updated`). Deletions are found by comparing counts and, on a
+        mismatch, re-listing the board's keys.
+        """
+        started = time.time()
+        state = self.board_state(project)
+        jql = f'project = "{project}"'
+        if state and state["watermark"] and not full:
+            since = _parse_jira_ts(state["watermark"]) - timedelta(minutes=1)
+            jql += f' AND updated >= "{self._jql_time(client, since)}"'
+        jql += " ORDER BY updated ASC"
+
+        changed: List[str] = []
+        watermark = state["watermark"] if state and not full else None
+        for page in batched(client.iter_jql(jql, fields=MIRROR_FIELDS), 100):
+            self._upsert_issues(page)
+            changed.extend(i["key"] for i in page)
+            latest = (page[-1].get("fields") or {}).get("updated")
+            if latest and (watermark is None or _parse_jira_ts(latest) > _parse_jira_ts(watermark)):
+                watermark = latest
+
+        for key, worklogs in zip(changed, map_in_order(client.get_worklogs_all, changed)):
+            self._replace_worklogs(key, worklogs)
+
+        deleted = self._prune_deleted(client, project, force=full)
+
+        with self._db() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO boards (project, watermark, synced_at) VALUES (?, ?, ?)",
+                (project, watermark, started),
+            )
+        return {"project": project, "changed": len(changed), "deleted": deleted,
+                "seconds": round(time.time() - started, 2)}
+
+    def _jql_time(self, client: JiraV3, when: datetime) -> str:
+        tz_name = None
+        try:
+            tz_name = client.myself().get("timeZone")
+        except Exception:
+            pass
+        tz = ZoneInfo(tz_name) if (ZoneInfo and tz_name) else timezone.utc
+        return when.astimezone(tz).strftime("%Y/%m/%d %H:%M")
+
+    def _upsert_issues(self, issues: List[Dict[str, Any]]) -> None:
+        rows, links, keys = [], [], []
+        for issue in issues:
+            f = issue.get("fields") or {}
+            key = issue["key"]
+            keys.append(key)
+            assignee = f.get("assignee") or {}
+            rows.append((
+                key,
+                issue.get("id"),
+                (f.get("project") or {}).get("key") or project_of(key),
+                (f.get("parent") or {}).get("key"),
+                (f.get("issuetype") or {}).get("name"),
+                (f.get("status") or {}).get("name"),
+                f.get("summary"),
+                f.get("duedate"),
+                f.get("customfield_10015"),
+                assignee.get("accountId"),
+                assignee.get("displayName"),
+                f.get("created"),
+                f.get("updated"),
+                json.dumps({k: f.get(k) for k in TREE_FIELDS}),
+            ))
+            for link in f.get("issuelinks") or []:
+                type_name = (link.get("type") or {}).get("name") or ""
+                if link.get("outwardIssue"):
+                    links.append((key, type_name, "outward", link["outwardIssue"].get("key")))
+                if link.get("inwardIssue"):
+                    links.append((key, type_name, "inward", link["inwardIssue"].get("key")))
+
+        with self._db() as db:
+            db.executemany("INSERT OR REPLACE INTO issues VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?)", rows)
+            db.executemany("DELETE FROM links WHERE src = ?", [(k,) for k in keys])
+            db.executemany("INSERT OR IGNORE INTO links VALUES (?,?,?,?)", links)
+
+    def _replace_worklogs(self, issue_key: str, worklogs: List[Dict[str, Any]]) -> None:
+        rows = []
+        for wl in worklogs:
+            author = wl.get("author") or {}
+            rows.append((
+                str(wl.get("id")),
+                issue_key,
+                author.get("accountId"),
+                author.get("displayName"),
+                author.get("emailAddress"),
+                wl.get("started"),
+                wl.get("timeSpentSeconds") or 0,
+            ))
+        with self._db() as db:
+            db.execute("DELETE FROM worklogs WHERE issue_key = ?", (issue_key,))
+            db.executemany("INSERT OR REPLACE INTO worklogs VALUES (?,?,?,?,?,?,?)", rows)
+
+    def _prune_deleted(self, client: JiraV3, project: str, force: bool = False) -> int:
+        with self._db() as db:
+            local = db.execute("SELECT COUNT(*) FROM issues WHERE project = ?", (project,)).fetchone()[0]
+        if not force:
+            try:
+                if client.approximate_count(f'project = "{project}"') == local:
+                    return 0
+            except Exception:
+                pass  # no count endpoint: fall through to the key listing
+
+        remote = {i["key"] for i in client.iter_jql(f'project = "{project}"', fields=["key"])}
+        with self._db() as db:
+            local_keys = [r[0] for r in db.execute("SELECT key FROM issues WHERE project = ?", (project,))]
+            gone = [(k,) for k in local_keys if k not in remote]
+            db.executemany("DELETE FROM issues WHERE key = ?", gone)
+            db.executemany("DELETE FROM links WHERE src = ?", gone)
+            db.executemany("DELETE FROM worklogs WHERE issue_key = ?", gone)
+        return len(gone)
+
+    # -------------------- Queries --------------------
+
+    def board_state(self, project: str) -> Optional[Dict[str, Any]]:
+        with self._db() as db:
+            row = db.execute("SELECT watermark, synced_at FROM boards WHERE project = ?", (project,)).fetchone()
+            if row is None:
+                return None
+            count = db.execute("SELECT COUNT(*) FROM issues WHERE project = ?", (project,)).fetchone()[0]
+        return {"project": project, "watermark": row["watermark"], "synced_at": row["synced_at"], "issues": count}
+
+    def is_fresh(self, project: str, max_lag: float = JIRA_MIRROR_MAX_LAG) -> bool:
+        state = self.board_state(project)
+        return bool(state and state["synced_at"] and time.time() - state["synced_at"] <= max_lag)
+
+    def descendants(self, root_key: str, max_depth: int = 3) -> List[str]:
+        """Keys below `root_key`, level order, created ASC among siblings (recursive CTE on parent_key)."""
+        with self._db() as db:
+            rows = db.execute(
+                """
+                WITH RECURSIVE sub(key, depth, created) AS (
+                    SELECT key, 1, created FROM issues WHERE parent_key = ?
+                    UNION ALL
+                    SELECT i.key, sub.depth + 1, i.created FROM issues i JOIN sub ON i.parent_key = sub.key
+                    WHERE sub.depth < ?
+                )
+                SELECT key FROM sub ORDER BY depth, created
+                """,
+                (root_key, max_depth),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def tree(self, root_key: str, max_depth: int = 3) -> Optional[IssueTree]:
+        """IssueTree of `root_key` built from the mirror, or None when the root is not mirrored."""
+        keys = [root_key] + self.descendants(root_key, max_depth)
+        by_key: Dict[str, Dict[str, Any]] = {}
+        with self._db() as db:
+            for chunk in batched(keys, 500):
+                marks = ",".join("?" * len(chunk))
+                for row in db.execute(f"SELECT key, id, fields_json FROM issues WHERE key IN ({marks})", chunk):
+                    by_key[row["key"]] = {"key": row["key"], "id": row["id"], "fields": json.loads(row["fields_json"])}
+        if root_key not in by_key:
+            return None
+        tree = IssueTree(root_key)
+        for key in keys:  # level order: parents are added before their children
+            if key in by_key:
+                tree.add(by_key[key])
+        tree.plan = {"strategy": "mirror", "expected_requests": 0, "reason": f"local mirror {self.path}"}
+        return tree
+
+    def find_by_summary(self, project: str, summary: str) -> List[Dict[str, Any]]:
+        with self._db() as db:
+            rows = db.execute(
+                "SELECT key, issuetype, status, summary, duedate, start_date FROM issues"
+                " WHERE project = ? AND summary = ? COLLATE NOCASE",
+                (project, summary),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def issues_of_type(self, project: str, issuetype: str) -> List[Dict[str, Any]]:
+        with self._db() as db:
+            rows = db.execute(
+                "SELECT key, status, summary, duedate, start_date, parent_key FROM issues"
+                " WHERE project = ? AND issuetype = ? ORDER BY created",
+                (project, issuetype),
+            ).fetchall()
+        return [dict(r) for r in rows]
+
+    def links_of(self, key: str) -> List[Dict[str, Any]]:
+        with self._db() as db:
+            rows = db.execute("SELECT type, direction, dst FROM links WHERE src = ?", (key,)).fetchall()
+        return [dict(r) for r in rows]
+
+    def worklogs(self, issue_keys: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Worklogs per issue key in the REST shape ({"author": {...}, "started", "timeSpentSeconds"})."""
+        out: Dict[str, List[Dict[str, Any]]] = {k: [] for k in issue_keys}
+        with self._db() as db:
+            for chunk in batched(issue_keys, 500):
+                marks = ",".join("?" * len(chunk))
+                for r in db.execute(f"SELECT * FROM worklogs WHERE issue_key IN ({marks}) ORDER BY started", chunk):
+                    out[r["issue_key"]].append({
+                        "id": r["id"],
+                        "author": {"accountId": r["author_id"], "displayName": r["author_name"],
+                                   "emailAddress": r["author_email"]},
+                        "started": r["started"],
+                        "timeSpentSeconds": r["seconds"],
+                    })
+        return out
+
+
+# -------------------- Page helpers --------------------
+
+_MIRROR: Optional[BoardMirror] = None
+_MIRROR_LOCK = threading.Lock()
+
+
+def get_mirror() -> BoardMirror:
+    global _MIRROR
+    with _MIRROR_LOCK:
+        if _MIRROR is None:
+            _MIRROR = BoardMirror()
+        return _MIRROR
+
+
+def mirror_serves(project: str) -> bool:
+    """True when the board is mirrored and was synced within JIRA_MIRROR_MAX_LAG."""
+    return project in JIRA_MIRROR_BOARDS and get_mirror().is_fresh(project)
+
+
+def mirrored_tree(root_key: str) -> Optional[IssueTree]:
+    return get_mirror().tree(root_key) if mirror_serves(project_of(root_key)) else None
+
+
+def mirrored_worklogs(issue_keys: List[str]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+    """Worklogs from the mirror when every issue's board is served by it, else None."""
+    if not issue_keys or not all(mirror_serves(p) for p in {project_of(k) for k in issue_keys}):
+        return None
+    return get_mirror().worklogs(issue_keys)
+
+
+# -------------------- CLI --------------------
+
+def _cli(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m modules.jira_mirror", description="Sync Jira boards into the local mirror.")
+    parser.add_argument("--db", default=JIRA_MIRROR_PATH, help="SQLite file (default: %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sync = sub.add_parser("sync", help="incremental sync of one or more boards")
+    sync.add_argument("--board", action="append", default=[], help="project key; repeatable")
+    sync.add_argument("--all", action="store_true", help="every board in JIRA_MIRROR_BOARDS")
+    sync.add_argument("--full", action="store_true", help="re-download instead of syncing the delta")
+    sync.add_argument("--every", type=int, default=0, help="repeat every N seconds (0 = run once)")
+    sub.add_parser("status", help="watermark and issue count per board")
+    args = parser.parse_args(argv)
+
+    mirror = BoardMirror(args.db)
+    if args.command == "status":
+        for project in JIRA_MIRROR_BOARDS:
+            print(mirror.board_state(project) or {"project": project, "synced_at": None})
+        return 0
+
+    boards = list(dict.fromkeys(args.board + (list(JIRA_MIRROR_BOARDS) if args.all else [])))
+    if not boards:
+        parser.error("nothing to sync: pass --board KEY or --all")
+    email, token = os.environ.get("JIRA_EMAIL"), os.environ.get("JIRA_API_TOKEN")
+    if not (email and token):
+        parser.error("set JIRA_EMAIL and JIRA_API_TOKEN")
+    client = get_client(JIRA_URL, email, token)
+
+    while True:
+        for project in boards:
+            try:
+                print(mirror.sync_board(client, project, full=args.full), flush=True)
+            except Exception as e:
+                print(f"sync of {project} failed: {e}", file=sys.stderr, flush=True)
+        if not args.every:
+            return 0
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    sys.exit(_cli())
@@ -1,16 +1,23 @@
 from __future__ import annotations
-from typing import Any, Dict, List, Optional, Tuple, Iterable
+from typing import Any, Dict, List, Optional, Tuple, Iterable, Iterator
 from collections import OrderedDict
 import pandas as pd
 import streamlit as st
-import math
+import time
+from contextlib import contextmanager
 import requests
 from datetime import datetime,timedelta
 from pptx import Presentation
 from pptx.util import Inches
 from modules.config import JIRA_ACCOUNT_ISSUE_TYPE,JIRA_PROJECT_ISSUE_TYPE,JIRA_EPIC_ISSUE_TYPE, JIRA_TASK_ISSUE_TYPE, JIRA_SUBTASK_ISSUE_TYPE,JIRA_URL,EXCEL_FILE_PATH,EXCEL_FILE_PATH_BLUE_PRINT_PILOT,EXCEL_FILE_PATH_BLUE_PRINT_ROLLOUT,EXCEL_FILE_PATH_BLUE_PRINT_POC,EXCEL_FILE_PATH_BLUE_PRINT_TEST,EXCEL_FILE_PATH_BLUE_PRINT_ROLLOUT_WIL,JIRA_TEMPLATE_BOARD_KEY,EXCLUDED_BOARD_KEYS
 from modules.utils import normalize_NaN, normalize_date, calculate_end_date
-from .jira_v3 import JiraV3
+from .http_governor import map_in_order
+from .jira_v3 import JiraV3, get_client
+from .jira_v3_async import async_available, async_twin
+from .jira_hierarchy import IssueTree, LevelRule, fetch_pruned_tree, iter_descendant_keys, iter_filtered_descendants, select_keys
+from .jira_snapshots import SNAPSHOTS
+from .jira_mirror import mirrored_tree
+from .report_frame import REPORT_FIELDS, ReportFrameBuilder, _option_value, filter_index_for
 
 
 class JiraOperations:
@@ -34,11 +41,22 @@ class JiraOperations:
             return results["issues"][0]
         return {}
 
-## generice Jira Auth Function that returns a new instance of JIRA
-def authenticate(jira_url,jira_email,jira_api_token):
-    
-    jira = JIRA(jira_url,basic_auth=(jira_email, jira_api_token))
-    return jira
+## generice Jira Auth Function that returns the pooled REST v3 client (no server-info round trip)
+def authenticate(jira_url,jira_email,jira_api_token) -> JiraV3:
+    return get_client(jira_url, jira_email, jira_api_token)
+
+
+@contextmanager
+def timed_flow(client: JiraV3, label: str) -> Iterator[None]:
+    """Show wall time and Jira requests of one page flow as a caption (requests are approximate
+    when other sessions share the pooled client)."""
+    started = time.perf_counter()
+    before = client.retry_stats().get("requests", 0)
+    try:
+        yield
+    finally:
+        requests_made = client.retry_stats().get("requests", 0) - before
+        st.caption(f"{label}: {time.perf_counter() - started:.2f}s, {requests_made} Jira request(s)")
 
 # JIRA Credentials Handling
 
@@ -60,7 +78,7 @@ def get_project_keys(jira_url: str, username: str, password: str) -> List[str]:
     Adds a blank "" entry at the start for selectbox compatibility.
     Replaces python-jira .projects() with /rest/api/3/project/search.
     """
-    client = JiraV3(jira_url, username, password)
+    client = get_client(jira_url, username, password)
     projects = client.project_search_all()
 
     excluded_keys = {
@@ -216,7 +234,7 @@ def get_jira_issue_type_account_key(base_url: str, email: str, token: str, issue
     Return issue keys for the 'Account' issue type within the CURRENT target project
     (read from st.session_state['jira_project_key']), using /rest/api/3/search/jql.
     """
-    client = JiraV3(base_url, email, token)
+    client = get_client(base_url, email, token)
 
     project_key = st.session_state.get("jira_project_key")
     if not project_key:
@@ -274,28 +292,35 @@ def display_issue_summaries(issue_list: List[Dict]) -> Optional[str]:
     return selected_obj["key"] if selected_obj else None
 
 
+# Per-level traversal rules (jira_hierarchy.LevelRule) of the children helpers below
+CHILDREN_RULES = [LevelRule(expand=["Epic"]), LevelRule(expand=[])]
+TICKET_TEMPLATE_RULES = [LevelRule(types=["Epic"], emit=False), LevelRule(expand=[])]
+TIMELINE_RULES = [LevelRule(expand=["Epic"]), LevelRule(expand=["Task"]), LevelRule()]
+
+
+def select_issues(client: JiraV3, root_key: str, rules: List[LevelRule],
+                  fields: Iterable[str] = ()) -> Tuple[IssueTree, List[str]]:
+    """
+    Keys `rules` select below `root_key` (each issue after its own descendants) and the tree
+    they live in. An IssueTree that is already cached (board mirror or snapshot) is read
+    without waiting for Jira (a stale snapshot is refreshed in the background); otherwise only
+    the branches the rules can reach are fetched, with the `fields` profile.
+    """
+    tree = mirrored_tree(root_key)
+    if tree is None:
+        tree = SNAPSHOTS.peek(client, root_key)
+    if tree is None:
+        tree = fetch_pruned_tree(client, root_key, rules, fields)
+    return tree, select_keys(tree, rules)
+
+
 # get all child issues of a jira issue
-def get_children_issues(jira, issue_key):
-    issue = jira.issue(issue_key)
-    # List to store children issues
-    children_issues = []
-    
-    #Helper function to find issues linked to the given issue
-    def get_linked_issues(issue_key):
-        jql = f'"parent" = {issue_key}'
-        return jira.search_issues(jql)
-
-    linked_issues=get_linked_issues(issue_key)
-    # Add linked issues to the list "children_issues"
-    if linked_issues:
-        for linked_issue in linked_issues:
-            if linked_issue.fields.issuetype.name.lower() == 'epic':
-                linked_issues_tasks=get_linked_issues(linked_issue)
-                for linked_issues_task in linked_issues_tasks:
-                    children_issues.append(linked_issues_task.key)
-            children_issues.append(linked_issue.key)
-        return children_issues
-    return
+def get_children_issues(client: JiraV3, issue_key: str) -> Optional[List[str]]:
+    """
+    Keys of the children of `issue_key` and, for Epic children, their tasks (each Epic's tasks
+    listed before the Epic); None when there are no children.
+    """
+    return select_issues(client, issue_key, CHILDREN_RULES)[1] or None
 
 def update_parent_issue_type_project(
     client: JiraV3,
@@ -362,171 +387,54 @@ def delete_newly_created_project(client: JiraV3, issue_key: str) -> None:
         st.warning("delete_newly_created_project: issue_key is required.")
         return
 
-    url = f"{client.base_url}/rest/api/3/issue/{issue_key}"
     try:
-        r = requests.delete(url, headers=client._auth_header, params={"deleteSubtasks": "true"}, timeout=client.timeout)
-        if r.status_code in (200, 204):
-            st.info(f"Issue {issue_key} deleted.")
-        else:
-            st.warning(f"Could not delete {issue_key}: {r.status_code} {r.text}")
+        client.delete_issue(issue_key, delete_subtasks=True)
+        st.info(f"Issue {issue_key} deleted.")
+    except requests.HTTPError as e:
+        r = e.response
+        st.warning(f"Could not delete {issue_key}: {r.status_code} {r.text}")
     except Exception as e:
         st.warning(f"Could not delete newly created issue type project {issue_key}: {e}")
 
 
 # get all child issues of a jira issue
-def get_children_issues_ticket_template(jira, issue_key):
-    issue = jira.issue(issue_key)
-    # List to store children issues
-    children_issues = []
-    
-    #Helper function to find issues linked to the given issue
-    def get_linked_issues(issue_key):
-        jql = f'"parent" = {issue_key}'
-        return jira.search_issues(jql)
-    linked_issues=get_linked_issues(issue_key)
-    # Add linked issues to the list "children_issues"
-    if linked_issues:
-        for linked_issue in linked_issues:
-            if linked_issue.fields.issuetype.name.lower() == 'epic':
-                # children_issues.append(
-                # {'key': linked_issue.key,
-                # 'summary': linked_issue.fields.summary,
-                # 'issuetype': linked_issue.fields.issuetype.name})
-                linked_issues_tasks=get_linked_issues(linked_issue)
-                for linked_issues_task in linked_issues_tasks:
-                    children_issues.append(
-                    {'key': linked_issues_task.key,
-                    'summary': linked_issues_task.fields.summary,
-                    'issuetype': linked_issues_task.fields.issuetype.name})
-            # children_issues.append(
-            #         {'key': linked_issues_task.key,
-            #         'summary': linked_issues_task.fields.summary,
-            #         'issuetype': linked_issues_task.fields.issuetype.name})
-        return children_issues
-    return []
-
-             
-
-def get_children_issues_for_timeline(jira, issue_key):
-    issue = jira.issue(issue_key)
-    # List to store children issues
-    children_issues = []
-    
-    #Helper function to find issues linked to the given issue
-    def get_linked_issues(issue_key):
-        jql = f'"parent" = {issue_key}'
-        return jira.search_issues(jql)
-
-    linked_issues=get_linked_issues(issue_key)
-    # Add linked issues to the list "children_issues"
-    if linked_issues:
-        for linked_issue in linked_issues:
-            if linked_issue.fields.issuetype.name.lower() == 'epic':
-                linked_issues_tasks=get_linked_issues(linked_issue)
-                for linked_issues_task in linked_issues_tasks:
-                    if linked_issues_task.fields.issuetype.name.lower() == 'task':
-                        linked_issues_subtasks=get_linked_issues(linked_issues_task)
-                        for linked_issues_subtask in linked_issues_subtasks:
-                            children_issues.append(linked_issues_subtask.key)        
-                    children_issues.append(linked_issues_task.key)
-            children_issues.append(linked_issue.key)
-        return children_issues
-    return
+def get_children_issues_ticket_template(client: JiraV3, issue_key: str) -> List[Dict[str, str]]:
+    """
+    Tasks below the Epics of `issue_key` as [{'key', 'summary', 'issuetype'}]; non-Epic
+    children are never searched.
+    """
+    tree, keys = select_issues(client, issue_key, TICKET_TEMPLATE_RULES)
+    return [{'key': k, 'summary': tree.nodes[k].summary, 'issuetype': tree.nodes[k].issuetype} for k in keys]
 
 
-def _option_value(val: Any) -> Optional[str]:
+def get_children_issues_for_timeline(client: JiraV3, issue_key: str) -> Optional[List[str]]:
     """
-    Normalize Jira option-like values to a plain string.
-    Handles:
-      - dicts with {"value": "..."}
-      - python-jira style objects with .value
-      - lists of either (joined by ", ")
-      - plain strings / None
+    Keys of the hierarchy below `issue_key` (children, Epic tasks, Task sub-tasks),
+    deepest first within each branch; None when empty.
     """
-    if val is None:
-        return None
-    if isinstance(val, list):
-        parts = []
-        for v in val:
-            if isinstance(v, dict) and "value" in v:
-                parts.append(str(v["value"]))
-            elif hasattr(v, "value"):
-                parts.append(str(v.value))
-            else:
-                parts.append(str(v))
-        return ", ".join(parts) if parts else None
-    if isinstance(val, dict) and "value" in val:
-        return str(val["value"])
-    if hasattr(val, "value"):
-        return str(val.value)
-    return str(val)
+    return select_issues(client, issue_key, TIMELINE_RULES)[1] or None
 
 
-def create_report_dataframe(client: JiraV3, issuekey: str) -> pd.DataFrame:
+def create_report_dataframe(client: JiraV3, issuekey: str, tree: Optional[IssueTree] = None) -> pd.DataFrame:
     """
-    Fetch all child issues for a given parent issue (issuekey) via Jira Cloud REST v3,
-    and return a DataFrame with the fields used by the report.
+    Read all child issues of a given parent issue (issuekey) from the session's IssueTree
+    (fetched via Jira Cloud REST v3 on first use) and return a DataFrame with the fields used by the report.
+    Pass `tree` (e.g. a loaded jira_tree_files snapshot) to build the report without Jira.
 
     Columns: Id, Name, Due Date, Start Date, Status, Owner, Ext.Owner, Issue Type
     """
-    # Collect children keys using the v3 helper
-    jira_issues: List[str] = get_children_issues_for_report(client, issuekey)
-
-    if not jira_issues:
+    if tree is None:
+        tree = get_issue_tree(client, issuekey)
+    if not tree.keys():
         st.warning(f'The selected project: {issuekey} has no children issues. Choose another project.')
-        return pd.DataFrame(columns=["Id", "Name", "Due Date", "Start Date", "Status", "Owner", "Ext.Owner", "Issue Type"])
-
-    issue_data: List[Dict[str, Any]] = []
-
-    # Fields we need in one call
-    wanted_fields = [
-        "summary",
-        "issuetype",
-        "duedate",
-        "customfield_10015",   # Start Date
-        "status",
-        "assignee",
-        "customfield_10127",   # Ext.Owner (adjust if different in your site)
-    ]
-
-    for key in jira_issues:
-        try:
-            issue = client.get_issue(key, fields=wanted_fields)
-            f = issue.get("fields", {}) or {}
-
-            name = f.get("summary")
-            issuetype = (f.get("issuetype") or {}).get("name")
-            duedate = f.get("duedate")
-            start_date = f.get("customfield_10015")
-            status = (f.get("status") or {}).get("name")
-            assignee = f.get("assignee") or {}
-            owner = assignee.get("displayName")
-            ext_owner = _option_value(f.get("customfield_10127"))
-
-            issue_data.append(
-                {
-                    "Id": key,
-                    "Name": name,
-                    "Due Date": duedate,
-                    "Start Date": start_date,
-                    "Status": status,
-                    "Owner": owner,
-                    "Ext.Owner": ext_owner,
-                    "Issue Type": issuetype,
-                }
-            )
-        except Exception as e:
-            st.warning(f"Error fetching data for issue {key}: {e}")
-
-    # Build DataFrame
-    df = pd.DataFrame(issue_data, columns=["Id", "Name", "Due Date", "Start Date", "Status", "Owner", "Ext.Owner", "Issue Type"])
+        return ReportFrameBuilder().frame()
 
-    # Normalize date columns (keep date only)
-    if not df.empty:
-        if "Due Date" in df.columns:
-            df["Due Date"] = pd.to_datetime(df["Due Date"], errors="coerce").dt.date
-        if "Start Date" in df.columns:
-            df["Start Date"] = pd.to_datetime(df["Start Date"], errors="coerce").dt.date
+    # columnar build: categorical labels, datetime64 dates (see modules/report_frame.py);
+    # rows depth first so every Epic is followed by its own Tasks and Sub-tasks
+    builder = ReportFrameBuilder()
+    for key in tree.preorder():
+        builder.add(key, tree.nodes[key].fields)
+    df = builder.frame()
 
     # Cache in session (if you rely on it elsewhere)
     st.session_state["df"] = df
@@ -534,6 +442,65 @@ def create_report_dataframe(client: JiraV3, issuekey: str) -> pd.DataFrame:
     return df
 
 
+def get_project_status_names(client: JiraV3, project_key: str) -> List[str]:
+    """
+    Status names used by any issue type of the board (cached /project/{key}/statuses).
+    """
+    names = {s["name"] for it in client.project_statuses(project_key) for s in it.get("statuses", []) if s.get("name")}
+    return sorted(names)
+
+
+def report_filter_jql(board_key: str, issue_type=None, statuses=None, days=None, owner_ids=None,
+                      selected_rows=None) -> Optional[str]:
+    """
+    The CreateReport filters as a JQL restriction (generate_jql), so that only matching issues
+    are downloaded. Owners are accountIds (get_users_from_jira_project); None without filters.
+    """
+    extra = []
+    if owner_ids:
+        extra.append("assignee in (" + ",".join(f'"{a}"' for a in owner_ids) + ")")
+    if selected_rows:
+        extra.append("key in (" + ",".join(f'"{k}"' for k in selected_rows) + ")")
+    if not (issue_type or statuses or days or extra):
+        return None
+    return generate_jql(board_key, issue_type, statuses, None, None, days, " AND ".join(extra))
+
+
+def _report_containers(issue_type) -> Optional[str]:
+    """
+    JQL for the issues whose children can still match an issue type filter:
+    Sub-tasks (or no type filter) need every standard issue, Tasks & co. only Epics,
+    Epics nothing (they sit directly below the Project).
+    """
+    wanted = {t.lower() for t in (issue_type or [])}
+    if not wanted or JIRA_SUBTASK_ISSUE_TYPE.lower() in wanted:
+        return "issuetype in standardIssueTypes()"
+    if wanted - {JIRA_EPIC_ISSUE_TYPE.lower()}:
+        return f'issuetype = "{JIRA_EPIC_ISSUE_TYPE}"'
+    return None
+
+
+def create_filtered_report_dataframe(client: JiraV3, issuekey: str, board_key: str, issue_type=None, statuses=None,
+                                     days=None, owner_ids=None, selected_rows=None) -> pd.DataFrame:
+    """
+    Like create_report_dataframe, but the filters are pushed into the per-level child searches
+    (iter_filtered_descendants): only matching issues are downloaded with the report fields,
+    the branches above them with just their issue type and parent. Rows come depth first, as in
+    create_report_dataframe. Without filters, the whole tree is read.
+    """
+    where = report_filter_jql(board_key, issue_type, statuses, days, owner_ids, selected_rows)
+    if where is None:
+        return create_report_dataframe(client, issuekey)
+    builder = ReportFrameBuilder().add_issues(
+        iter_filtered_descendants(client, issuekey, where, _report_containers(issue_type), fields=REPORT_FIELDS)
+    )
+    if not len(builder):
+        st.warning(f'No issues below {issuekey} match the selected filters.')
+    df = builder.frame()
+    st.session_state["df"] = df
+    return df
+
+
 def filter_dataframe(df, issue_type=None, statuses=None, days=None, owner_list=None,selected_rows=None):
     """
     Dynamically filters the DataFrame based on the provided conditions.
@@ -549,33 +516,17 @@ def filter_dataframe(df, issue_type=None, statuses=None, days=None, owner_list=N
     Returns:
     - filtered_df (DataFrame): The filtered DataFrame.
     """
-    # Start with a filter that includes all rows
-    filter_condition = pd.Series([True] * len(df))
-
-    # Filter by issue type
-    if issue_type:
-        filter_condition &= df['Issue Type'].isin(issue_type)
-
-    # Filter by statuses
-    if statuses:
-        filter_condition &= df['Status'].isin(statuses)
-
-    # Filter by Due Date if 'days' is provided
-    if days is not None and days > 0:
-        today = datetime.now().date()
-        date_from_today = today + timedelta(days=days)
-        filter_condition &= (df['Due Date'].notna()) & (df['Due Date'] >= today) & (df['Due Date'] <= date_from_today)
-
-    # Filter by owner list
-    if owner_list:
-        filter_condition &= df['Owner'].isin(owner_list)
-    
-    # Filter by Id selected by User
-    if selected_rows:
-        filter_condition &= df['Id'].isin(selected_rows)
-
-    # Apply the filter to the DataFrame
-    filtered_df = df[filter_condition]
+    # Bitmap index of this frame (built on the first call, memoized per filter combination);
+    # rows are selected by position, so sliced / re-indexed frames filter correctly too
+    positions = filter_index_for(df).select(
+        issue_type=issue_type,
+        statuses=statuses,
+        days=days,
+        owner_list=owner_list,
+        selected_rows=selected_rows,
+        today=datetime.now().date(),
+    )
+    filtered_df = df.iloc[positions]
 
     return filtered_df
 
@@ -584,12 +535,7 @@ def get_users_from_jira_project(client: JiraV3, project_key: str, max_results: i
     """
     Return list of assignable users (accountId + displayName).
     """
-    import requests
-    url = f"{client.base_url}/rest/api/3/user/assignable/search"
-    params = {"project": project_key, "maxResults": max_results}
-    r = requests.get(url, headers=client._auth_header, params=params, timeout=client.timeout)
-    r.raise_for_status()
-    users = r.json() or []
+    users = client.find_assignable_users(project_key, max_results=max_results)
     return [
         {
             "accountId": u.get("accountId"),
@@ -603,61 +549,61 @@ def get_users_from_jira_project(client: JiraV3, project_key: str, max_results: i
 
 
 ### fast fetching of all children issues of a given jira parent issue
-def get_children_issues_for_report(client: JiraV3, issue_key: str) -> List[str]:
+def iter_children_issues_for_report(client: JiraV3, issue_key: str, max_depth: int = 3,
+                                    plan: Optional[Dict[str, Any]] = None) -> Iterator[str]:
     """
-    Fast fetching of all children issues for a given parent issue (Cloud v3).
-    - Direct children: JQL parent = "<issue_key>"
-    - If a child is an Epic, fetch its children: parent = "<epic_key>"
-    - For standard issues (Task/Story/Bug/etc.), fetch subtasks: parent = "<issue_key>"
-    Returns a flat list of keys (unique, order preserved).
+    All descendants of a parent issue (Cloud v3), unique keys in level order.
+    Walks level by level or scans the project, whichever `plan` (see
+    jira_hierarchy.plan_tree_fetch, computed when omitted) expects to be cheaper.
     """
-    if not issue_key:
-        return []
-
-    collected: "OrderedDict[str, None]" = OrderedDict()
+    return iter_descendant_keys(client, issue_key, max_depth=max_depth, plan=plan)
 
-    def _add_key(k: str):
-        if k and k not in collected:
-            collected[k] = None
 
-    # 1) Direct children of the given parent
-    jql_direct = f'parent = "{issue_key}" ORDER BY created ASC'
-    direct_children: List[Dict] = client.search_jql_all(
-        jql_direct,
-        fields=["key", "issuetype", "subtasks"]
-    )
+def get_children_issues_for_report(client: JiraV3, issue_key: str,
+                                   plan: Optional[Dict[str, Any]] = None) -> List[str]:
+    """Flat list of all keys yielded by iter_children_issues_for_report (unique, order preserved)."""
+    return list(iter_children_issues_for_report(client, issue_key, plan=plan))
 
-    for child in direct_children:
-        ckey = child.get("key")
-        _add_key(ckey)
+def get_issue_tree(client: JiraV3, root_key: str, refresh: bool = False) -> IssueTree:
+    """
+    IssueTree of a Project issue from the process-wide snapshot cache (jira_snapshots):
+    built once, then kept current with delta refreshes; shared by the report, time report,
+    delete and clone pages. refresh=True brings it up to date before returning.
+    Boards listed in JIRA_MIRROR_BOARDS are read from the local mirror while it is fresh.
+    """
+    if not refresh:
+        mirrored = mirrored_tree(root_key)
+        if mirrored is not None:
+            return mirrored
+    started = time.time()
+    tree = SNAPSHOTS.get(client, root_key, refresh=refresh)
+    if tree.built_at >= started:
+        plan = tree.plan or {}
+        st.caption(f"Fetch plan: {plan.get('strategy')} (~{plan.get('expected_requests') or '?'} requests). {plan.get('reason', '')}")
+    return tree
 
-        itype = (child.get("fields", {}).get("issuetype") or {}).get("name", "").lower()
 
-        # 2) If the child is an Epic, fetch all of its direct children (Cloud now uses parent=<EPIC>)
-        if itype == "epic":
-            jql_epic_children = f'parent = "{ckey}" ORDER BY created ASC'
-            epic_children = client.search_jql_all(
-                jql_epic_children,
-                fields=["key", "issuetype", "subtasks"]
-            )
-            for ec in epic_children:
-                eckey = ec.get("key")
-                _add_key(eckey)
+def drop_issue_tree(root_key: Optional[str] = None) -> None:
+    """Forget the cached IssueTree of `root_key` (all trees when None) after Jira was changed."""
+    SNAPSHOTS.invalidate(root_key)
 
-                # 3) For each epic child (usually Task/Story/Bug), fetch their subtasks
-                jql_subtasks = f'parent = "{eckey}" ORDER BY created ASC'
-                subtasks = client.search_jql_all(jql_subtasks, fields=["key"])
-                for st in subtasks:
-                    _add_key(st.get("key"))
 
-        else:
-            # 4) For non-epic children, pull their subtasks
-            jql_subtasks = f'parent = "{ckey}" ORDER BY created ASC'
-            subtasks = client.search_jql_all(jql_subtasks, fields=["key"])
-            for st in subtasks:
-                _add_key(st.get("key"))
+def _delete_issues(client: JiraV3, keys: List[str]) -> Dict[str, Optional[BaseException]]:
+    """
+    Delete `keys` concurrently on the async client's event loop (serially without aiohttp).
+    Returns {key: None | exception}.
+    """
+    if async_available():
+        return async_twin(client).delete_issues(keys, delete_subtasks=True)
+    results: Dict[str, Optional[BaseException]] = {}
+    for key in keys:
+        try:
+            client.delete_issue(key, delete_subtasks=True)
+            results[key] = None
+        except Exception as e:
+            results[key] = e
+    return results
 
-    return list(collected.keys())
 
 def delete_jira_issue(client: JiraV3, parent_issue_key: str) -> None:
     """
@@ -668,16 +614,32 @@ def delete_jira_issue(client: JiraV3, parent_issue_key: str) -> None:
         return
 
     try:
-        # 1) collect all children (epic children, tasks, subtasks)
-        children: List[str] = get_children_issues_for_report(client, parent_issue_key) or []
-
-        # 2) delete children first (reverse for safety)
-        for key in reversed(children):
-            try:
-                client.delete_issue(key, delete_subtasks=True)
-                st.write(f"Deleted child issue: {key}")
-            except Exception as e:
-                st.warning(f"Could not delete child issue {key}: {e}")
+        # 1) collect all children (epic children, tasks, subtasks); refreshed first, since a
+        #    stale tree would orphan issues created after it was synced
+        tree = get_issue_tree(client, parent_issue_key, refresh=True)
+        children: List[str] = tree.keys()
+
+        # 2) delete children deepest level first; one level is one concurrent batch
+        #    (no issue in a batch is an ancestor of another one)
+        levels: Dict[str, int] = {parent_issue_key: 0}
+
+        def _level(key: str) -> int:
+            if key not in levels:
+                node = tree.nodes.get(key)
+                levels[key] = _level(node.parent) + 1 if node is not None and node.parent else 1
+            return levels[key]
+
+        for key in children:
+            _level(key)
+        levels.pop(parent_issue_key)
+        batches = [[k for k in reversed(children) if levels[k] == depth]
+                   for depth in sorted(set(levels.values()), reverse=True)]
+        for batch in batches:
+            for key, err in _delete_issues(client, batch).items():
+                if err is None:
+                    st.write(f"Deleted child issue: {key}")
+                else:
+                    st.warning(f"Could not delete child issue {key}: {err}")
 
         # 3) delete the parent last
         try:
@@ -688,6 +650,9 @@ def delete_jira_issue(client: JiraV3, parent_issue_key: str) -> None:
 
     except Exception as e:
         st.warning(f"Delete flow failed for {parent_issue_key}: {e}")
+    finally:
+        # other cached trees drop the deleted keys with their next delta refresh (membership re-check)
+        drop_issue_tree(parent_issue_key)
 
 def create_jira_issue(summary, issue_type, start_date=None, due_date=None, parent_key=None, description_key=None):
     issue_dict = {
@@ -714,7 +679,8 @@ def create_jira_issue(summary, issue_type, start_date=None, due_date=None, paren
 
     return issue_dict
 
-def normalize_date(d: Optional[date]) -> Optional[str]:
+def format_iso_date(d: Optional[date]) -> Optional[str]:
+    """date / datetime -> "YYYY-MM-DD"; Excel cell values go through utils.normalize_date instead."""
     if not d:
         return None
     if isinstance(d, datetime):
@@ -745,173 +711,196 @@ def create_jira_issue_ticket_template(
     if parent_key:
         fields["parent"] = {"key": parent_key}
 
-    start_date_normalized = normalize_date(start_date)
+    start_date_normalized = format_iso_date(start_date)
     if start_date_normalized:
         fields["customfield_10015"] = start_date_normalized
 
-    due_date_normalized = normalize_date(due_date)
+    due_date_normalized = format_iso_date(due_date)
     if due_date_normalized:
         fields["duedate"] = due_date_normalized
 
     return fields
 
 # Get the Jira Issue Key - ( search by using the summary)
-def get_issue_key(jira, summary):
+def get_issue_key(client: JiraV3, summary):
     # Find the issue key using the summary
-    issues = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{summary}"', maxResults=1)
-    return issues[0].key if issues else None
+    jql = f'project = "{get_jira_project_key()}" AND summary ~ "{summary}"'
+    issues = client.search_jql(jql, fields=["key"], max_results=1).get("issues", [])
+    return issues[0]["key"] if issues else None
 
 # Add Links between Issues Blocking and Blocked
-def add_issue_links(jira, excel_data):
-    for index, row in excel_data.iterrows():
-        issue_type = row['IssueType']
-        link1_key = row.get('SummaryName')
-        blocks = normalize_NaN(row.get('Blocks'))
+def _phrase(text: str) -> str:
+    """`summary ~` phrase query term for `text` (backslashes escaped; quotes dropped, matching is local)."""
+    escaped = text.replace("\\", "\\\\").replace('"', " ")
+    return f'summary ~ "\\"{escaped}\\""'
 
-        # Add issue links if link1 is provided
-        if link1_key and blocks:
-            link1_key_normalized = get_issue_key(jira, link1_key)
-            if link1_key_normalized:
-                # Split the blocks into a list of individual issue keys
-                blocks_list = [block.strip() for block in blocks.split(',')]
-                
-                for block_key in blocks_list:
-                    link2_key_normalized = get_issue_key(jira, block_key)
-                    if link2_key_normalized:
-                        jira.create_issue_link(
-                            type="blocks",
-                            inwardIssue=link1_key_normalized,
-                            outwardIssue=link2_key_normalized
-                        )
-                    else:
-                        st.write(f"Link2 issue '{block_key}' not found. Skipping link creation.")
-            else:
-                st.write(f"Link1 issue '{link1_key}' not found. Skipping link creation.")
 
-def create_issues_from_excel(jira, excel_data,project_startdate):
-    # Returns a List of Issues with start and enddates
+def _summary_index(client: JiraV3, names: List[str], chunk_size: int = 40,
+                   where: Optional[str] = None) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    {name (lower case): [(key, summary), ...] created ASC} for the board issues whose summary
+    contains `name` as a phrase; one `summary ~` OR-query per chunk of names, chunks in parallel.
+    `where` is AND-ed to every query (e.g. 'issuetype = Epic').
+    """
+    chunks = [names[i:i + chunk_size] for i in range(0, len(names), chunk_size)]
+
+    def _search(chunk: List[str]) -> List[Dict[str, Any]]:
+        terms = " OR ".join(_phrase(n) for n in chunk)
+        extra = f" AND {where}" if where else ""
+        jql = f'project = "{get_jira_project_key()}" AND ({terms}){extra} ORDER BY created ASC'
+        return client.search_jql_all(jql, fields=["summary", "created"])
+
+    found: Dict[str, Dict[str, Any]] = {}
+    for issues in map_in_order(_search, chunks):
+        for issue in issues:
+            found.setdefault(issue["key"], issue)
+    hits = sorted(found.values(), key=lambda i: ((i.get("fields") or {}).get("created") or ""))
+
+    index: Dict[str, List[Tuple[str, str]]] = {}
+    for name in names:
+        lowered = name.lower()
+        index[lowered] = [(i["key"], (i.get("fields") or {}).get("summary") or "") for i in hits
+                          if lowered in ((i.get("fields") or {}).get("summary") or "").lower()]
+    return index
+
+
+def _resolve_summary(index: Dict[str, List[Tuple[str, str]]], name: str) -> Optional[str]:
+    """Issue with exactly this summary (case-insensitive), else the oldest one containing it."""
+    candidates = index.get(name.lower()) or []
+    for key, summary in candidates:
+        if summary.strip().lower() == name.lower():
+            return key
+    return candidates[0][0] if candidates else None
+
+
+def add_issue_links(client: JiraV3, excel_data):
+    """
+    Create the "Blocks" links listed in the blueprint (SummaryName blocks each of Blocks).
 
-    dates=compute_dates(excel_data, project_startdate)
-    # Iterate through rows and create Jira issues and subtasks
+    Only the summaries named in the sheet are searched: one `summary ~ "<phrase>"` OR-query per
+    40 names instead of one search per link end. Each name resolves to the issue with exactly that
+    summary (case-insensitive) or, failing that, to the oldest issue whose summary contains it.
+    The per-link `summary ~` search this replaces took whichever issue Jira ranked first, which
+    could pick a longer summary over the exact one.
+    """
+    pairs: List[Tuple[str, List[str]]] = []
     for index, row in excel_data.iterrows():
-        summary = row['Summary']
-        issue_type = row['IssueType']
-        parent_key = row.get('Parent')
-        start_date= None
-        due_date= None
-        # Get Start & End Dates 
-        start_date = getIssueDate(dates,summary,date_type='start_date')#row.get('StartDate')
-        due_date = getIssueDate(dates,summary,date_type='end_date')#row.get('StartDate')
-        description = normalize_NaN(row.get('Description'))
-
-        # Normalize the dates # can be deleted
-        start_date_normalized = normalize_date(start_date) if start_date else None
-        due_date_normalized = normalize_date(due_date) if due_date else None
-
-        # Check if parent_key is NaN
-        if isinstance(parent_key, float) and math.isnan(parent_key):
-            parent_key = None  # Set to None if NaN
-
-        ###### NEW START
-        if issue_type == JIRA_ACCOUNT_ISSUE_TYPE:
-            # Create only the Account issue
-            if parent_key is not None:
-                st.write("An Account can't have a parent. Skipping Account Issue creation.")
-            else:
-                
-                issue_dict = create_jira_issue(summary, JIRA_ACCOUNT_ISSUE_TYPE, start_date, due_date, description_key=description)
-                account_issue = jira.create_issue(fields=issue_dict)
-                st.write(f"Created Jira Issue Type Account: {account_issue.key} - Summary: {account_issue.fields.summary}")    
-
-        elif issue_type == JIRA_PROJECT_ISSUE_TYPE:
-            # Check if the issue has a parent issue
-            if parent_key is not None:
-                # Find parent issue using summary
-                parent_issue = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{parent_key}"', maxResults=1)
+        link1_key = normalize_NaN(row.get('SummaryName'))
+        blocks = normalize_NaN(row.get('Blocks'))
+        if link1_key and blocks:
+            # Split the blocks into a list of individual issue summaries
+            pairs.append((str(link1_key).strip(), [block.strip() for block in str(blocks).split(',') if block.strip()]))
+    if not pairs:
+        return
 
-                if parent_issue:
-                    parent_key = parent_issue[0].key
-                    issue_dict = create_jira_issue(summary, JIRA_PROJECT_ISSUE_TYPE, start_date, due_date, parent_key,description)
-                    project_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira Issue Type Project: {project_issue.key} - Summary: {project_issue.fields.summary}, Linked to parent: {parent_key}")
+    names = list(dict.fromkeys(n for link1, blocks_list in pairs for n in [link1] + blocks_list))
+    key_by_summary = _summary_index(client, names)
 
+    for link1_key, blocks_list in pairs:
+        # Add issue links if link1 is provided
+        link1_key_normalized = _resolve_summary(key_by_summary, link1_key)
+        if link1_key_normalized:
+            for block_key in blocks_list:
+                link2_key_normalized = _resolve_summary(key_by_summary, block_key)
+                if link2_key_normalized:
+                    client.create_issue_link("Blocks", inward_key=link1_key_normalized, outward_key=link2_key_normalized)
                 else:
-                    st.write(f"Parent issue '{parent_key}' not found. Skipping task creation.")
-            else:
-                # Check if an Account Issue as parent was selected 
-                if st.session_state['jira_issue_type_account'] and st.session_state['jira_issue_type_account'] != "No_Parent":
-                    parent_key = st.session_state['jira_issue_type_account']
-                    issue_dict = create_jira_issue(summary, JIRA_PROJECT_ISSUE_TYPE, start_date, due_date, parent_key,description)
-                    project_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira Issue Type Project: {project_issue.key} - Summary: {project_issue.fields.summary}, Linked to parent: {parent_key}")
-                else: 
-                    # Create task on its own without adding an Issue Type "Account" to the Issue
-                    issue_dict = create_jira_issue(summary, JIRA_PROJECT_ISSUE_TYPE, start_date, due_date, description_key=description)
-                    project_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira Issue Type Project: {project_issue.key} - Summary: {project_issue.fields.summary}")
-
-        elif issue_type == JIRA_EPIC_ISSUE_TYPE:
-            # Check if the issue has a parent issue 
-            if parent_key is not None:
-                # Find parent issue using summary
-                parent_issue = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{parent_key}"', maxResults=1)
+                    st.write(f"Link2 issue '{block_key}' not found. Skipping link creation.")
+        else:
+            st.write(f"Link1 issue '{link1_key}' not found. Skipping link creation.")
 
-                if parent_issue:
-                    parent_key = parent_issue[0].key
-                    issue_dict = create_jira_issue(summary, JIRA_EPIC_ISSUE_TYPE, start_date_normalized, due_date_normalized, parent_key,description)
-                    epic_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira Issue Type Epic: {epic_issue.key} - Summary: {epic_issue.fields.summary}, Linked to parent: {parent_key}")
+# blueprint rows are created level by level; a row's parent (by summary) must have this issue type
+# (None: any type), and Account / Sub-task rows have no optional parent
+_BLUEPRINT_LEVELS = [
+    (JIRA_ACCOUNT_ISSUE_TYPE, None),
+    (JIRA_PROJECT_ISSUE_TYPE, None),
+    (JIRA_EPIC_ISSUE_TYPE, None),
+    (JIRA_TASK_ISSUE_TYPE, JIRA_EPIC_ISSUE_TYPE),
+    (JIRA_SUBTASK_ISSUE_TYPE, JIRA_TASK_ISSUE_TYPE),
+]
 
-                else:
-                    st.write(f"Parent issue '{parent_key}' not found. Skipping task creation.")
-            else:
-                # Create task on its own
-                issue_dict = create_jira_issue(summary, JIRA_EPIC_ISSUE_TYPE, start_date_normalized, due_date_normalized, description_key=description)
-                epic_issue = jira.create_issue(fields=issue_dict)
-                st.write(f"Created Jira Issue Type Epic: {epic_issue.key} - Summary: {epic_issue.fields.summary}")
-        
-
-        elif issue_type == JIRA_TASK_ISSUE_TYPE:
-            # Check if the task has a parent issue
-            if parent_key is not None:
-                # Find parent issue using summary
-                parent_issue = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{parent_key}" AND issuetype = {JIRA_EPIC_ISSUE_TYPE}', maxResults=1)
-                if parent_issue:
-                    parent_key = parent_issue[0].key
-                    issue_dict = create_jira_issue(summary, JIRA_TASK_ISSUE_TYPE, start_date_normalized, due_date_normalized, parent_key,description)
-                    task_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira task: {task_issue.key} - Summary: {task_issue.fields.summary}, Linked to parent: {parent_key}")
 
-                else:
-                    st.write(f"Parent issue '{parent_key}' not found. Skipping task creation.")
+def create_issues_from_excel(client: JiraV3, excel_data, project_startdate):
+    """
+    Create the issues of a blueprint sheet (Summary, IssueType, Parent = parent summary, Description)
+    level by level: Accounts, Projects, Epics, Tasks, Sub-tasks. Each level is one
+    POST /rest/api/3/issue/bulk (50 per call) instead of one create per row.
+    Parents resolve to the issue of the required type created earlier in this run, else to the
+    board issue found by a batched `summary ~` search (see _summary_index).
+    Then the "Blocks" links are added and, if the user gave a project name, the Project is renamed.
+    """
+    # Returns a List of Issues with start and enddates
+    dates = compute_dates(excel_data, project_startdate)
+    # (issue type, summary) -> key of the issues created by this run
+    created: Dict[Tuple[str, str], str] = {}
+    project_issue_key = None
+
+    for issue_type, parent_type in _BLUEPRINT_LEVELS:
+        rows = []
+        for index, row in excel_data.iterrows():
+            if row['IssueType'] != issue_type:
+                continue
+            parent = normalize_NaN(row.get('Parent'))
+            if issue_type == JIRA_ACCOUNT_ISSUE_TYPE and parent:
+                st.write("An Account can't have a parent. Skipping Account Issue creation.")
+            elif issue_type == JIRA_SUBTASK_ISSUE_TYPE and not parent:
+                st.write("A Sub-task must have a parent. Skipping subtask creation.")
             else:
-                # Create task on its own
-                issue_dict = create_jira_issue(summary, JIRA_TASK_ISSUE_TYPE, start_date_normalized, due_date_normalized, description_key=description)
-                task_issue = jira.create_issue(fields=issue_dict)
-                st.write(f"Created Jira task: {task_issue.key} - Summary: {task_issue.fields.summary}")
-                
-        elif issue_type == JIRA_SUBTASK_ISSUE_TYPE:
-            # Check if the sub-task has a parent issue
-            if parent_key is not None:
-                # Find parent issue using summary
-                parent_issue = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{parent_key}" AND issuetype = {JIRA_TASK_ISSUE_TYPE}', maxResults=1)
-                if parent_issue:
-                    parent_key = parent_issue[0].key
-                    issue_dict = create_jira_issue(summary, JIRA_SUBTASK_ISSUE_TYPE, start_date_normalized, due_date_normalized, parent_key, description)
-                    subtask_issue = jira.create_issue(fields=issue_dict)
-                    st.write(f"Created Jira subtask: {subtask_issue.key} - Summary: {subtask_issue.fields.summary}, Linked to parent: {parent_key}")
-                else:
-                    st.write(f"Parent issue '{parent_key}' not found. Skipping subtask creation.")
+                rows.append((row, str(parent).strip() if parent else None))
+        if not rows:
+            continue
+
+        def _created_parent(name: str) -> Optional[str]:
+            if parent_type is not None:
+                return created.get((parent_type, name))
+            own = [k for (t, s), k in created.items() if s == name]
+            return own[-1] if own else None
+
+        # parents not created by this run: one batched search per level
+        missing = list(dict.fromkeys(p for _, p in rows if p and not _created_parent(p)))
+        where = f'issuetype = "{parent_type}"' if parent_type else None
+        found = _summary_index(client, missing, where=where) if missing else {}
+
+        payloads, pending = [], []
+        for row, parent in rows:
+            summary = row['Summary']
+            if parent:
+                parent_key = _created_parent(parent) or _resolve_summary(found, parent)
+                if not parent_key:
+                    st.write(f"Parent issue '{parent}' not found. Skipping {issue_type} creation.")
+                    continue
+            elif issue_type == JIRA_PROJECT_ISSUE_TYPE and st.session_state['jira_issue_type_account'] \
+                    and st.session_state['jira_issue_type_account'] != "No_Parent":
+                # Account Issue selected as parent of the Project
+                parent_key = st.session_state['jira_issue_type_account']
             else:
-                st.write("A Sub-task must have a parent. Skipping subtask creation.")
+                parent_key = None
+            # Get Start & End Dates
+            start_date = getIssueDate(dates, summary, date_type='start_date')
+            due_date = getIssueDate(dates, summary, date_type='end_date')
+            description = normalize_NaN(row.get('Description'))
+            fields = create_jira_issue(summary, issue_type, start_date, due_date, parent_key, description)
+            if description:
+                fields['description'] = _text_adf(description)
+            payloads.append(fields)
+            pending.append((summary, parent_key))
+
+        for (summary, parent_key), res in zip(pending, client.create_issues_bulk(payloads)):
+            if "key" not in res:
+                st.write(f"Failed to create Jira Issue Type {issue_type} '{summary}': {res.get('error')}")
+                continue
+            created[(issue_type, summary)] = res["key"]
+            if issue_type == JIRA_PROJECT_ISSUE_TYPE:
+                project_issue_key = res["key"]
+            linked = f", Linked to parent: {parent_key}" if parent_key else ""
+            st.write(f"Created Jira Issue Type {issue_type}: {res['key']} - Summary: {summary}{linked}")
 
     # Add issue links after all issues are created
-    add_issue_links(jira, excel_data)
+    add_issue_links(client, excel_data)
 
     # Update Jira Issue type Project if user provided project name
-    if st.session_state['project_name_user']:
-        issue=jira.issue(project_issue.key)
-        issue.update(summary=st.session_state['project_name_user'])
+    if st.session_state['project_name_user'] and project_issue_key:
+        client.update_issue_fields(project_issue_key, {"summary": st.session_state['project_name_user']})
     return
 
 def update_issue_overview_sheet(excel_data, issue_data):
@@ -926,112 +915,156 @@ def update_issue_overview_sheet(excel_data, issue_data):
 
 
 
-def get_issues_from_jira(jira):
-    # Query issues from Jira
-    issues = jira.search_issues(f'project={get_jira_project_key()}', maxResults=None)
-    
-    # Extract relevant information for the "IssueOverview" sheet
+def _adf_text(node: Any) -> Optional[str]:
+    """Plain text of an ADF document (v3 rich-text fields); strings pass through."""
+    if node is None or isinstance(node, str):
+        return node
+    if isinstance(node, list):
+        return "".join(_adf_text(n) or "" for n in node)
+    if isinstance(node, dict):
+        if node.get("type") == "text":
+            return node.get("text", "")
+        text = _adf_text(node.get("content") or [])
+        return text + "\n" if node.get("type") == "paragraph" else text
+    return str(node)
+
+
+def _text_adf(text: str) -> Dict[str, Any]:
+    """Single-paragraph ADF document for a plain-text description (v3 rejects plain strings)."""
+    return {"type": "doc", "version": 1,
+            "content": [{"type": "paragraph", "content": [{"type": "text", "text": str(text)}]}]}
+
+
+ISSUE_OVERVIEW_FIELDS = [
+    "summary", "parent", "issuelinks", "issuetype", "status", "customfield_10015",
+    "duedate", "description", "assignee", "customfield_10127",
+]
+
+
+def get_issues_from_jira(client: JiraV3) -> List[Dict[str, Any]]:
+    """
+    Rows of the "IssueOverview" sheet for every issue of the selected board (paged v3 search,
+    ISSUE_OVERVIEW_FIELDS only). Parent and linked-issue summaries come embedded in the
+    search response, so no per-issue reads are needed.
+    """
+    issues = client.search_jql_all(f'project = "{get_jira_project_key()}" ORDER BY created ASC',
+                                   fields=ISSUE_OVERVIEW_FIELDS)
+
     issue_data = []
-    
     for issue in issues:
-        # Extract information about parent issue if exists
-        parent_summary = issue.fields.parent.fields.summary if hasattr(issue.fields, 'parent') and issue.fields.parent else None
-        
+        f = issue.get("fields") or {}
+        parent_summary = ((f.get("parent") or {}).get("fields") or {}).get("summary")
+
         # Extract information about issue links
         issue_links = []
-        for link in issue.fields.issuelinks:
-            if hasattr(link, 'inwardIssue') and hasattr(link.inwardIssue.fields, 'summary'):
+        for link in f.get("issuelinks") or []:
+            link_type = link.get("type") or {}
+            if (link.get("inwardIssue") or {}).get("fields", {}).get("summary"):
                 issue_links.append({
-                    'LinkType': link.type.inward,
-                    'LinkedIssueSummary': link.inwardIssue.fields.summary
-                    #'LinkedIssueKey': link.inwardIssue.key
+                    'LinkType': link_type.get("inward"),
+                    'LinkedIssueSummary': link["inwardIssue"]["fields"]["summary"],
                 })
-            elif hasattr(link, 'outwardIssue') and hasattr(link.outwardIssue.fields, 'summary'):
+            elif (link.get("outwardIssue") or {}).get("fields", {}).get("summary"):
                 issue_links.append({
-                    'LinkType': link.type.outward,
-                    'LinkedIssueSummary': link.outwardIssue.fields.summary
-                    #'LinkedIssueKey': link.outwardIssue.key
-
+                    'LinkType': link_type.get("outward"),
+                    'LinkedIssueSummary': link["outwardIssue"]["fields"]["summary"],
                 })
-        
-        assignee = issue.fields.assignee if issue.fields.assignee else None
-        
-        issue_info = {
-            'Summary': issue.fields.summary,
-            'IssueKey': issue.key,
+
+        issue_data.append({
+            'Summary': f.get("summary"),
+            'IssueKey': issue.get("key"),
             'ParentSummary': parent_summary,
-            'IssueType': issue.fields.issuetype.name,
-            'Status': issue.fields.status.name,
-            'StartDate': issue.fields.customfield_10015,
-            'DueDate': issue.fields.duedate,
-            'Description': issue.fields.description,
-            'Assignee': issue.fields.assignee,
-            'ExternalAssignee': issue.fields.customfield_10127,
-            'IssueLinks': issue_links
-        }
-        
-        issue_info.update(issue_links)
-        issue_data.append(issue_info)
+            'IssueType': (f.get("issuetype") or {}).get("name"),
+            'Status': (f.get("status") or {}).get("name"),
+            'StartDate': f.get("customfield_10015"),
+            'DueDate': f.get("duedate"),
+            'Description': _adf_text(f.get("description")),
+            'Assignee': (f.get("assignee") or {}).get("displayName"),
+            'ExternalAssignee': _option_value(f.get("customfield_10127")),
+            'IssueLinks': issue_links,
+        })
 
     return issue_data
 
 
+def _option_field(value: Any) -> Optional[Dict[str, str]]:
+    """Sheet value -> select-list payload {"value": ...} (None clears the field)."""
+    value = normalize_NaN(value)
+    return {"value": str(value)} if value else None
+
+
 # Function to update Jira issues with status, start date, and due date comparison
-def update_jira_issues(jira, excel_data):
+def update_jira_issues(client: JiraV3, excel_data: pd.DataFrame) -> None:
+    """
+    Apply the Excel rows to Jira: rows with an IssueKey update that issue when status, dates or
+    Ext.Owner differ; rows without one create a new issue under the parent named in ParentSummary.
+    Existing issues are read up front with one bulk fetch per 100 keys; parent lookups by
+    summary are searched once per distinct name.
+    """
+    keys = [normalize_NaN(k) for k in excel_data['IssueKey']]
+    keys = list(dict.fromkeys(k for k in keys if k))
+    try:
+        existing = {i["key"]: i.get("fields") or {} for i in client.get_issues_bulk(
+            keys, fields=["status", "customfield_10015", "duedate", "customfield_10127"])}
+    except Exception as e:
+        st.write(f"Error reading issues from Jira: {e}")
+        return
+    uses_ext_owner = any(f.get("customfield_10127") for f in existing.values())
+
+    parents: Dict[str, Optional[str]] = {}
+
+    def _parent_key(summary: str) -> Optional[str]:
+        if summary not in parents:
+            found = client.search_jql(
+                f'project = "{get_jira_project_key()}" AND summary ~ "{summary}"', fields=["key"], max_results=1
+            ).get("issues", [])
+            parents[summary] = found[0]["key"] if found else None
+        return parents[summary]
+
     for index, row in excel_data.iterrows():
         issue_key = row['IssueKey']
         new_status = row.get('Status')
         issue_key_checked = normalize_NaN(issue_key)
-        
+
         if issue_key_checked and new_status:
             try:
-                existing_issue = jira.issue(issue_key)
+                fields = existing.get(issue_key)
+                if fields is None:
+                    raise ValueError("issue not found or not visible")
                 # Check if status, start date, or due date is different
                 if (
-                    new_status != existing_issue.fields.status.name
-                    or normalize_date(row['StartDate']) != existing_issue.fields.customfield_10015
-                    or normalize_date(row['DueDate']) != existing_issue.fields.duedate
-                    #or row['Description'] != existing_issue.fields.description
+                    new_status != (fields.get("status") or {}).get("name")
+                    or normalize_date(row['StartDate']) != fields.get("customfield_10015")
+                    or normalize_date(row['DueDate']) != fields.get("duedate")
                     # customfield_10127 is Other in Jira and used to assign an external User as an Owner of an Issue
-                    or (existing_issue.fields.customfield_10127 and row['ExternalAssignee'] != existing_issue.fields.customfield_10127)
+                    or (fields.get("customfield_10127") and row['ExternalAssignee'] != _option_value(fields.get("customfield_10127")))
                 ):
                     # Transition the issue to the new status
-                    transition_issue(jira, issue_key, new_status)
-                    
+                    transition_issue(client, issue_key, new_status)
+
                     # Update issue details
-                    if existing_issue.fields.customfield_10127:
-                        existing_issue.update(
-                            summary=row['Summary'],
-                            #description=row['Description'],
-                            customfield_10015=normalize_date(row['StartDate']),
-                            duedate=normalize_date(row['DueDate']),
-                            customfield_10127=row['ExternalAssignee']
-                        )
-                    else:
-                        existing_issue.update(
-                            summary=row['Summary'],
-                            #description=row['Description'],
-                            customfield_10015=normalize_date(row['StartDate']),
-                            duedate=normalize_date(row['DueDate']),
-                        )
+                    update = {
+                        "summary": row['Summary'],
+                        "customfield_10015": normalize_date(row['StartDate']),
+                        "duedate": normalize_date(row['DueDate']),
+                    }
+                    if fields.get("customfield_10127"):
+                        update["customfield_10127"] = _option_field(row['ExternalAssignee'])
+                    client.update_issue_fields(issue_key, update)
 
                     st.write(f"Updated Jira issue: {issue_key} - Summary: {row['Summary']}")
             except Exception as e:
                 st.write(f"Error updating issue {issue_key} in Jira: {e}")
 
         else:
-            parent_key=row['ParentSummary']
-            if parent_key is not None:
+            parent_key_id = None
+            parent_summary = normalize_NaN(row['ParentSummary'])
+            if parent_summary:
                 # Find parent issue using summary
-                parent_issue = jira.search_issues(f'project={get_jira_project_key()} AND summary~"{parent_key}"', maxResults=1)
-
-                if parent_issue:
-                    parent_key_id = parent_issue[0].key
-
+                parent_key_id = _parent_key(parent_summary)
                 #TO DO IMPLEMENT HANDLING FOR EPICs
-
-                else:
-                    st.write(f"Parent issue '{parent_key}' not found. Tasks can only be created if ParentName is provided. Skipping task creation.")
+                if not parent_key_id:
+                    st.write(f"Parent issue '{parent_summary}' not found. Tasks can only be created if ParentName is provided. Skipping task creation.")
 
             # Mandatory Input Values
             issue_dict = create_jira_issue(
@@ -1039,54 +1072,54 @@ def update_jira_issues(jira, excel_data):
                 issue_type=row['IssueType'],
                 parent_key=parent_key_id
             )
-            # Optional Input Values 
+            # Optional Input Values
             if normalize_NaN(row['StartDate']):
-                start_date_normalized = normalize_date(row['StartDate'])
-                issue_dict['customfield_10015'] = start_date_normalized
+                issue_dict['customfield_10015'] = normalize_date(row['StartDate'])
 
             if normalize_NaN(row['DueDate']):
-                due_date_normalized = normalize_date(row['DueDate'])
-                issue_dict['duedate'] = due_date_normalized
-    
+                issue_dict['duedate'] = normalize_date(row['DueDate'])
+
             if normalize_NaN(row['Description']):
-                issue_dict['description'] = row['Description']
-            
-            if normalize_NaN(row['ExternalAssignee']) and existing_issue.fields.customfield_10127:
-                issue_dict['customfield_10127'] = row['ExternalAssignee']
+                issue_dict['description'] = _text_adf(row['Description'])
+
+            # only when the sheet's issues already use Ext.Owner (as before the v3 port); the field
+            # is a select list, so the value is sent option-shaped
+            if normalize_NaN(row['ExternalAssignee']) and uses_ext_owner:
+                issue_dict['customfield_10127'] = _option_field(row['ExternalAssignee'])
+
+            try:
+                new_issue = client.create_issue(issue_dict)
+                st.write(f"Created Jira issue: {new_issue.get('key')} - Summary: {row['Summary']}")
+            except Exception as e:
+                st.write(f"Error creating issue '{row['Summary']}' in Jira: {e}")
 
-            new_issue = jira.create_issue(fields=issue_dict)
-            st.write(f"Created Jira issue: {new_issue.key} - Summary: {new_issue.fields.summary}")
-        
 
 # Function to transition Jira issue to a new status
-def transition_issue(jira, issue_key, new_status):
+def transition_issue(client: JiraV3, issue_key, new_status):
     # Get the transition ID based on the destination status
-    transition_id = get_transition_id(jira, issue_key, new_status)
-    
+    transition_id = get_transition_id(client, issue_key, new_status)
+
     if transition_id:
         # Perform the transition
-        jira.transition_issue(issue_key, transition_id)
+        client.transition_issue(issue_key, transition_id)
         st.write(f"Issue {issue_key} transitioned to status: {new_status}")
     else:
         st.write(f"Transition to status {new_status} failed. Transition from current status to {new_status} not allowed.")
 
 # Function to get the transition ID for a specific status
-def get_transition_id(jira, issue_key, target_status):
-    transitions = jira.transitions(issue_key)
-    for transition in transitions:
-        
-        if transition['to']['name'] == target_status:
-            return transition['id']
+def get_transition_id(client: JiraV3, issue_key, target_status):
+    for transition in client.list_transitions(issue_key):
+        if (transition.get('to') or {}).get('name') == target_status:
+            return transition.get('id')
     return None
-    
-def has_cf(jira):
-    # UPDATE the function as follows: use JQL to check if a specific project has a customfield
+
+def has_cf(client: JiraV3):
+    # Checks with one JQL whether the selected board uses the Ext.Owner customfield
 
     try:
-        # Get all custom fields from Jira
-        #fields = jira.search_issues(f'project={JIRA_PROJECT} AND "Other" is not EMPTY', maxResults=1)
-        fields = jira.search_issues(f'project={get_jira_project_key()} AND cf[10127] is not EMPTY', maxResults=1)
-        if fields: 
+        jql = f'project = "{get_jira_project_key()}" AND cf[10127] is not EMPTY'
+        fields = client.search_jql(jql, fields=["key"], max_results=1).get("issues")
+        if fields:
             st.write(f'CustomField is available in {get_jira_project_key()}')
             return True
         st.write(f'CustomField is not available in {get_jira_project_key()}')
@@ -1315,7 +1348,7 @@ def get_company_managed_projects_df(
     visible to the user, excluding EXCLUDED_BOARD_KEYS.
     Uses Jira Cloud REST v3 /project/search via JiraV3 (no python-jira).
     """
-    client = JiraV3(jira_url, username, password)
+    client = get_client(jira_url, username, password)
 
     projects: List[Dict] = client.project_search_all()  # paginated under the hood
     excluded = set(excluded_keys or EXCLUDED_BOARD_KEYS)
@@ -1329,45 +1362,43 @@ def get_company_managed_projects_df(
     return pd.DataFrame(data, columns=["Key", "Name"])
 
 
-# Function to retrieve all issues of a project that are relevant for updating the powerpoint timeline (gantt)
-def get_all_jira_issues_of_project(jira, parent_issue_key):
-    issue_data = []
+# Issue summaries (names) mapped onto the timeline slide - change them according to your needs
+TIMELINE_SUMMARIES = [
+    'Perform Technical Workshop',
+    'Perform Assessment Workshop',
+    'Perform Functional Workshop',
+    'User Training',
+    'Project Management',
+    'Assessment',
+    'Design',
+    'Machine Learning',
+    'Application Implementation',
+    'Integration Implementation',
+    'Testing',
+    'Delivery',
+]
 
-    # Change the names according to your needs - those are the issue summaries (names)
-    workshop_summaries_pilot= [
-    'Perform Technical Workshop', 
-    'Perform Assessment Workshop', 
-    'Perform Functional Workshop', 
-    'User Training', 
-    'Project Management', 
-    'Assessment', 
-    'Design', 
-    'Machine Learning', 
-    'Application Implementation', 
-    'Integration Implementation', 
-    'Testing', 
-    'Delivery'
-    ]
-    
-    def get_issue_details(issue):
-        return {
-            'summary': issue.fields.summary,
-            'customfield_10015': getattr(issue.fields, 'customfield_10015', None),
-            'duedate': issue.fields.duedate
-        }
 
-    if parent_issue_key:
-        child_issues = get_children_issues_for_timeline(jira, parent_issue_key)
-        if child_issues:
-            for issue_key in child_issues:
-                issue = jira.issue(issue_key)
-                summary = issue.fields.summary
-                if summary in workshop_summaries_pilot:
-                    issue_data.append(get_issue_details(issue))
-    else:
+# Function to retrieve all issues of a project that are relevant for updating the powerpoint timeline (gantt)
+def get_all_jira_issues_of_project(client: JiraV3, parent_issue_key: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    [{'summary', 'customfield_10015', 'duedate'}] of the TIMELINE_SUMMARIES issues below
+    `parent_issue_key`. Only Epics and Tasks are expanded, and the sub-task level is searched
+    for the listed summaries only.
+    """
+    if not parent_issue_key:
         return
-   
-    return issue_data
+
+    rules = [LevelRule(expand=r.expand, summaries=TIMELINE_SUMMARIES) for r in TIMELINE_RULES]
+    tree, keys = select_issues(client, parent_issue_key, rules, fields=["customfield_10015", "duedate"])
+    return [
+        {
+            'summary': tree.nodes[k].summary,
+            'customfield_10015': tree.nodes[k].fields.get('customfield_10015'),
+            'duedate': tree.nodes[k].fields.get('duedate'),
+        }
+        for k in keys
+    ]
 
 
 def get_due_date_by_summary(issue_data, summary):
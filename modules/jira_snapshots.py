@@ -0,0 +1,238 @@
+# modules/jira_snapshots.py
+# Process-wide cache of IssueTree snapshots, keyed by (accountId, Project issue key, field profile).
+# Reopening a project serves the cached tree right away (stale-while-revalidate) and brings it up
+# to date with small delta searches instead of a full traversal:
+#   - changed / new issues:  parent in (...) AND updated >= -<N>m
+#   - deleted / moved-out:   bulkfetch of the known keys with only the `parent` field (membership re-check)
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from modules.config import (
+    ISSUE_TREE_FRESH_SECONDS,
+    ISSUE_TREE_MAX_STALE_SECONDS,
+    ISSUE_TREE_REBUILD_SECONDS,
+    ISSUE_TREE_MAX_SNAPSHOTS,
+)
+from modules.http_governor import io_executor
+from modules.jira_hierarchy import TREE_FIELDS, IssueTree, build_issue_tree
+from modules.jira_v3 import BULK_FETCH_LIMIT, JiraV3, jql_key_chunks
+
+# minutes added to every delta window: `updated` has minute granularity and clocks drift
+DELTA_SLACK_MINUTES = 2
+
+
+def _levels(tree: IssueTree, max_depth: int) -> Dict[str, int]:
+    """Depth of every node below the root (root = 0), up to max_depth."""
+    depth = {tree.root_key: 0}
+    level = [tree.root_key]
+    for d in range(1, max_depth + 1):
+        level = [c for k in level for c in tree.children_of(k)]
+        for k in level:
+            depth[k] = d
+    return depth
+
+
+def _rebuild(root_key: str, issues: Dict[str, Dict[str, Any]], order: List[str], max_depth: int) -> IssueTree:
+    """IssueTree from a key → issue map; `order` fixes sibling order (old keys first, new appended)."""
+    children: Dict[str, List[str]] = {}
+    for key in order:
+        issue = issues.get(key)
+        if issue is None or key == root_key:
+            continue
+        parent = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+        if parent:
+            children.setdefault(parent, []).append(key)
+
+    tree = IssueTree(root_key)
+    if root_key not in issues:
+        return tree
+    tree.add(issues[root_key])
+    level = [root_key]
+    for _ in range(max_depth):
+        level = [c for k in level for c in children.get(k, []) if c not in tree]
+        for key in level:
+            tree.add(issues[key])
+    return tree
+
+
+def delta_refresh(client: JiraV3, tree: IssueTree, since: float, fields: List[str] = TREE_FIELDS,
+                  max_depth: int = 3) -> IssueTree:
+    """
+    New IssueTree = `tree` + everything changed since the epoch `since` (the old tree is not modified).
+    Issues that no longer exist or moved under a parent outside the tree are dropped with their subtree.
+    """
+    minutes = math.ceil(max(0.0, time.time() - since) / 60) + DELTA_SLACK_MINUTES
+    window = f"updated >= -{minutes}m"
+    root = tree.root_key
+
+    issues: Dict[str, Dict[str, Any]] = {k: node.as_issue() for k, node in tree.nodes.items()}
+    order: List[str] = [root] + tree.keys()
+    depth = _levels(tree, max_depth)
+
+    # 1) changed or new children of every node that can still have children inside the depth cap
+    parents = [k for k in order if depth.get(k, max_depth) < max_depth
+               and not ((issues[k].get("fields") or {}).get("issuetype") or {}).get("subtask")]
+    changed = list(client.iter_children(parents, fields=fields, where=window)) if parents else []
+    # the root itself: bulkfetch skips a deleted / hidden root instead of failing like `key = ...` JQL
+    changed += client.get_issues_bulk([root], fields=fields)
+
+    # new issues that can hold children: take all their children (they may predate the window)
+    def _new_parents(found: List[Dict[str, Any]]) -> List[str]:
+        return [i["key"] for i in found if i.get("key") not in issues
+                and not ((i.get("fields") or {}).get("issuetype") or {}).get("subtask")]
+
+    new_parents = _new_parents(changed)
+    seen_new = set(new_parents)
+    while new_parents:
+        grand = list(client.iter_children(new_parents, fields=fields))
+        changed += grand
+        new_parents = [k for k in _new_parents(grand) if k not in seen_new]
+        seen_new.update(new_parents)
+
+    for issue in changed:
+        key = issue.get("key")
+        if key not in issues:
+            order.append(key)
+        issues[key] = issue
+
+    # 2) membership: which known keys still exist, and under which parent. get_issues_bulk skips
+    #    keys that were deleted or are no longer visible (bulkfetch lists them in `issueErrors`; its
+    #    `key in (...)` fallback re-searches a failing chunk in halves), where a single `key in (...)`
+    #    search would fail with HTTP 400 on the first such key.
+    known = [k for k in tree.nodes if k != root]
+    current: Dict[str, Optional[str]] = {}
+    for issue in client.get_issues_bulk(known, fields=["parent"]):
+        current[issue["key"]] = ((issue.get("fields") or {}).get("parent") or {}).get("key")
+
+    removed = 0
+    for key in known:
+        if key not in current:
+            issues.pop(key, None)  # deleted (or no longer visible to this user)
+            removed += 1
+        elif current[key] != ((issues[key].get("fields") or {}).get("parent") or {}).get("key"):
+            moved = dict(issues[key])
+            moved["fields"] = dict(moved.get("fields") or {}, parent={"key": current[key]} if current[key] else None)
+            issues[key] = moved
+
+    fresh = _rebuild(root, issues, order, max_depth)
+    fresh.plan = {
+        "strategy": "delta",
+        "expected_requests": len(jql_key_chunks(parents)) + 1 + math.ceil(len(known) / BULK_FETCH_LIMIT),
+        "reason": f"{len(changed)} changed, {removed} removed in the last {minutes} min",
+    }
+    return fresh
+
+
+class _Snapshot:
+    __slots__ = ("tree", "synced_at", "built_at", "refreshing", "last_error")
+
+    def __init__(self, tree: IssueTree, synced_at: float, built_at: float):
+        self.tree = tree
+        self.synced_at = synced_at      # start of the last full build or delta refresh
+        self.built_at = built_at        # start of the last full build
+        self.refreshing = False
+        self.last_error: Optional[str] = None
+
+
+class SnapshotCache:
+    """
+    IssueTree snapshots shared by all sessions of the process (LRU, ISSUE_TREE_MAX_SNAPSHOTS).
+    - younger than ISSUE_TREE_FRESH_SECONDS: served as-is
+    - up to ISSUE_TREE_MAX_STALE_SECONDS: served as-is while a delta refresh runs in the background
+    - older, or refresh=True: delta refresh before returning
+    - older than ISSUE_TREE_REBUILD_SECONDS: full rebuild (bounds drift from missed deltas)
+    """
+
+    def __init__(self, max_entries: int = ISSUE_TREE_MAX_SNAPSHOTS):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, Tuple[str, ...]], _Snapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, client: JiraV3, root_key: str, fields: List[str] = TREE_FIELDS, refresh: bool = False) -> IssueTree:
+        key = (client.cache_partition(), root_key, tuple(fields))
+        with self._lock:
+            snap = self._entries.get(key)
+            if snap is not None:
+                self._entries.move_to_end(key)
+
+        now = time.time()
+        if snap is None or now - snap.built_at > ISSUE_TREE_REBUILD_SECONDS:
+            tree = build_issue_tree(client, root_key, fields=fields)
+            self._store(key, _Snapshot(tree, now, now))
+            return tree
+
+        age = now - snap.synced_at
+        if refresh or age > ISSUE_TREE_MAX_STALE_SECONDS:
+            return self._refresh(client, key, snap)
+        if age > ISSUE_TREE_FRESH_SECONDS:
+            self._refresh_in_background(client, key, snap)
+        return snap.tree
+
+    def peek(self, client: JiraV3, root_key: str, fields: List[str] = TREE_FIELDS) -> Optional[IssueTree]:
+        """
+        The cached tree when one is at most ISSUE_TREE_MAX_STALE_SECONDS old, without waiting for
+        Jira; past ISSUE_TREE_FRESH_SECONDS a background delta refresh is started, as in get().
+        """
+        key = (client.cache_partition(), root_key, tuple(fields))
+        with self._lock:
+            snap = self._entries.get(key)
+        if snap is None:
+            return None
+        age = time.time() - snap.synced_at
+        if age > ISSUE_TREE_MAX_STALE_SECONDS:
+            return None
+        if age > ISSUE_TREE_FRESH_SECONDS:
+            self._refresh_in_background(client, key, snap)
+        return snap.tree
+
+    def _refresh_in_background(self, client: JiraV3, key, snap: _Snapshot) -> None:
+        """Start one delta refresh of `snap` on the shared executor unless one is running."""
+        with self._lock:
+            start = not snap.refreshing
+            snap.refreshing = True
+        if start:
+            io_executor().submit(self._refresh_quietly, client, key, snap)
+
+    def _refresh(self, client: JiraV3, key, snap: _Snapshot) -> IssueTree:
+        started = time.time()
+        tree = delta_refresh(client, snap.tree, snap.synced_at, fields=list(key[2]))
+        self._store(key, _Snapshot(tree, started, snap.built_at))
+        return tree
+
+    def _refresh_quietly(self, client: JiraV3, key, snap: _Snapshot) -> None:
+        try:
+            self._refresh(client, key, snap)
+        except Exception as e:  # the stale tree keeps being served; next read retries
+            snap.last_error = str(e)
+        finally:
+            snap.refreshing = False
+
+    def _store(self, key, snap: _Snapshot) -> None:
+        with self._lock:
+            self._entries[key] = snap
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, root_key: Optional[str] = None) -> None:
+        """Forget snapshots of `root_key` (all when None), for every user and field profile."""
+        with self._lock:
+            for key in [k for k in self._entries if root_key is None or k[1] == root_key]:
+                del self._entries[key]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            return {
+                k[1]: {"issues": len(s.tree), "age": round(now - s.synced_at, 1), "last_error": s.last_error}
+                for k, s in self._entries.items()
+            }
+
+
+SNAPSHOTS = SnapshotCache()
@@ -0,0 +1,188 @@
+# modules/jira_tree_files.py
+# Portable snapshot files of one Project subtree: issues (TREE_FIELDS, incl. parent edges and
+# issuelinks) and worklogs as gzip-compressed JSON Lines. A loaded snapshot is a plain IssueTree,
+# so reporting (create_report_dataframe(tree=...)), clone previews
+# (clone_issue_recursive_first_pass(tree=...)), diffs and benchmarks run without Jira.
+#
+# File layout (one JSON object per line):
+#   {"kind": "header", "schema": "hypa-pmo/issue-tree", "version": 1, "root": ..., ...}
+#   {"kind": "issue", "key": ..., "id": ..., "fields": {...}}          root first, then level order
+#   {"kind": "worklogs", "key": ..., "worklogs": [...]}                 REST-shaped worklogs
+# Readers skip unknown kinds and refuse newer major versions.
+#
+# CLI (credentials from JIRA_EMAIL / JIRA_API_TOKEN for `export`):
+#   python -m modules.jira_tree_files export --root ABC-1 --out snapshots/abc-1.jsonl.gz
+#   python -m modules.jira_tree_files info snapshots/abc-1.jsonl.gz
+#   python -m modules.jira_tree_files diff old.jsonl.gz new.jsonl.gz
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from modules.config import JIRA_URL
+from modules.http_governor import map_in_order
+from modules.jira_hierarchy import TREE_FIELDS, IssueTree, build_issue_tree
+from modules.jira_v3 import JiraV3, get_client
+
+SNAPSHOT_SCHEMA = "hypa-pmo/issue-tree"
+SNAPSHOT_VERSION = 1
+
+
+class TreeSnapshot:
+    """A loaded snapshot file: the IssueTree, worklogs per issue key and the header line."""
+
+    __slots__ = ("tree", "worklogs", "header")
+
+    def __init__(self, tree: IssueTree, worklogs: Dict[str, List[Dict[str, Any]]], header: Dict[str, Any]):
+        self.tree = tree
+        self.worklogs = worklogs
+        self.header = header
+
+
+def export_tree_snapshot(path: str, tree: IssueTree,
+                         worklogs: Optional[Dict[str, List[Dict[str, Any]]]] = None) -> Dict[str, Any]:
+    """Write `tree` (and `worklogs`) to `path`; returns the header that was written."""
+    keys = [tree.root_key] + tree.keys() if tree.root_key in tree else []
+    header = {
+        "kind": "header",
+        "schema": SNAPSHOT_SCHEMA,
+        "version": SNAPSHOT_VERSION,
+        "root": tree.root_key,
+        "exported_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "issues": len(keys),
+        "worklogs": sum(len(w) for w in (worklogs or {}).values()),
+        "plan": tree.plan,
+    }
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as fh:
+        fh.write(json.dumps(header) + "\n")
+        for key in keys:
+            node = tree.nodes[key]
+            fh.write(json.dumps({"kind": "issue", "key": key, "id": node.id, "fields": node.fields},
+                                separators=(",", ":")) + "\n")
+        for key, wls in (worklogs or {}).items():
+            fh.write(json.dumps({"kind": "worklogs", "key": key, "worklogs": wls}, separators=(",", ":")) + "\n")
+    return header
+
+
+def capture_tree_snapshot(client: JiraV3, root_key: str, path: str, with_worklogs: bool = True) -> Dict[str, Any]:
+    """Fetch `root_key`'s tree (and worklogs) from Jira and export it to `path`."""
+    tree = build_issue_tree(client, root_key, fields=TREE_FIELDS)
+    worklogs = None
+    if with_worklogs:
+        keys = tree.keys()
+        worklogs = dict(zip(keys, map_in_order(client.get_worklogs_all, keys)))
+    return export_tree_snapshot(path, tree, worklogs)
+
+
+def load_tree_snapshot(path: str) -> TreeSnapshot:
+    """
+    Read a snapshot file into memory. Raises ValueError for files that are not issue-tree
+    snapshots or were written by a newer schema version.
+    """
+    tree: Optional[IssueTree] = None
+    header: Dict[str, Any] = {}
+    worklogs: Dict[str, List[Dict[str, Any]]] = {}
+    loads = json.loads
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        for n, line in enumerate(fh):
+            record = loads(line)
+            kind = record.get("kind")
+            if n == 0:
+                if kind != "header" or record.get("schema") != SNAPSHOT_SCHEMA:
+                    raise ValueError(f"{path} is not an issue-tree snapshot")
+                if int(record.get("version", 0)) > SNAPSHOT_VERSION:
+                    raise ValueError(f"{path} uses snapshot version {record['version']}; "
+                                     f"this app reads up to {SNAPSHOT_VERSION}")
+                header = record
+                tree = IssueTree(record["root"])
+                tree.plan = {"strategy": "snapshot", "expected_requests": 0,
+                             "reason": f"{os.path.basename(path)} ({record.get('exported_at')})"}
+            elif kind == "issue":
+                tree.add(record)
+            elif kind == "worklogs":
+                worklogs[record["key"]] = record.get("worklogs") or []
+    if tree is None:
+        raise ValueError(f"{path} is empty")
+    return TreeSnapshot(tree, worklogs, header)
+
+
+def diff_tree_snapshots(old: TreeSnapshot, new: TreeSnapshot) -> Dict[str, Any]:
+    """
+    One pass over the union of both key sets:
+      added / removed keys, moved [(key, old parent, new parent)],
+      changed {key: [field names whose values differ]},
+      worklog_seconds {key: logged seconds new - old} (non-zero only).
+    """
+    a, b = old.tree.nodes, new.tree.nodes
+    added: List[str] = []
+    removed: List[str] = []
+    moved: List[tuple] = []
+    changed: Dict[str, List[str]] = {}
+    seconds: Dict[str, int] = {}
+
+    for key in list(a) + [k for k in b if k not in a]:
+        na, nb = a.get(key), b.get(key)
+        if na is None:
+            added.append(key)
+        elif nb is None:
+            removed.append(key)
+        else:
+            if na.parent != nb.parent:
+                moved.append((key, na.parent, nb.parent))
+            diff = [f for f in set(na.fields) | set(nb.fields) if na.fields.get(f) != nb.fields.get(f)]
+            if diff:
+                changed[key] = sorted(diff)
+        delta = (sum(w.get("timeSpentSeconds") or 0 for w in new.worklogs.get(key, []))
+                 - sum(w.get("timeSpentSeconds") or 0 for w in old.worklogs.get(key, [])))
+        if delta:
+            seconds[key] = delta
+
+    return {"added": added, "removed": removed, "moved": moved, "changed": changed, "worklog_seconds": seconds}
+
+
+# -------------------- CLI --------------------
+
+def _cli(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m modules.jira_tree_files", description="Issue-tree snapshot files.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="download a Project subtree into a snapshot file")
+    exp.add_argument("--root", required=True, help="Project issue key, e.g. ABC-1")
+    exp.add_argument("--out", required=True, help="target file (.jsonl.gz)")
+    exp.add_argument("--no-worklogs", action="store_true", help="skip worklogs")
+    info = sub.add_parser("info", help="header, counts and load time of a snapshot file")
+    info.add_argument("path")
+    diff = sub.add_parser("diff", help="compare two snapshot files of the same tree")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        email, token = os.environ.get("JIRA_EMAIL"), os.environ.get("JIRA_API_TOKEN")
+        if not (email and token):
+            parser.error("set JIRA_EMAIL and JIRA_API_TOKEN")
+        started = time.time()
+        header = capture_tree_snapshot(get_client(JIRA_URL, email, token), args.root, args.out,
+                                       with_worklogs=not args.no_worklogs)
+        print(f"{args.out}: {header['issues']} issues, {header['worklogs']} worklogs in {time.time() - started:.1f}s")
+    elif args.command == "info":
+        started = time.perf_counter()
+        snap = load_tree_snapshot(args.path)
+        print(json.dumps(dict(snap.header, load_seconds=round(time.perf_counter() - started, 3)), indent=2))
+    else:
+        result = diff_tree_snapshots(load_tree_snapshot(args.old), load_tree_snapshot(args.new))
+        print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_cli())
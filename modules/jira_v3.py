@@ -1,12 +1,87 @@
 # modules/jira_v3.py
 
 import base64
+import hashlib
+import heapq
+import threading
 import requests
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from datetime import datetime
+from requests.adapters import HTTPAdapter
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from modules.config import JIRA_HTTP_POOL_SIZE
+from modules.http_retry import RetryPolicy
+from modules.http_governor import GOVERNOR, fetch_offset_pages, iter_in_order, map_in_order
+from modules.http_cache import RESPONSE_CACHE
+from modules.http_singleflight import SINGLE_FLIGHT, credential_scope, flight_key
+
+# POST /issue/bulk accepts at most 50 issueUpdates per request
+BULK_CREATE_LIMIT = 50
+# POST /issue/bulkfetch accepts at most 100 issue keys per request
+BULK_FETCH_LIMIT = 100
+
+
+# -------------------- Search method memory (process-wide) --------------------
+
+# Queries longer than this go straight to POST (URL length limits on GET)
+JQL_POST_FIRST_CHARS = 1500
+# Learned method per (tenant host, query-size bucket of 500 chars)
+_SEARCH_METHOD: Dict[Tuple[str, int], str] = {}
+
+
+def _search_bucket(base_url: str, jql: str) -> Tuple[str, int]:
+    return urlsplit(base_url).netloc.lower(), len(jql) // 500
+
+
+def preferred_search_method(base_url: str, jql: str) -> str:
+    if len(jql) > JQL_POST_FIRST_CHARS:
+        return "POST"
+    return _SEARCH_METHOD.get(_search_bucket(base_url, jql), "GET")
+
+
+def remember_search_method(base_url: str, jql: str, method: str) -> None:
+    _SEARCH_METHOD[_search_bucket(base_url, jql)] = method
+
+
+def jql_key_chunks(keys: List[str], max_keys: int = 100, max_chars: int = JQL_POST_FIRST_CHARS - 200) -> List[str]:
+    """
+    Quoted, comma-joined key lists for `... in (...)` clauses. Each chunk stays under
+    `max_keys` and `max_chars`, so the JQL still fits a GET URL and Jira's clause limits.
+    """
+    chunks: List[str] = []
+    current: List[str] = []
+    size = 0
+    for k in keys:
+        quoted = f'"{k}"'
+        if current and (len(current) >= max_keys or size + len(quoted) + 1 > max_chars):
+            chunks.append(",".join(current))
+            current, size = [], 0
+        current.append(quoted)
+        size += len(quoted) + 1
+    if current:
+        chunks.append(",".join(current))
+    return chunks
+
+
+def _created_order(issue: Dict[str, Any]) -> Tuple[float, int]:
+    """Sort key matching `ORDER BY created ASC` (ties by numeric id)."""
+    created = (issue.get("fields") or {}).get("created")
+    ts = 0.0
+    if created:
+        try:
+            ts = datetime.strptime(created, "%Y-%m-%dT%H:%M:%S.%f%z").timestamp()
+        except ValueError:
+            pass
+    try:
+        return ts, int(issue.get("id") or 0)
+    except ValueError:
+        return ts, 0
 
 
 class JiraV3:
-    def __init__(self, base_url: str, email: str, api_token: str, timeout: int = 30):
+    def __init__(self, base_url: str, email: str, api_token: str, timeout: int = 30, pool_size: int = JIRA_HTTP_POOL_SIZE):
         self.base_url = base_url.rstrip("/")
         token_bytes = f"{email}:{api_token}".encode("utf-8")
         self._auth_header = {
@@ -15,6 +90,110 @@ class JiraV3:
             "Content-Type": "application/json",
         }
         self.timeout = timeout
+        # identical concurrent GETs under this credential share one call (see _request)
+        self._scope = credential_scope(self.base_url, self._auth_header["Authorization"])
+
+        # One keep-alive session per client: every call below reuses pooled TCP/TLS connections
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self._auth_header)
+        # 429/5xx handling shared with ConfluenceAPI; counters in self.retry.stats
+        self.retry = RetryPolicy()
+        # None = unknown yet; learned on the first get_issues_bulk call
+        self._bulkfetch_supported: Optional[bool] = None
+        # read-through metadata cache (process-wide, partitioned by accountId; see http_cache)
+        self.cache = RESPONSE_CACHE
+        self._account_id: Optional[str] = None
+
+    # -------------------- Transport --------------------
+
+    def _request(self, method: str, path: str, idempotent: Optional[bool] = None, **kwargs) -> requests.Response:
+        """
+        Send one request through the pooled session, retrying 429/5xx per self.retry.
+        Each attempt holds a slot of the process-wide per-host governor.
+        `path` is relative to base_url (e.g. "/rest/api/3/issue/ABC-1"); absolute URLs pass through.
+        `idempotent=True` lets read-only POSTs (JQL search) retry like GETs.
+        Concurrent identical GETs (same URL, params and credentials) share one response;
+        GETs of cached metadata endpoints are answered from self.cache while fresh.
+        """
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+
+        def _send() -> requests.Response:
+            return self.retry.send(
+                lambda: GOVERNOR.call(url, lambda: self.session.request(method, url, **kwargs)),
+                method,
+                idempotent=idempotent,
+            )
+
+        if method.upper() != "GET":
+            return _send()
+
+        params = kwargs.get("params")
+        if self.cache.rule_for(url) is None:
+            return SINGLE_FLIGHT.do(flight_key(self._scope, method, url, params), _send)
+
+        partition = self.cache_partition()
+        cached = self.cache.get(partition, url, params)
+        if cached is not None:
+            return cached
+        r = SINGLE_FLIGHT.do(flight_key(self._scope, method, url, params), _send)
+        self.cache.put(partition, url, params, r)
+        return r
+
+    def cache_partition(self) -> str:
+        """
+        accountId of the token owner (GET /rest/api/3/myself, once per client); cached metadata
+        is keyed by it. Falls back to the hashed credential when /myself is unavailable.
+        """
+        if self._account_id is None:
+            try:
+                self._account_id = self.myself().get("accountId") or self._scope
+            except requests.RequestException:
+                self._account_id = self._scope
+        return self._account_id
+
+    def cache_stats(self) -> Dict[str, Dict[str, int]]:
+        """Hit/miss counters of the metadata cache per endpoint."""
+        return self.cache.snapshot()
+
+    def retry_stats(self) -> Dict[str, float]:
+        """Counters of the retry layer: requests, retries, throttled, wait_seconds."""
+        return self.retry.stats.snapshot()
+
+    # -------------------- Users & groups --------------------
+
+    def myself(self) -> Dict[str, Any]:
+        """
+        GET /rest/api/3/myself
+        """
+        r = self._request("GET", "/rest/api/3/myself")
+        r.raise_for_status()
+        return r.json() or {}
+
+    def find_groups(self, query: Optional[str] = None, max_results: int = 250) -> List[Dict[str, Any]]:
+        """
+        GET /rest/api/3/groups/picker
+        Returns: [{"name":..., "groupId":...}]
+        """
+        params: Dict[str, Any] = {"maxResults": max_results}
+        if query:
+            params["query"] = query
+        r = self._request("GET", "/rest/api/3/groups/picker", params=params)
+        r.raise_for_status()
+        return (r.json() or {}).get("groups", [])
+
+    def find_assignable_users_multi(self, project_keys: str, max_results: int = 150) -> List[Dict[str, Any]]:
+        """
+        GET /rest/api/3/user/assignable/multiProjectSearch?projectKeys=A,B
+        """
+        params = {"projectKeys": project_keys, "maxResults": max_results}
+        r = self._request("GET", "/rest/api/3/user/assignable/multiProjectSearch", params=params)
+        r.raise_for_status()
+        data = r.json()
+        return data if isinstance(data, list) else []
 
     # -------------------- Projects --------------------
 
@@ -23,27 +202,95 @@ class JiraV3:
         GET /rest/api/3/project/search
         Returns: {"self":..., "nextPage":..., "total":..., "values":[{...}]}
         """
-        url = f"{self.base_url}/rest/api/3/project/search"
         params = {"startAt": start_at, "maxResults": max_results}
         if query:
             params["query"] = query
-        r = requests.get(url, headers=self._auth_header, params=params, timeout=self.timeout)
+        r = self._request("GET", "/rest/api/3/project/search", params=params)
         r.raise_for_status()
         return r.json()
 
     def project_search_all(self, query: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        out: List[Dict[str, Any]] = []
-        start = 0
-        while True:
-            data = self.project_search(query=query, start_at=start)
-            values = data.get("values", [])
-            out.extend(values)
-            if limit and len(out) >= limit:
-                return out[:limit]
-            total = data.get("total", 0)
-            start += len(values)
-            if start >= total or not values:
-                return out
+        """
+        All pages of /project/search; pages after the first are fetched concurrently.
+        """
+        return fetch_offset_pages(
+            lambda start: self.project_search(query=query, start_at=start, max_results=100),
+            "values",
+            limit=limit,
+        )
+
+    def project_statuses(self, project_key: str) -> List[Dict[str, Any]]:
+        """
+        GET /rest/api/3/project/{projectKey}/statuses
+        Returns: [{"name": <issue type>, "statuses": [{"name":..., "id":...}]}]
+        """
+        r = self._request("GET", f"/rest/api/3/project/{project_key}/statuses")
+        r.raise_for_status()
+        data = r.json()
+        return data if isinstance(data, list) else []
+
+    # -------------------- Board administration (raw responses) --------------------
+    # Thin wrappers for the CreateJiraBoard flow; they return the response unchecked so callers can
+    # report Jira's error body (jira_board_operations._handle_response).
+
+    def create_project(self, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST /rest/api/2/project
+        Body: {"key":..., "name":..., "projectTypeKey":..., "projectTemplateKey":..., "leadAccountId":...}
+        """
+        return self._request("POST", "/rest/api/2/project", json=payload)
+
+    def get_project(self, project_id_or_key: str) -> requests.Response:
+        """
+        GET /rest/api/2/project/{projectIdOrKey}
+        """
+        return self._request("GET", f"/rest/api/2/project/{project_id_or_key}")
+
+    def get_project_workflow_scheme(self, project_id: str) -> requests.Response:
+        """
+        GET /rest/api/2/workflowscheme/project?projectId=...
+        """
+        return self._request("GET", "/rest/api/2/workflowscheme/project", params={"projectId": project_id})
+
+    def assign_project_scheme(self, scheme: str, project_id: str, scheme_id: str) -> requests.Response:
+        """
+        PUT /rest/api/3/{scheme}/project   (scheme: workflowscheme | issuetypescheme | issuetypescreenscheme)
+        Body: {"projectId": ..., "<scheme>Id": ...}
+        """
+        id_field = {
+            "workflowscheme": "workflowSchemeId",
+            "issuetypescheme": "issueTypeSchemeId",
+            "issuetypescreenscheme": "issueTypeScreenSchemeId",
+        }[scheme]
+        return self._request("PUT", f"/rest/api/3/{scheme}/project",
+                             json={"projectId": project_id, id_field: scheme_id})
+
+    def assign_permission_scheme(self, project_id_or_key: str, scheme_id: str) -> requests.Response:
+        """
+        PUT /rest/api/3/project/{projectKeyOrId}/permissionscheme
+        Body: {"id": ...}
+        """
+        return self._request("PUT", f"/rest/api/3/project/{project_id_or_key}/permissionscheme",
+                             json={"id": scheme_id})
+
+    def get_project_roles(self, project_id_or_key: str) -> requests.Response:
+        """
+        GET /rest/api/2/project/{projectIdOrKey}/role
+        """
+        return self._request("GET", f"/rest/api/2/project/{project_id_or_key}/role")
+
+    def add_project_role_actors(self, project_id_or_key: str, role_id: str,
+                                groups: Optional[List[str]] = None, users: Optional[List[str]] = None) -> requests.Response:
+        """
+        POST /rest/api/2/project/{projectIdOrKey}/role/{id}
+        Body: {"group": [names]} and/or {"user": [accountIds]}
+        """
+        body: Dict[str, Any] = {}
+        if groups is not None:
+            body["group"] = groups
+        if users is not None:
+            body["user"] = users
+        return self._request("POST", f"/rest/api/2/project/{project_id_or_key}/role/{role_id}", json=body)
 
     # -------------------- Search (new JQL endpoint) --------------------
 
@@ -55,40 +302,132 @@ class JiraV3:
         next_page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
-        GET /rest/api/3/search/jql
+        GET or POST /rest/api/3/search/jql
         Note: param name is *jql*, not "query".
-        Some tenants prefer POST; we fallback to POST if GET returns 400.
+        Long queries go straight to POST; otherwise GET is tried first and a 400 falls back
+        to POST. A successful fallback is remembered per tenant and query-size bucket, so
+        later searches of that size skip the failed GET.
         """
-        url = f"{self.base_url}/rest/api/3/search/jql"
-        params = {"jql": jql, "maxResults": max_results}
+        path = "/rest/api/3/search/jql"
+        body: Dict[str, Any] = {"jql": jql, "maxResults": max_results}
         if fields:
-            # Comma-separated is accepted for GET
-            params["fields"] = ",".join(fields)
+            body["fields"] = fields
         if next_page_token:
-            params["nextPageToken"] = next_page_token
+            body["nextPageToken"] = next_page_token
 
-        r = requests.get(url, headers=self._auth_header, params=params, timeout=self.timeout)
-        if r.status_code == 400:
-            # Fallback to POST variant (same path) with JSON body
-            body = {"jql": jql, "maxResults": max_results}
+        if preferred_search_method(self.base_url, jql) == "POST":
+            r = self._request("POST", path, json=body, idempotent=True)
+        else:
+            params = dict(body)
             if fields:
-                body["fields"] = fields
-            if next_page_token:
-                body["nextPageToken"] = next_page_token
-            r = requests.post(url, headers=self._auth_header, json=body, timeout=self.timeout)
+                # Comma-separated is accepted for GET
+                params["fields"] = ",".join(fields)
+            r = self._request("GET", path, params=params)
+            if r.status_code == 400:
+                # Fallback to POST variant (same path) with JSON body
+                r = self._request("POST", path, json=body, idempotent=True)
+                if r.ok:
+                    remember_search_method(self.base_url, jql, "POST")
 
         r.raise_for_status()
         return r.json()
 
-    def search_jql_all(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100) -> List[Dict[str, Any]]:
-        issues: List[Dict[str, Any]] = []
+    def iter_jql(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100) -> Iterator[Dict[str, Any]]:
+        """
+        Yield issues page by page (nextPageToken paging); only one page is held in memory.
+        """
         token: Optional[str] = None
         while True:
             data = self.search_jql(jql, fields=fields, max_results=page_size, next_page_token=token)
-            issues.extend(data.get("issues", []))
+            yield from data.get("issues", []) or []
             token = data.get("nextPageToken")
             if not token:
-                return issues
+                return
+
+    def search_jql_all(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100) -> List[Dict[str, Any]]:
+        return list(self.iter_jql(jql, fields=fields, page_size=page_size))
+
+    def approximate_count(self, jql: str) -> int:
+        """
+        POST /rest/api/3/search/approximate-count
+        Body: {"jql": "..."}  Returns: {"count": n}  (cheap, may lag recent changes slightly)
+        """
+        r = self._request("POST", "/rest/api/3/search/approximate-count", json={"jql": jql}, idempotent=True)
+        r.raise_for_status()
+        return int((r.json() or {}).get("count", 0))
+
+    def iter_children(self, parent_keys: List[str], fields: Optional[List[str]] = None, page_size: int = 100,
+                      where: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Direct children of many parents with one `parent in (...)` search per key chunk
+        (see jql_key_chunks), in the order of one serial search per chunk: chunk order,
+        created ASC within a chunk. `where` is AND-ed to every chunk (e.g. 'updated >= -15m').
+
+        nextPageToken pages can only be read one after another, so a wide chunk would page
+        serially. The first page of every chunk is fetched in parallel and kept; for a chunk
+        that has more pages, the rest (`key not in (<first page>)`) is re-split into parent
+        groups of about one page each (sized with approximate-count), the groups are searched
+        in parallel on the shared executor, and their created-ASC results are merged back by
+        (created, id). When the count is unavailable the chunk keeps paging serially.
+        """
+        extra = f" AND {where}" if where else ""
+        if fields and "created" not in fields:
+            fields = list(fields) + ["created"]  # merge key of split chunks
+
+        def _jql(quoted: List[str], exclude: Optional[List[Dict[str, Any]]] = None) -> str:
+            skip = f" AND key not in ({','.join(i['key'] for i in exclude)})" if exclude else ""
+            return f"parent in ({','.join(quoted)}){extra}{skip} ORDER BY created ASC"
+
+        chunks = [chunk.split(",") for chunk in jql_key_chunks(parent_keys)]
+        firsts = map_in_order(lambda q: self.search_jql(_jql(q), fields=fields, max_results=page_size), chunks)
+
+        # per chunk: ("ready", issues) or ("rest", (first page, number of jobs)); jobs run together below
+        layout: List[Tuple[str, Any]] = []
+        jobs: List[Callable[[], List[Dict[str, Any]]]] = []
+        for quoted, first in zip(chunks, firsts):
+            issues = first.get("issues", []) or []
+            token = first.get("nextPageToken")
+            if not token:
+                layout.append(("ready", issues))
+                continue
+            rest = 0
+            if len(quoted) > 1:
+                try:
+                    rest = self.approximate_count(_jql(quoted).rsplit(" ORDER BY", 1)[0]) - len(issues)
+                except requests.RequestException:
+                    rest = 0  # unknown: keep paging this search
+            if rest <= 0:
+                # a single parent cannot be split: keep paging this search
+                jobs.append(lambda q=quoted, t=token: self._jql_rest(_jql(q), fields, page_size, t))
+                layout.append(("rest", (issues, 1)))
+                continue
+            size = max(1, len(quoted) * page_size // rest)
+            groups = [quoted[i:i + size] for i in range(0, len(quoted), size)]
+            jobs.extend(lambda q=g, i=issues: self.search_jql_all(_jql(q, exclude=i), fields=fields, page_size=page_size)
+                        for g in groups)
+            layout.append(("rest", (issues, len(groups))))
+
+        results = iter_in_order(lambda job: job(), jobs)
+        for kind, value in layout:
+            if kind == "ready":
+                yield from value
+                continue
+            # the first page precedes everything after it in created order
+            first, parts = value
+            yield from first
+            if parts == 1:
+                yield from next(results)
+            else:
+                yield from heapq.merge(*[next(results) for _ in range(parts)], key=_created_order)
+
+    def _jql_rest(self, jql: str, fields: Optional[List[str]], page_size: int, token: str) -> List[Dict[str, Any]]:
+        """Remaining pages of a search whose first page ended with `token`."""
+        out: List[Dict[str, Any]] = []
+        while token:
+            data = self.search_jql(jql, fields=fields, max_results=page_size, next_page_token=token)
+            out.extend(data.get("issues", []) or [])
+            token = data.get("nextPageToken")
+        return out
 
     # -------------------- Issues (CRUD & links) --------------------
 
@@ -96,33 +435,117 @@ class JiraV3:
         """
         GET /rest/api/3/issue/{key}?fields=...&expand=...
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
         params: Dict[str, str] = {}
         if fields:
             params["fields"] = ",".join(fields)
         if expand:
             params["expand"] = ",".join(expand)
-        r = requests.get(url, headers=self._auth_header, params=params, timeout=self.timeout)
+        r = self._request("GET", f"/rest/api/3/issue/{issue_key}", params=params)
         r.raise_for_status()
         return r.json()
 
+    def get_issues_bulk(self, issue_keys: List[str], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch many issues by key in few requests.
+        POST /rest/api/3/issue/bulkfetch  (100 keys per call; chunks run in parallel)
+        Falls back to chunked JQL `key in (...)` when the tenant has no bulkfetch (a chunk with
+        missing keys is searched again in halves, see _search_keys).
+        Returns the issues in input order; keys that don't exist or aren't visible are skipped.
+        """
+        keys = list(OrderedDict.fromkeys(k for k in issue_keys if k))
+        if not keys:
+            return []
+        chunks = [keys[i:i + BULK_FETCH_LIMIT] for i in range(0, len(keys), BULK_FETCH_LIMIT)]
+
+        found: Dict[str, Dict[str, Any]] = {}
+        for issues in map_in_order(lambda chunk: self._fetch_chunk(chunk, fields), chunks):
+            for issue in issues:
+                found[issue.get("key")] = issue
+        return [found[k] for k in keys if k in found]
+
+    def _fetch_chunk(self, keys: List[str], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        if self._bulkfetch_supported is not False:
+            body: Dict[str, Any] = {"issueIdsOrKeys": keys}
+            if fields:
+                body["fields"] = fields
+            r = self._request("POST", "/rest/api/3/issue/bulkfetch", json=body, idempotent=True)
+            if r.status_code not in (404, 405):
+                r.raise_for_status()
+                self._bulkfetch_supported = True
+                return (r.json() or {}).get("issues", []) or []
+            self._bulkfetch_supported = False
+
+        return self._search_keys(keys, fields)
+
+    def _search_keys(self, keys: List[str], fields: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """
+        `key in (...)` search that skips missing keys: the search fails with HTTP 400 as soon as
+        one key is deleted or not visible, so a failing chunk is retried in halves down to single
+        keys, and a single key that still fails is dropped.
+        """
+        quoted = ",".join(f'"{k}"' for k in keys)
+        try:
+            return self.search_jql_all(f"key in ({quoted})", fields=fields)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+        if len(keys) == 1:
+            return []
+        mid = len(keys) // 2
+        return self._search_keys(keys[:mid], fields) + self._search_keys(keys[mid:], fields)
+
     def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
         """
         POST /rest/api/3/issue
         Body: {"fields": {...}}
         """
-        url = f"{self.base_url}/rest/api/3/issue"
-        r = requests.post(url, headers=self._auth_header, json={"fields": fields}, timeout=self.timeout)
+        r = self._request("POST", "/rest/api/3/issue", json={"fields": fields})
         r.raise_for_status()
         return r.json()  # {"id": "...", "key": "...", "self": "..."}
 
+    def create_issues_bulk(self, fields_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        POST /rest/api/3/issue/bulk  (max 50 issues per request; chunked here)
+        Body: {"issueUpdates": [{"fields": {...}}, ...]}
+        Returns one entry per input item, in input order:
+          {"id": "...", "key": "...", "self": "..."}  on success
+          {"error": {"status": 400, "elementErrors": {...}}}  on failure
+        Jira lists created issues in request order, skipping failed elements, and
+        reports failures by index (failedElementNumber). A 400 for the whole request
+        ({"errorMessages": [...], "errors": {field: message}}) fails every item of its chunk.
+        """
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(fields_list), BULK_CREATE_LIMIT):
+            chunk = fields_list[start:start + BULK_CREATE_LIMIT]
+            r = self._request("POST", "/rest/api/3/issue/bulk", json={"issueUpdates": [{"fields": f} for f in chunk]})
+            if r.status_code > 400:
+                r.raise_for_status()
+            data = r.json() or {}
+            errors = data.get("errors") or []
+            if isinstance(errors, dict):
+                # request-level error: nothing of this chunk was created
+                error = {"status": r.status_code,
+                         "elementErrors": {"errorMessages": data.get("errorMessages") or [], "errors": errors}}
+                results.extend({"error": error} for _ in chunk)
+                continue
+            failed = {
+                e.get("failedElementNumber"): {"status": e.get("status"), "elementErrors": e.get("elementErrors", {})}
+                for e in errors
+            }
+            created = iter(data.get("issues", []) or [])
+            for i in range(len(chunk)):
+                if i in failed:
+                    results.append({"error": failed[i]})
+                else:
+                    results.append(next(created, {"error": {"status": r.status_code, "elementErrors": {}}}))
+        return results
+
     def update_issue_fields(self, issue_key: str, fields: Dict[str, Any]) -> None:
         """
         PUT /rest/api/3/issue/{key}
         Body: {"fields": {...}}
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
-        r = requests.put(url, headers=self._auth_header, json={"fields": fields}, timeout=self.timeout)
+        r = self._request("PUT", f"/rest/api/3/issue/{issue_key}", json={"fields": fields})
         r.raise_for_status()
 
     def assign_issue(self, issue_key: str, account_id: str) -> None:
@@ -130,12 +553,10 @@ class JiraV3:
         PUT /rest/api/3/issue/{key}/assignee
         In GDPR strict mode, ONLY 'accountId' is allowed.
         """
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/assignee"
-        r = requests.put(
-            url,
-            headers=self._auth_header,
+        r = self._request(
+            "PUT",
+            f"/rest/api/3/issue/{issue_key}/assignee",
             json={"accountId": account_id},  # only accountId
-            timeout=self.timeout,
         )
         if r.status_code not in (200, 204):
             raise RuntimeError(f"Assignment failed for {issue_key}: {r.text}")
@@ -152,23 +573,20 @@ class JiraV3:
         POST /rest/api/3/issueLink
         Body: {"type":{"name":link_type_name},"inwardIssue":{"key":...},"outwardIssue":{"key":...}}
         """
-        url = f"{self.base_url}/rest/api/3/issueLink"
         body = {
             "type": {"name": link_type_name},
             "inwardIssue": {"key": inward_key},
             "outwardIssue": {"key": outward_key},
         }
-        r = requests.post(url, headers=self._auth_header, json=body, timeout=self.timeout)
+        r = self._request("POST", "/rest/api/3/issueLink", json=body)
         r.raise_for_status()
 
     def delete_issue(self, issue_key: str, delete_subtasks: bool = True) -> None:
         """
         DELETE /rest/api/3/issue/{issueKey}?deleteSubtasks=true
         """
-        import requests
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}"
         params = {"deleteSubtasks": str(delete_subtasks).lower()}
-        r = requests.delete(url, headers=self._auth_header, params=params, timeout=self.timeout)
+        r = self._request("DELETE", f"/rest/api/3/issue/{issue_key}", params=params)
         r.raise_for_status()
 
     def list_transitions(self, issue_key: str) -> list:
@@ -176,9 +594,7 @@ class JiraV3:
         GET /rest/api/3/issue/{issueKey}/transitions
         Returns a list of transitions (each contains id, name, and 'to' status).
         """
-        import requests
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
-        r = requests.get(url, headers=self._auth_header, timeout=self.timeout)
+        r = self._request("GET", f"/rest/api/3/issue/{issue_key}/transitions")
         r.raise_for_status()
         return (r.json() or {}).get("transitions", []) or []
 
@@ -188,12 +604,11 @@ class JiraV3:
         POST /rest/api/3/issue/{issueKey}/transitions
         Body: {"transition": {"id": "..." } }
         """
-        import requests
-        url = f"{self.base_url}/rest/api/3/issue/{issue_key}/transitions"
         payload = {"transition": {"id": transition_id}}
-        r = requests.post(url, headers=self._auth_header, json=payload, timeout=self.timeout)
+        r = self._request("POST", f"/rest/api/3/issue/{issue_key}/transitions", json=payload)
         r.raise_for_status()
-
+        # available transitions depend on the new status
+        self.cache.invalidate(f"/issue/{issue_key}/transitions|")
 
     def transition_issue_by_status_name(self, issue_key: str, target_status_name: str) -> bool:
         """
@@ -212,6 +627,44 @@ class JiraV3:
         self.transition_issue(issue_key, target)
         return True
 
+    # -------------------- Worklogs & users --------------------
+
+    def get_worklogs(self, issue_key: str, start_at: int = 0, max_results: int = 100) -> Dict[str, Any]:
+        """
+        GET /rest/api/3/issue/{issueKey}/worklog?startAt=...&maxResults=...
+        Returns: {"startAt":..., "maxResults":..., "total":..., "worklogs":[{...}]}
+        """
+        params = {"startAt": start_at, "maxResults": max_results}
+        r = self._request("GET", f"/rest/api/3/issue/{issue_key}/worklog", params=params)
+        r.raise_for_status()
+        return r.json() or {}
+
+    def get_worklogs_all(self, issue_key: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        All worklogs of one issue; pages after the first are fetched concurrently.
+        """
+        return fetch_offset_pages(
+            lambda start: self.get_worklogs(issue_key, start_at=start, max_results=page_size),
+            "worklogs",
+        )
+
+    def get_user(self, account_id: str) -> Dict[str, Any]:
+        """
+        GET /rest/api/3/user?accountId=...
+        """
+        r = self._request("GET", "/rest/api/3/user", params={"accountId": account_id})
+        r.raise_for_status()
+        return r.json() or {}
+
+    def find_assignable_users(self, project_key: str, max_results: int = 1000) -> List[Dict[str, Any]]:
+        """
+        GET /rest/api/3/user/assignable/search?project=...
+        """
+        params = {"project": project_key, "maxResults": max_results}
+        r = self._request("GET", "/rest/api/3/user/assignable/search", params=params)
+        r.raise_for_status()
+        return r.json() or []
+
 
     # -------------------- Convenience --------------------
 
@@ -227,3 +680,23 @@ class JiraV3:
         )
         return data.get("issues", [])
 
+
+# -------------------- Process-wide client cache --------------------
+
+_CLIENTS: Dict[str, JiraV3] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(base_url: str, email: str, api_token: str) -> JiraV3:
+    """
+    Return the process-wide JiraV3 for these credentials, creating it on first use.
+    Streamlit reruns and parallel sessions of the same user share one pooled transport.
+    The token is only used as part of a hashed cache key, never stored in clear text as a key.
+    """
+    ident = hashlib.sha256(f"{base_url.rstrip('/')}|{email}|{api_token}".encode("utf-8")).hexdigest()
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(ident)
+        if client is None:
+            client = JiraV3(base_url, email, api_token)
+            _CLIENTS[ident] = client
+        return client
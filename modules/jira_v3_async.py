@@ -0,0 +1,372 @@
+# modules/jira_v3_async.py
+# asyncio counterpart of JiraV3 (aiohttp) + a thin synchronous facade for Streamlit pages
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import functools
+import json
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+import requests
+
+try:
+    import aiohttp
+except ImportError:  # optional: only needed when the async client is used
+    aiohttp = None
+
+from modules.config import JIRA_HTTP_POOL_SIZE
+from modules.http_governor import GOVERNOR
+from modules.http_retry import RetryPolicy
+from modules.http_singleflight import SINGLE_FLIGHT, credential_scope, flight_key
+from modules.jira_v3 import JiraV3, get_client, preferred_search_method, remember_search_method
+
+
+class _Reply:
+    """
+    Fully-read aiohttp response with the bits of requests.Response our code relies on
+    (status_code, headers, text, json(), raise_for_status()). Errors are raised as
+    requests.HTTPError so callers handle sync and async clients the same way.
+    """
+
+    __slots__ = ("status_code", "headers", "text", "url")
+
+    def __init__(self, status_code: int, headers, text: str, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self.url = url
+
+    def json(self) -> Any:
+        return json.loads(self.text) if self.text else None
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}: {self.text[:500]}", response=self)
+
+
+class AsyncJiraV3:
+    """
+    Same endpoints and return shapes as JiraV3, as coroutines.
+    Requests share the per-host governor and retry policy of the sync clients.
+    The aiohttp session is created lazily on the loop that first uses the client.
+    """
+
+    def __init__(self, base_url: str, email: str, api_token: str, timeout: int = 30, pool_size: int = JIRA_HTTP_POOL_SIZE):
+        if aiohttp is None:
+            raise RuntimeError("AsyncJiraV3 requires the 'aiohttp' package (see requirements.txt).")
+        self.base_url = base_url.rstrip("/")
+        token_bytes = f"{email}:{api_token}".encode("utf-8")
+        self._auth_header = {
+            "Authorization": f"Basic {base64.b64encode(token_bytes).decode('utf-8')}",
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        self.timeout = timeout
+        self._scope = credential_scope(self.base_url, self._auth_header["Authorization"])
+        self.pool_size = pool_size
+        self.retry = RetryPolicy()
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    @classmethod
+    def for_client(cls, client: JiraV3) -> "AsyncJiraV3":
+        """Async client with the credentials of an existing (pooled) JiraV3."""
+        twin = cls(client.base_url, "", "", timeout=client.timeout)
+        twin._auth_header = dict(client._auth_header)
+        twin._scope = client._scope
+        return twin
+
+    # -------------------- Transport --------------------
+
+    async def _ensure_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self._auth_header,
+                connector=aiohttp.TCPConnector(limit=self.pool_size, limit_per_host=self.pool_size),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _request(self, method: str, path: str, idempotent: Optional[bool] = None,
+                       params: Optional[Dict[str, Any]] = None, json_body: Any = None) -> _Reply:
+        url = path if path.startswith("http") else f"{self.base_url}{path}"
+        session = await self._ensure_session()
+
+        async def _once() -> _Reply:
+            async with session.request(method, url, params=params, json=json_body) as resp:
+                return _Reply(resp.status, resp.headers, await resp.text(), url)
+
+        async def _send() -> _Reply:
+            return await self.retry.send_async(
+                lambda: GOVERNOR.call_async(url, _once),
+                method,
+                idempotent=idempotent,
+                transient=(aiohttp.ClientConnectionError, asyncio.TimeoutError),
+            )
+
+        if method.upper() != "GET":
+            return await _send()
+        return await SINGLE_FLIGHT.do_async(flight_key(self._scope, method, url, params), _send)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    def retry_stats(self) -> Dict[str, float]:
+        """Counters of the retry layer: requests, retries, throttled, wait_seconds."""
+        return self.retry.stats.snapshot()
+
+    # -------------------- Search --------------------
+
+    async def search_jql(
+        self,
+        jql: str,
+        fields: Optional[List[str]] = None,
+        max_results: int = 50,
+        next_page_token: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        GET/POST /rest/api/3/search/jql with the same learned method choice as JiraV3.search_jql.
+        """
+        path = "/rest/api/3/search/jql"
+        body: Dict[str, Any] = {"jql": jql, "maxResults": max_results}
+        if fields:
+            body["fields"] = fields
+        if next_page_token:
+            body["nextPageToken"] = next_page_token
+
+        if preferred_search_method(self.base_url, jql) == "POST":
+            r = await self._request("POST", path, json_body=body, idempotent=True)
+        else:
+            params = dict(body)
+            if fields:
+                params["fields"] = ",".join(fields)
+            r = await self._request("GET", path, params=params)
+            if r.status_code == 400:
+                r = await self._request("POST", path, json_body=body, idempotent=True)
+                if r.status_code < 400:
+                    remember_search_method(self.base_url, jql, "POST")
+
+        r.raise_for_status()
+        return r.json()
+
+    async def search_jql_all(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100) -> List[Dict[str, Any]]:
+        issues: List[Dict[str, Any]] = []
+        token: Optional[str] = None
+        while True:
+            data = await self.search_jql(jql, fields=fields, max_results=page_size, next_page_token=token)
+            issues.extend(data.get("issues", []))
+            token = data.get("nextPageToken")
+            if not token:
+                return issues
+
+    # -------------------- Issues (CRUD & links) --------------------
+
+    async def get_issue(self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        GET /rest/api/3/issue/{key}?fields=...&expand=...
+        """
+        params: Dict[str, str] = {}
+        if fields:
+            params["fields"] = ",".join(fields)
+        if expand:
+            params["expand"] = ",".join(expand)
+        r = await self._request("GET", f"/rest/api/3/issue/{issue_key}", params=params)
+        r.raise_for_status()
+        return r.json()
+
+    async def create_issue(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        POST /rest/api/3/issue
+        """
+        r = await self._request("POST", "/rest/api/3/issue", json_body={"fields": fields})
+        r.raise_for_status()
+        return r.json()
+
+    async def update_issue_fields(self, issue_key: str, fields: Dict[str, Any]) -> None:
+        """
+        PUT /rest/api/3/issue/{key}
+        """
+        r = await self._request("PUT", f"/rest/api/3/issue/{issue_key}", json_body={"fields": fields})
+        r.raise_for_status()
+
+    async def assign_issue(self, issue_key: str, account_id: str) -> None:
+        """
+        PUT /rest/api/3/issue/{key}/assignee (accountId only, GDPR strict mode)
+        """
+        r = await self._request("PUT", f"/rest/api/3/issue/{issue_key}/assignee", json_body={"accountId": account_id})
+        if r.status_code not in (200, 204):
+            raise RuntimeError(f"Assignment failed for {issue_key}: {r.text}")
+
+    async def create_issue_link(self, link_type_name: str, inward_key: str, outward_key: str) -> None:
+        """
+        POST /rest/api/3/issueLink
+        """
+        body = {
+            "type": {"name": link_type_name},
+            "inwardIssue": {"key": inward_key},
+            "outwardIssue": {"key": outward_key},
+        }
+        r = await self._request("POST", "/rest/api/3/issueLink", json_body=body)
+        r.raise_for_status()
+
+    async def delete_issue(self, issue_key: str, delete_subtasks: bool = True) -> None:
+        """
+        DELETE /rest/api/3/issue/{issueKey}?deleteSubtasks=true
+        """
+        params = {"deleteSubtasks": str(delete_subtasks).lower()}
+        r = await self._request("DELETE", f"/rest/api/3/issue/{issue_key}", params=params)
+        r.raise_for_status()
+
+    # -------------------- Transitions --------------------
+
+    async def list_transitions(self, issue_key: str) -> list:
+        """
+        GET /rest/api/3/issue/{issueKey}/transitions
+        """
+        r = await self._request("GET", f"/rest/api/3/issue/{issue_key}/transitions")
+        r.raise_for_status()
+        return (r.json() or {}).get("transitions", []) or []
+
+    async def transition_issue(self, issue_key: str, transition_id: str) -> None:
+        """
+        POST /rest/api/3/issue/{issueKey}/transitions
+        """
+        payload = {"transition": {"id": transition_id}}
+        r = await self._request("POST", f"/rest/api/3/issue/{issue_key}/transitions", json_body=payload)
+        r.raise_for_status()
+
+    async def transition_issue_by_status_name(self, issue_key: str, target_status_name: str) -> bool:
+        transitions = await self.list_transitions(issue_key)
+        for t in transitions:
+            to_name = (t.get("to") or {}).get("name", "")
+            if to_name.lower() == target_status_name.lower():
+                await self.transition_issue(issue_key, t.get("id"))
+                return True
+        return False
+
+    # -------------------- Worklogs --------------------
+
+    async def get_worklogs(self, issue_key: str, start_at: int = 0, max_results: int = 100) -> Dict[str, Any]:
+        """
+        GET /rest/api/3/issue/{issueKey}/worklog?startAt=...&maxResults=...
+        """
+        params = {"startAt": start_at, "maxResults": max_results}
+        r = await self._request("GET", f"/rest/api/3/issue/{issue_key}/worklog", params=params)
+        r.raise_for_status()
+        return r.json() or {}
+
+    async def get_worklogs_all(self, issue_key: str, page_size: int = 100) -> List[Dict[str, Any]]:
+        """
+        All worklogs of one issue. The first page reveals `total`; remaining pages are fetched concurrently.
+        """
+        first = await self.get_worklogs(issue_key, start_at=0, max_results=page_size)
+        worklogs = list(first.get("worklogs", []) or [])
+        total = first.get("total", len(worklogs))
+        if not worklogs or len(worklogs) >= total:
+            return worklogs
+        step = len(worklogs)
+        pages = await asyncio.gather(
+            *(self.get_worklogs(issue_key, start_at=s, max_results=page_size) for s in range(step, total, step))
+        )
+        for page in pages:
+            worklogs.extend(page.get("worklogs", []) or [])
+        return worklogs
+
+    # -------------------- Fan-out helpers --------------------
+
+    async def get_issues(self, issue_keys: Iterable[str], fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """get_issue for every key concurrently; results in input order."""
+        return list(await asyncio.gather(*(self.get_issue(k, fields=fields) for k in issue_keys)))
+
+    async def worklogs_for(self, issue_keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        {issue_key: [worklog, ...]} for every key, fetched concurrently.
+        A failing issue maps to its exception instead of aborting the batch.
+        """
+        keys = list(issue_keys)
+        results = await asyncio.gather(*(self.get_worklogs_all(k) for k in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    async def delete_issues(self, issue_keys: Iterable[str], delete_subtasks: bool = True) -> Dict[str, Optional[BaseException]]:
+        """
+        Delete the given issues concurrently. Returns {key: None | exception}.
+        Callers should not mix an issue and its own subtasks in one batch.
+        """
+        keys = list(issue_keys)
+        results = await asyncio.gather(
+            *(self.delete_issue(k, delete_subtasks=delete_subtasks) for k in keys), return_exceptions=True
+        )
+        return dict(zip(keys, results))
+
+
+# -------------------- Sync facade --------------------
+
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """One event loop per process, running in a daemon thread, shared by all facades."""
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="jira-async-loop", daemon=True).start()
+            _LOOP = loop
+        return _LOOP
+
+
+class JiraV3Sync:
+    """
+    Blocking facade over AsyncJiraV3: every coroutine method becomes a plain method
+    that runs on the shared background loop. Pages can call it like JiraV3, and the
+    fan-out helpers (get_issues, worklogs_for, delete_issues) run hundreds of requests
+    concurrently without one script thread per request.
+    """
+
+    def __init__(self, client: AsyncJiraV3):
+        self._client = client
+        self.base_url = client.base_url
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def _blocking(*args, **kwargs):
+            future = asyncio.run_coroutine_threadsafe(attr(*args, **kwargs), _background_loop())
+            return future.result()
+
+        return _blocking
+
+
+_ASYNC_CLIENTS: Dict[str, JiraV3Sync] = {}
+_ASYNC_CLIENTS_LOCK = threading.Lock()
+
+
+def async_available() -> bool:
+    """True when aiohttp is installed; pages fall back to the threaded JiraV3 fan-out otherwise."""
+    return aiohttp is not None
+
+
+def async_twin(client: JiraV3) -> JiraV3Sync:
+    """
+    Process-wide JiraV3Sync sharing the credentials of `client` (keyed like its single-flight scope).
+    """
+    with _ASYNC_CLIENTS_LOCK:
+        facade = _ASYNC_CLIENTS.get(client._scope)
+        if facade is None:
+            facade = JiraV3Sync(AsyncJiraV3.for_client(client))
+            _ASYNC_CLIENTS[client._scope] = facade
+        return facade
+
+
+def get_async_client(base_url: str, email: str, api_token: str) -> JiraV3Sync:
+    """
+    Process-wide JiraV3Sync per credential (the twin of jira_v3.get_client's client).
+    """
+    return async_twin(get_client(base_url, email, api_token))
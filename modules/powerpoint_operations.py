@@ -1,12 +1,47 @@
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
-from jira import JIRA
 import pandas as pd
 from modules.utils import get_calendar_week,get_current_year,get_current_month
 from modules.jira_operations import get_jira_project_key
+from modules.jira_v3 import JiraV3
+from modules.report_frame import REPORT_FIELDS, ReportFrameBuilder, report_cell_text
 import streamlit as st
-import tempfile
+import io
+import os
+import threading
+
+# template path -> (mtime, file bytes); re-read only when the file on disk changes
+_TEMPLATE_BYTES = {}
+_TEMPLATE_LOCK = threading.Lock()
+
+
+def read_template(template_path):
+    """
+    Bytes of a template file (pptx / xlsx), cached per path and invalidated by its mtime.
+    """
+    mtime = os.stat(template_path).st_mtime_ns
+    cached = _TEMPLATE_BYTES.get(template_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(template_path, "rb") as fh:
+        data = fh.read()
+    with _TEMPLATE_LOCK:
+        _TEMPLATE_BYTES[template_path] = (mtime, data)
+    return data
+
+
+def load_presentation(template_path):
+    """A fresh Presentation parsed from the cached template bytes (no disk read when unchanged)."""
+    return Presentation(io.BytesIO(read_template(template_path)))
+
+
+def presentation_bytes(presentation):
+    """Render a Presentation into an in-memory buffer (rewound, ready for st.download_button)."""
+    buffer = io.BytesIO()
+    presentation.save(buffer)
+    buffer.seek(0)
+    return buffer
 
 
 ## get all children issues applies a filter and creates a powerpoint slide deck
@@ -21,7 +56,7 @@ def create_powerpoint(df,project_issue_key):
     #template_path = f'templates/template_{get_jira_project_key()}.pptx' 
     template_path = f'templates/template_{project_issue_key}.pptx' 
     # Load PowerPoint template
-    presentation = Presentation(template_path)
+    presentation = load_presentation(template_path)
 
     # Copy the second slide (assuming it's the template)
     template_slide = presentation.slides[1]
@@ -63,38 +98,22 @@ def create_powerpoint(df,project_issue_key):
     #In the case of the Presentation class in the python-pptx library, the library itself is designed to handle file operations internally.
     #presentation.save(presentationFileName)
 
-    # Save the presentation to a temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmpfile:
-        presentation.save(tmpfile.name)
-        return tmpfile.name
+    # Render the presentation in memory (no temporary file left on the server)
+    return presentation_bytes(presentation)
     
 # create the presentation from a template args. jql and jira credentials 
-def create_powerpoint_presentation_jql(jira, jql):
-
-    # Get issues from Jira using JQL
-    issues = jira.search_issues(jql)
-
-    # Create DataFrame from issues
-    issue_data = []
-    for issue in issues:
-        issue_data.append({
-            'Id': issue.key,
-            'Name': issue.fields.summary,
-            'Start Date': issue.fields.customfield_10015,
-            'Due Date': issue.fields.duedate,
-            'Status': issue.fields.status.name,
-            'Owner': getattr(issue.fields.assignee, 'displayName', None),
-            'Ext.Owner': issue.fields.customfield_10127
-        })
-    
-    df = pd.DataFrame(issue_data)
+def create_powerpoint_presentation_jql(client: JiraV3, jql):
+
+    # Stream issues from Jira into the columnar report builder (only the fields shown on the slide)
+    df = ReportFrameBuilder().add_issues(client.iter_jql(jql, fields=REPORT_FIELDS)).frame()
+    df = df.drop(columns=['Issue Type'])
     st.write(df)
     
     # Path to template and output PowerPoint files (Weekly Report)
     template_path = f'templates/template_{get_jira_project_key()}.pptx' 
     
     # Load PowerPoint template
-    presentation = Presentation(template_path)
+    presentation = load_presentation(template_path)
 
     # Copy the second slide (assuming it's the template)
     template_slide = presentation.slides[1]
@@ -138,10 +157,8 @@ def create_powerpoint_presentation_jql(jira, jql):
     #In the case of the Presentation class in the python-pptx library, the library itself is designed to handle file operations internally.
     #presentation.save(presentationFileName)
 
-    # Save the presentation to a temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmpfile:
-        presentation.save(tmpfile.name)
-        return tmpfile.name
+    # Render the presentation in memory (no temporary file left on the server)
+    return presentation_bytes(presentation)
        
 
 # add issues to table
@@ -167,7 +184,7 @@ def add_data_to_slide(slide, df):
     # Add data to the table
     for row_num, (_, row) in enumerate(df.iterrows(), start=1):
         for col_num, value in enumerate(row):
-            table.cell(row_num, col_num).text = str(value)
+            table.cell(row_num, col_num).text = report_cell_text(value)
 
     format_table(table)
     
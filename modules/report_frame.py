@@ -0,0 +1,269 @@
+# modules/report_frame.py
+# Columnar builder for the status-report DataFrame. Issues are appended straight from search
+# pages / IssueTree nodes into per-column arrays instead of one dict per row:
+#   - Status, Owner, Ext.Owner, Issue Type: categorical codes (int32) + one category list per column
+#   - Due Date, Start Date: "YYYY-MM-DD" strings, converted once into datetime64 columns
+# Multi-thousand-issue boards held in st.session_state['df'] then cost a few bytes per cell for
+# the repeated labels, and isin()/date filters compare integer codes / datetime64 values.
+# ReportFilterIndex answers the CreateReport filters for one frame from bitmaps (Python ints,
+# bit i = row i) per column value and sorted due-date ordinals, memoized per filter combination.
+
+from __future__ import annotations
+
+import weakref
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+REPORT_COLUMNS = ["Id", "Name", "Due Date", "Start Date", "Status", "Owner", "Ext.Owner", "Issue Type"]
+REPORT_FIELDS = ["summary", "duedate", "customfield_10015", "status", "assignee", "customfield_10127", "issuetype"]
+# pandas keeps datetime64 at second resolution at the coarsest; day values are exact in it
+REPORT_DATE_DTYPE = "datetime64[s]"
+# filter results remembered per frame (one per distinct multiselect/slider combination)
+FILTER_MEMO_SIZE = 64
+
+
+def _option_value(val: Any) -> Optional[str]:
+    """
+    Normalize Jira option-like values to a plain string.
+    Handles:
+      - dicts with {"value": "..."}
+      - python-jira style objects with .value
+      - lists of either (joined by ", ")
+      - plain strings / None
+    """
+    if val is None:
+        return None
+    if isinstance(val, list):
+        parts = []
+        for v in val:
+            if isinstance(v, dict) and "value" in v:
+                parts.append(str(v["value"]))
+            elif hasattr(v, "value"):
+                parts.append(str(v.value))
+            else:
+                parts.append(str(v))
+        return ", ".join(parts) if parts else None
+    if isinstance(val, dict) and "value" in val:
+        return str(val["value"])
+    if hasattr(val, "value"):
+        return str(val.value)
+    return str(val)
+
+
+class _CategoryColumn:
+    """Categorical codes in arrival order; -1 marks a missing value."""
+
+    __slots__ = ("codes", "index")
+
+    def __init__(self):
+        self.codes: List[int] = []
+        self.index: Dict[str, int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.index)
+        self.codes.append(code)
+
+    def array(self) -> pd.Categorical:
+        return pd.Categorical.from_codes(np.asarray(self.codes, dtype=np.int32), categories=list(self.index))
+
+
+def _date_array(values: List[Optional[str]]) -> np.ndarray:
+    """ISO dates (or datetimes; only the date part is kept) -> datetime64; unparsable values become NaT."""
+    try:
+        days = np.array([v[:10] if v else None for v in values], dtype="datetime64[D]")
+    except (TypeError, ValueError):
+        days = pd.to_datetime(pd.Series(values, dtype=object), errors="coerce").dt.normalize().to_numpy()
+    return days.astype(REPORT_DATE_DTYPE)
+
+
+class ReportFrameBuilder:
+    """
+    Append issues (REST-shaped dicts or key + fields) and build the report DataFrame once:
+        builder = ReportFrameBuilder()
+        builder.add_issues(client.iter_jql(jql, fields=REPORT_FIELDS))
+        df = builder.frame()
+    """
+
+    __slots__ = ("ids", "names", "due", "start", "status", "owner", "ext_owner", "issue_type")
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.names: List[Optional[str]] = []
+        self.due: List[Optional[str]] = []
+        self.start: List[Optional[str]] = []
+        self.status = _CategoryColumn()
+        self.owner = _CategoryColumn()
+        self.ext_owner = _CategoryColumn()
+        self.issue_type = _CategoryColumn()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, key: str, fields: Dict[str, Any]) -> None:
+        self.ids.append(key)
+        self.names.append(fields.get("summary"))
+        self.due.append(fields.get("duedate"))
+        self.start.append(fields.get("customfield_10015"))
+        self.status.append((fields.get("status") or {}).get("name"))
+        self.owner.append((fields.get("assignee") or {}).get("displayName"))
+        self.ext_owner.append(_option_value(fields.get("customfield_10127")))
+        self.issue_type.append((fields.get("issuetype") or {}).get("name"))
+
+    def add_issues(self, issues: Iterable[Dict[str, Any]]) -> "ReportFrameBuilder":
+        for issue in issues:
+            self.add(issue["key"], issue.get("fields") or {})
+        return self
+
+    def frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "Id": np.array(self.ids, dtype=object),
+                "Name": np.array(self.names, dtype=object),
+                "Due Date": _date_array(self.due),
+                "Start Date": _date_array(self.start),
+                "Status": self.status.array(),
+                "Owner": self.owner.array(),
+                "Ext.Owner": self.ext_owner.array(),
+                "Issue Type": self.issue_type.array(),
+            },
+            columns=REPORT_COLUMNS,
+        )
+
+
+def report_cell_text(value: Any) -> str:
+    """Slide/table text of one report cell: dates as YYYY-MM-DD, missing values blank."""
+    if value is None or value is pd.NaT or (isinstance(value, float) and np.isnan(value)):
+        return ""
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    return str(value)
+
+
+def _bitmap(positions: np.ndarray, rows: int) -> int:
+    """Row positions -> int with those bits set."""
+    flags = np.zeros(rows, dtype=bool)
+    flags[positions] = True
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+def _positions(bitmap: int, rows: int) -> np.ndarray:
+    """int bitmap -> ascending row positions."""
+    raw = np.frombuffer(bitmap.to_bytes((rows + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder="little")[:rows])
+
+
+class ReportFilterIndex:
+    """
+    Filter index of one report frame (built once, see filter_index_for):
+      - per column (Issue Type, Status, Owner): {value: bitmap of the rows holding it}
+      - Id: {key: row position}
+      - Due Date: day ordinals of the dated rows, sorted, with their row positions
+    select() evaluates a filter combination with int AND/OR and returns row positions;
+    results are memoized (LRU) per combination and day.
+    """
+
+    __slots__ = ("rows", "all_rows", "values", "id_pos", "due_days", "due_rows", "memo")
+
+    VALUE_COLUMNS = ("Issue Type", "Status", "Owner")
+
+    def __init__(self, df: pd.DataFrame):
+        self.rows = len(df)
+        self.all_rows = (1 << self.rows) - 1
+        self.values: Dict[str, Dict[Any, int]] = {}
+        for column in self.VALUE_COLUMNS:
+            if column not in df.columns:
+                continue
+            series = df[column]
+            cat = series.array if isinstance(series.dtype, pd.CategoricalDtype) else pd.Categorical(series)
+            codes = np.asarray(cat.codes)
+            order = np.argsort(codes, kind="stable")
+            bounds = np.searchsorted(codes[order], np.arange(len(cat.categories) + 1))
+            self.values[column] = {
+                value: _bitmap(order[bounds[code]:bounds[code + 1]], self.rows)
+                for code, value in enumerate(cat.categories)
+            }
+        self.id_pos: Dict[Any, int] = {} if "Id" not in df.columns else {k: i for i, k in enumerate(df["Id"])}
+        due = pd.to_datetime(df["Due Date"], errors="coerce") if "Due Date" in df.columns else pd.Series([], dtype=REPORT_DATE_DTYPE)
+        days = due.to_numpy(dtype="datetime64[D]")
+        dated = np.flatnonzero(~np.isnat(days))
+        order = np.argsort(days[dated], kind="stable")
+        self.due_rows = dated[order]
+        self.due_days = days[dated][order].astype(np.int64)
+        self.memo: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+
+    def _any_of(self, column: str, wanted: Iterable[Any]) -> int:
+        lookup = self.values.get(column, {})
+        bits = 0
+        for value in wanted:
+            bits |= lookup.get(value, 0)
+        return bits
+
+    def _due_within(self, today: date, days: int) -> int:
+        first = (np.datetime64(today, "D") - np.datetime64(0, "D")).astype(np.int64)
+        lo = np.searchsorted(self.due_days, first, side="left")
+        hi = np.searchsorted(self.due_days, first + days, side="right")
+        return _bitmap(self.due_rows[lo:hi], self.rows)
+
+    def select(self, issue_type=None, statuses=None, days=None, owner_list=None, selected_rows=None,
+               today: Optional[date] = None) -> np.ndarray:
+        """Row positions matching every given filter (empty / None filters match all rows)."""
+        today = today or date.today()
+        key = (
+            tuple(sorted(map(str, issue_type or ()))),
+            tuple(sorted(map(str, statuses or ()))),
+            int(days or 0),
+            tuple(sorted(map(str, owner_list or ()))),
+            tuple(sorted(map(str, selected_rows or ()))),
+            today if days else None,
+        )
+        hit = self.memo.get(key)
+        if hit is not None:
+            self.memo.move_to_end(key)
+            return hit
+
+        bits = self.all_rows
+        if issue_type:
+            bits &= self._any_of("Issue Type", issue_type)
+        if statuses:
+            bits &= self._any_of("Status", statuses)
+        if days is not None and days > 0:
+            bits &= self._due_within(today, int(days))
+        if owner_list:
+            bits &= self._any_of("Owner", owner_list)
+        if selected_rows:
+            picked = 0
+            for k in selected_rows:
+                pos = self.id_pos.get(k)
+                if pos is not None:
+                    picked |= 1 << pos
+            bits &= picked
+
+        result = _positions(bits, self.rows)
+        self.memo[key] = result
+        if len(self.memo) > FILTER_MEMO_SIZE:
+            self.memo.popitem(last=False)
+        return result
+
+
+# id(frame) -> (weakref to the frame, its index); entries go away with their frame
+_FILTER_INDEXES: Dict[int, Tuple[weakref.ref, ReportFilterIndex]] = {}
+
+
+def filter_index_for(df: pd.DataFrame) -> ReportFilterIndex:
+    """The ReportFilterIndex of `df` (treated as read-only), built on first use and kept while the frame lives."""
+    frame_id = id(df)
+    entry = _FILTER_INDEXES.get(frame_id)
+    if entry is not None and entry[0]() is df:
+        return entry[1]
+    index = ReportFilterIndex(df)
+    _FILTER_INDEXES[frame_id] = (weakref.ref(df, lambda _ref, i=frame_id: _FILTER_INDEXES.pop(i, None)), index)
+    return index
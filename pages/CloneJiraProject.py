@@ -4,7 +4,7 @@ from datetime import datetime, timedelta
 import os
 import streamlit as st
 
-from modules.jira_v3 import JiraV3
+from modules.jira_v3 import get_client
 from modules.config import JIRA_URL, ADMINS, JIRA_TEMPLATE_BOARD_KEY
 
 # These helpers should now be v3-aware inside your repo
@@ -18,13 +18,15 @@ from modules.jira_operations import (
     save_jira_account_type_parent,                 # (issue_key) -> None (stores in session)
     save_jira_project_key,                         # (project_key) -> None (stores in session)
     update_parent_issue_type_project,              # (client, child_issue_key, target_project_issue_key) -> None
-    delete_newly_created_project                   # (client, child_issue_key) -> None
+    delete_newly_created_project,                  # (client, child_issue_key) -> None
+    get_issue_tree,                                # (client, root_issue_key) -> IssueTree (session-cached)
+    drop_issue_tree,                               # (root_issue_key) -> None (forget a cached tree)
 )
 
 from modules.jira_clone_issue_operations import (
     get_time_delta,                        # (client, project_start_date: date, source_issue_key: str) -> int
     clone_issue_recursive_first_pass,      # (client, source_issue_key, target_project_key, cloned_issues: dict, day_delta: int, project_assignee: str) -> None
-    add_issue_links,                       # (client, cloned_issues_mapping: dict) -> None
+    add_issue_links,                       # (client, cloned_issues_mapping: dict, tree=None) -> None
     update_project_name                    # (client, root_issue_key, new_name) -> None
 )
 
@@ -66,8 +68,8 @@ def main():
         st.warning("Please log in first.")
         return
 
-    # Instantiate the lightweight v3 client
-    client = JiraV3(JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN)
+    # Shared lightweight v3 client (pooled, cached per credential)
+    client = get_client(JIRA_BASE_URL, JIRA_EMAIL, JIRA_TOKEN)
 
     # --- UI ---
     st.title("Clone Jira Issue Type Project")
@@ -154,8 +156,10 @@ def main():
             
 
             cloned_issues = {}
+            # refreshed first: template edits since the last sync must be part of the clone
+            source_tree = get_issue_tree(client, source_issue_key, refresh=True)
 
-            # Step 1: Clone all issues (without links)
+            # Step 1: Clone all issues (without links), reading the template from the shared tree
             clone_issue_recursive_first_pass(
                 client,
                 source_issue_key,
@@ -163,11 +167,12 @@ def main():
                 cloned_issues=cloned_issues,
                 day_delta=(delta_days or 0),
                 project_assignee=project_assignee,
+                tree=source_tree,
             )
 
             # Step 2: Create links between cloned issues
             st.write("All issues cloned. Now creating links between issues...")
-            add_issue_links(client, cloned_issues)
+            add_issue_links(client, cloned_issues, tree=source_tree)
 
             # Determine the root of the new clone (mapped from source root)
             new_root_issue_key = _extract_issue_key(cloned_issues.get(source_issue_key))
@@ -187,6 +192,7 @@ def main():
             if selected_issue_type_project is not None:
                 try:
                     update_parent_issue_type_project(client, new_root_issue_key, selected_issue_type_project["key"])
+                    drop_issue_tree(selected_issue_type_project["key"])  # it has new children now
                     # If your logic requires deleting the initially created "Project" wrapper:
                     delete_newly_created_project(client, new_root_issue_key)
                     st.success(
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 import streamlit as st
-from jira import JIRA
 
 from modules.config import (
     JIRA_ADMIN_ROLE_ID,
@@ -16,6 +15,7 @@ from modules.config import (
     JIRA_URL_CONFLUENCE,
 )
 from modules.jira_operations import create_jira_issue, save_jira_project_key
+from modules.jira_v3 import get_client
 from modules.jira_board_operations import (
     assign_project_workflow_scheme,
     assign_issue_type_scheme,
@@ -237,12 +237,13 @@ def main():
                 # Create Account issue
                 with st.spinner("Creating Account issue..."):
                     issue_dict = create_jira_issue(project_name_raw, "Account")
-                    jira = JIRA(JIRA_URL, basic_auth=(
+                    client = get_client(
+                        JIRA_URL,
                         st.session_state["api_username"],
-                        st.session_state["api_password"]
-                    ))
-                    issue = jira.create_issue(fields=issue_dict)
-                st.success(f"✅ Account issue created: {issue}")
+                        st.session_state["api_password"],
+                    )
+                    issue = client.create_issue(issue_dict)
+                st.success(f"✅ Account issue created: {issue.get('key')}")
                 
                 # Clear temp state
                 st.session_state["temp_jira_board_key"] = ""
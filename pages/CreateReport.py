@@ -2,7 +2,7 @@
 
 import streamlit as st
 from modules.utils import get_calendar_week
-from modules.jira_v3 import JiraV3
+from modules.jira_v3 import get_client
 from modules.config import (
     JIRA_URL,
     JIRA_ACCOUNT_ISSUE_TYPE,
@@ -22,12 +22,20 @@ from modules.jira_operations import (
     save_jira_issue_type_project,
     get_users_from_jira_project,              
     create_report_dataframe,                  
+    create_filtered_report_dataframe,
+    get_project_status_names,
     filter_dataframe,
 )
 
 st.set_page_config(page_title="Create Report", page_icon="📊")
 st.title('Create Report :file_folder:')
 
+# report dates are datetime64 (modules/report_frame.py); show them as days, not midnight timestamps
+REPORT_COLUMN_CONFIG = {
+    "Due Date": st.column_config.DateColumn("Due Date", format="YYYY-MM-DD"),
+    "Start Date": st.column_config.DateColumn("Start Date", format="YYYY-MM-DD"),
+}
+
 # ---- Session defaults
 for k in ("api_username", "api_password", "jira_project_key", "jira_issue_type_project", "data_frame_for_report"):
     st.session_state.setdefault(k, "" if k != "data_frame_for_report" else None)
@@ -45,7 +53,8 @@ with st.expander("📖 How to use this page", expanded=False):
         **Steps**
         1. Select a **Jira board** (by key).
         2. Pick a **Project** (issue type “Project”) from that board.
-        3. Click **Fetch Issues**.
+        3. Click **Fetch Issues**. Tick *Filter while fetching* to download only the issues matching
+           the filters you already know (e.g. open Tasks due in the next 14 days).
         4. Use filters (Issue Type / Status / Owner / Due-in-days / specific Ids).
         5. Click **Apply Filters**.
         6. Click **Create Status Report**.
@@ -58,7 +67,7 @@ with st.expander("📖 How to use this page", expanded=False):
 # ---- Build v3 client when creds exist
 client = None
 if st.session_state["api_password"]:
-    client = JiraV3(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
+    client = get_client(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
 else:
     st.warning("Please provide Jira credentials on the Authenticate page.")
 
@@ -87,21 +96,58 @@ if st.session_state['jira_project_key']:
 
     # ---- Step 3: Fetch issues (only after a Project issue is selected)
     if project_issue_key:
+        # Optional: filter while fetching - the filters become JQL and only matching issues are downloaded
+        push_down = st.checkbox("Filter while fetching (download only matching issues)", key="report_push_down")
+        # Reset cached df when switching between full and filtered fetches
+        if st.session_state.get('report_push_down_fetched') != push_down:
+            st.session_state['df'] = None
+            st.session_state['report_push_down_fetched'] = push_down
+        if push_down:
+            board_users = get_users_from_jira_project(client, st.session_state['jira_project_key']) if client else []
+            fetch_issue_type = st.multiselect(
+                'Fetch only - Issue Type:',
+                options=[JIRA_EPIC_ISSUE_TYPE, JIRA_TASK_ISSUE_TYPE, JIRA_SUBTASK_ISSUE_TYPE],
+                key="fetch_issue_type",
+            )
+            fetch_statuses = st.multiselect(
+                'Fetch only - Status:',
+                options=get_project_status_names(client, st.session_state['jira_project_key']) if client else [],
+                key="fetch_statuses",
+            )
+            fetch_owners = st.multiselect(
+                'Fetch only - Owner:',
+                options=board_users,
+                format_func=lambda u: u["displayName"] or u["accountId"],
+                key="fetch_owners",
+            )
+            fetch_days = st.slider('Fetch only - Due in next X days (0 = no filter):', 0, 30, 0, key="fetch_days")
+
         if st.button("Fetch Issues"):
-            if st.session_state.get('df') is None:
-                if not client:
-                    st.warning("Please log in first.")
-                else:
-                    # v3: pass JiraV3 client
-                    st.session_state['df'] = create_report_dataframe(client, project_issue_key)
-                    st.success("Issues fetched and stored!")
+            if not client:
+                st.warning("Please log in first.")
+            elif push_down:
+                # filters changed since the last fetch are applied by fetching again
+                st.session_state['df'] = create_filtered_report_dataframe(
+                    client,
+                    project_issue_key,
+                    st.session_state['jira_project_key'],
+                    issue_type=fetch_issue_type,
+                    statuses=fetch_statuses,
+                    days=fetch_days,
+                    owner_ids=[u["accountId"] for u in fetch_owners],
+                )
+                st.success(f"{len(st.session_state['df'])} matching issues fetched and stored!")
+            elif st.session_state.get('df') is None:
+                # v3: pass JiraV3 client
+                st.session_state['df'] = create_report_dataframe(client, project_issue_key)
+                st.success("Issues fetched and stored!")
             else:
                 st.info("Issues already fetched. You can apply filters below.")
 
         # Show fetched data
         if st.session_state.get('df') is not None:
             st.write("Fetched Issues:")
-            st.write(st.session_state['df'])
+            st.dataframe(st.session_state['df'], column_config=REPORT_COLUMN_CONFIG)
 
             # ---- Step 4: Filters
             df = st.session_state['df']
@@ -123,7 +169,7 @@ if st.session_state['jira_project_key']:
                     selected_rows=selected_rows,
                 )
                 st.write("Filtered Issues:")
-                st.write(st.session_state['data_frame_for_report'])
+                st.dataframe(st.session_state['data_frame_for_report'], column_config=REPORT_COLUMN_CONFIG)
         else:
             st.warning("No data to filter. Click **Fetch Issues** first.")
 
@@ -131,15 +177,14 @@ if st.session_state['jira_project_key']:
         if st.session_state.get('data_frame_for_report') is not None:
             if st.button("Create Status Report"):
                 try:
-                    presentation_path = create_powerpoint(st.session_state['data_frame_for_report'], project_issue_key)
+                    presentation_buffer = create_powerpoint(st.session_state['data_frame_for_report'], project_issue_key)
                     st.success("Weekly Report created.")
-                    with open(presentation_path, "rb") as f:
-                        st.download_button(
-                            label="Download PowerPoint Status Report",
-                            data=f,
-                            file_name=f'{project_issue_key}_Weekly_Status_Report_CW_{get_calendar_week()}.pptx',
-                            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
-                        )
+                    st.download_button(
+                        label="Download PowerPoint Status Report",
+                        data=presentation_buffer,
+                        file_name=f'{project_issue_key}_Weekly_Status_Report_CW_{get_calendar_week()}.pptx',
+                        mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                    )
                 except Exception as e:
                     st.error(f"Error creating the report: {e}")
         else:
@@ -11,7 +11,7 @@ from modules.config import (
     JIRA_TASK_ISSUE_TYPE,
     HYPA_PMO_TICKET_DOCU,
 )
-from modules.jira_v3 import JiraV3
+from modules.jira_v3 import JiraV3, get_client
 from modules.jira_operations import (
     get_project_keys,
     create_jira_issue_ticket_template,     
@@ -93,7 +93,7 @@ def main():
 
     # Build JiraV3 client once
     if not st.session_state["jira_client"]:
-        st.session_state["jira_client"] = JiraV3(
+        st.session_state["jira_client"] = get_client(
             JIRA_URL,
             st.session_state["api_username"],
             st.session_state["api_password"],
@@ -2,7 +2,7 @@
 
 import streamlit as st
 from modules.config import JIRA_URL
-from modules.jira_v3 import JiraV3
+from modules.jira_v3 import get_client
 from modules.jira_operations import delete_jira_issue
 
 st.set_page_config(page_title="Delete Jira Issue", page_icon="🚨")
@@ -31,7 +31,7 @@ if st.button("Delete Jira Issue"):
     elif not (st.session_state["api_username"] and st.session_state["api_password"]):
         st.warning("Please provide Jira credentials (username & API token) on the Authenticate page.")
     else:
-        client = JiraV3(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
+        client = get_client(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
         with st.container():
             try:
                 delete_jira_issue(client, jira_issue)
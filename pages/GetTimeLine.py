@@ -1,11 +1,10 @@
 import streamlit as st
-from jira import JIRA
 import pandas as pd
 from modules.config import JIRA_URL,TIMELINE_POWER_POINT_SLIDE,EXCEL_TIMELINE_ELEMENTS,EXCEL_TIMELINE_ELEMENTS_POC,TIMELINE_POWER_POINT_SLIDE_POC
-from modules.jira_operations import get_jira_issue_type_project_key_with_displayname,save_jira_issue_type_project,get_project_keys,save_jira_project_key,get_all_jira_issues_of_project,get_due_date_by_summary,get_start_date_by_summary,save_jira_project_type
+from modules.jira_operations import get_jira_issue_type_project_key_with_displayname,save_jira_issue_type_project,get_project_keys,save_jira_project_key,get_all_jira_issues_of_project,get_due_date_by_summary,get_start_date_by_summary,save_jira_project_type,timed_flow
+from modules.jira_v3 import get_client
 from modules.excel_operations import apply_named_style_and_fill_to_range
-import tempfile
-from pptx import Presentation
+from modules.powerpoint_operations import read_template
 from openpyxl import load_workbook
 from openpyxl.styles import NamedStyle,PatternFill
 from datetime import datetime
@@ -44,7 +43,8 @@ else:
 
 
 
-    jira = JIRA(JIRA_URL, basic_auth=(st.session_state['api_username'], st.session_state['api_password']))
+    # pooled v3 client: no server-info round trip on page load
+    client = get_client(JIRA_URL, st.session_state['api_username'], st.session_state['api_password'])
 
 
     # Get Project Keys from Jira
@@ -65,10 +65,15 @@ else:
     # Get all Issues of Type "Project" in a given Jira Board
 
     if st.session_state['jira_project_key']:
-        jira_projects = get_jira_issue_type_project_key_with_displayname(JIRA_URL, st.session_state['api_username'], st.session_state['api_password'])
+        jira_projects = get_jira_issue_type_project_key_with_displayname(client, st.session_state['jira_project_key'])
         # Select Project Parent (most likely an Issue Type Account)
-        project = st.selectbox("Select a Project from the given Jira Board", jira_projects, index=0)
-        save_jira_issue_type_project(project)
+        project = st.selectbox(
+            "Select a Project from the given Jira Board",
+            jira_projects,
+            index=0,
+            format_func=lambda p: f"{p['key']} - {p['summary']}",
+        )
+        save_jira_issue_type_project(project["key"] if project else '')
         
         project_type = st.selectbox("Select the Type of your Project", ["POC", "PILOT"], index=0)
         save_jira_project_type(project_type)
@@ -81,7 +86,7 @@ else:
         # Path to excel template
         template_path_excel = f'templates/ThinkCell/{excel_template_name}'
         # Load the workbook and create a copy
-        template_workbook = load_workbook(template_path_excel)
+        template_workbook = load_workbook(io.BytesIO(read_template(template_path_excel)))
         sheet = template_workbook.active  # This selects the first sheet
         
         # Update the Cells with the dates from the Jira Project 
@@ -154,36 +159,27 @@ else:
         apply_named_style_and_fill_to_range(sheet, "C34:C36", date_style, yellow_fill)
         apply_named_style_and_fill_to_range(sheet, "B44:B52", date_style, yellow_fill)
         
-        # Save the presentation to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".xlsx") as tmpfile:
-            template_workbook.save(tmpfile.name)
-            return tmpfile.name
+        # Save the workbook in memory (no temporary file left on the server)
+        buffer = io.BytesIO()
+        template_workbook.save(buffer)
+        return buffer.getvalue()
 
-    # Create a copy of temp powerpoint file
+    # Copy of the powerpoint template (the slide is filled by think-cell from the excel file)
     def copy_powerpoint(slide_template_name):
-        
-        # Path to template and output PowerPoint files (Weekly Report)
-        original_pptx_path = f'templates/ThinkCell/{slide_template_name}'
-        # Load PowerPoint template
-        presentation = Presentation(original_pptx_path)
-
-
-        # Save the presentation to a temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pptx") as tmpfile:
-            presentation.save(tmpfile.name)
-            return tmpfile.name
+        # cached template bytes, re-read only when the file changes
+        return read_template(f'templates/ThinkCell/{slide_template_name}')
 
     # Download the powerpoint and excel files zipped
     def download_files_as_zip(slide_template_name,excel_template_name):
         # Create the PowerPoint and Excel files
-        presentation_path = copy_powerpoint(slide_template_name)
-        excel_path = copy_excel(excel_template_name)
+        presentation_data = copy_powerpoint(slide_template_name)
+        excel_data = copy_excel(excel_template_name)
 
         # Create a ZIP file in memory
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, "w") as zip_file:
-            zip_file.write(presentation_path, arcname="timeline_ppt_copy.pptx")
-            zip_file.write(excel_path, arcname="timeline_xlsx_copy.xlsx")
+            zip_file.writestr("timeline_ppt_copy.pptx", presentation_data)
+            zip_file.writestr("timeline_xlsx_copy.xlsx", excel_data)
 
         # Return to the beginning of the stream
         zip_buffer.seek(0)
@@ -198,9 +194,7 @@ else:
 
 
     if st.button("Get Updated Timeline Slide"):
-        if st.session_state['api_username'] and st.session_state['api_password']:
-            jira = JIRA(JIRA_URL, basic_auth=(st.session_state['api_username'], st.session_state['api_password']))
-        else:
+        if not (st.session_state['api_username'] and st.session_state['api_password']):
             st.warning("Please provide Jira credentials.")
 
         if not st.session_state['jira_project_key']:
@@ -210,8 +204,8 @@ else:
         
         else:
             try:
-                with st.spinner('In progress... dont worry, this can take up to 2 mins.'):
-                    st.session_state['issue_data'] = get_all_jira_issues_of_project(jira, st.session_state['jira_issue_type_project'])
+                with st.spinner('In progress...'), timed_flow(client, "Timeline issues fetched"):
+                    st.session_state['issue_data'] = get_all_jira_issues_of_project(client, st.session_state['jira_issue_type_project'])
                     if st.session_state['jira_project_type'] == 'PILOT':
                         # Generate Files for Pilot
                         st.session_state['zip_buffer']=download_files_as_zip(TIMELINE_POWER_POINT_SLIDE, EXCEL_TIMELINE_ELEMENTS)
@@ -7,9 +7,12 @@ import pandas as pd
 import streamlit as st
 
 from modules.config import JIRA_URL, ADMINS  # noqa: F401
-from modules.jira_v3 import JiraV3
+from modules.jira_v3 import JiraV3, get_client
+from modules.http_governor import map_in_order
+from modules.jira_mirror import mirrored_worklogs
+from modules.jira_v3_async import async_available, async_twin
 from modules.jira_operations import (
-    get_children_issues_for_report,
+    get_issue_tree,
     get_project_keys,
     get_jira_issue_type_project_key_with_displayname,
     display_issue_summaries,
@@ -39,7 +42,7 @@ for key in ("api_username", "api_password", "jira_project_key"):
     st.session_state.setdefault(key, "")
 
 if st.session_state["api_password"]:
-    client = JiraV3(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
+    client = get_client(JIRA_URL, st.session_state["api_username"], st.session_state["api_password"])
     st.session_state[JIRA_STATE_KEY] = client
 else:
     client = None
@@ -103,32 +106,24 @@ def fetch_worklogs(_client: JiraV3, issue_keys: List[str]) -> pd.DataFrame:
     Fetch worklogs for all given issues using REST v3:
       GET /rest/api/3/issue/{issueKey}/worklog?startAt=0&maxResults=100
     Also resolves user email (if visible) via GET /rest/api/3/user?accountId=...
+    Mirrored boards (JIRA_MIRROR_BOARDS) read their worklogs from the local mirror instead.
+    With aiohttp installed, worklogs are harvested on the async client's event loop.
     """
-    import requests
-
     IGNORE_ACCOUNT_IDS = {
         "557058:f58131cb-b67d-43c7-b30d-6b58d40bd077",
     }
 
     user_cache: Dict[str, Dict] = {}
 
-    def _user_info(acc_id: str) -> Dict:
-        if acc_id in user_cache:
-            return user_cache[acc_id]
+    def _fetch_user(acc_id: str) -> Dict:
         try:
-            url = f"{_client.base_url}/rest/api/3/user"
-            resp = requests.get(
-                url,
-                headers=_client._auth_header,
-                params={"accountId": acc_id},
-                timeout=_client.timeout,
-            )
-            if resp.status_code == 200:
-                user_cache[acc_id] = resp.json() or {}
-            else:
-                user_cache[acc_id] = {}
+            return _client.get_user(acc_id)
         except Exception:
-            user_cache[acc_id] = {}
+            return {}
+
+    def _user_info(acc_id: str) -> Dict:
+        if acc_id not in user_cache:
+            user_cache[acc_id] = _fetch_user(acc_id)
         return user_cache[acc_id]
 
     rows: List[Dict] = []
@@ -176,28 +171,40 @@ def fetch_worklogs(_client: JiraV3, issue_keys: List[str]) -> pd.DataFrame:
                 }
             )
 
-    # loop issues & paginate worklogs
-    for key in issue_keys:
-        start = 0
-        while True:
-            url = f"{_client.base_url}/rest/api/3/issue/{key}/worklog"
-            params = {"startAt": start, "maxResults": 100}
-            try:
-                r = requests.get(url, headers=_client._auth_header, params=params, timeout=_client.timeout)
-                r.raise_for_status()
-                data = r.json() or {}
-            except Exception as e:
-                st.warning(f"Work-logs for {key} failed: {e}")
-                break
-
-            wls = data.get("worklogs", []) or []
-            if not wls:
-                break
-
-            _append(wls, key)
-            start += len(wls)
-            if len(wls) < 100:
-                break
+    # fallback without aiohttp: issues fan out over the shared I/O executor (a worker pages its issue's worklogs inline)
+    def _issue_worklogs(key: str):
+        try:
+            return key, _client.get_worklogs_all(key), None
+        except Exception as e:
+            return key, [], e
+
+    mirrored = mirrored_worklogs(issue_keys)
+    if mirrored is not None:
+        per_issue = [(key, mirrored.get(key, []), None) for key in issue_keys]
+    elif async_available():
+        # all issues (and their extra worklog pages) fan out on the shared event loop
+        harvested = async_twin(_client).worklogs_for(issue_keys)
+        per_issue = [
+            (key, [], wls) if isinstance(wls, BaseException) else (key, wls, None)
+            for key, wls in harvested.items()
+        ]
+    else:
+        per_issue = map_in_order(_issue_worklogs, issue_keys)
+
+    # resolve hidden e-mails up front (one lookup per author, in parallel)
+    hidden_authors = {
+        (wl.get("author") or {}).get("accountId")
+        for _, wls, _ in per_issue
+        for wl in wls
+        if not (wl.get("author") or {}).get("emailAddress")
+    }
+    hidden_authors = sorted(hidden_authors - IGNORE_ACCOUNT_IDS - {None})
+    user_cache.update(zip(hidden_authors, map_in_order(_fetch_user, hidden_authors)))
+
+    for key, wls, err in per_issue:
+        if err is not None:
+            st.warning(f"Work-logs for {key} failed: {err}")
+        _append(wls, key)
 
     return pd.DataFrame(rows)
 
@@ -258,7 +265,7 @@ def app(_client: JiraV3) -> None:
         st.stop()
 
     with st.spinner("Fetching child issues…"):
-        issue_keys = get_children_issues_for_report(client, parent_key)
+        issue_keys = get_issue_tree(client, parent_key).keys()
     if not issue_keys:
         st.warning("No children under that parent.")
         st.stop()